@@ -319,4 +319,5 @@ class SourceAdmin(admin.ModelAdmin):
 @admin.register(Description)
 class DescriptionAdmin(admin.ModelAdmin):
     list_display = ['event', 'created_by', 'created_at']
+    list_select_related = ['event', 'created_by']
     search_fields = ['event__title', 'description']
@@ -1,8 +1,9 @@
 from datetime import date
-from typing import List, Optional
-import json
+from functools import partial
+from typing import List
 
 from django.conf import settings
+from django.db import transaction
 from django.db.models import F, Value
 from ninja import NinjaAPI, Schema
 from ninja.errors import HttpError
@@ -11,6 +12,7 @@ from semanticnews.prompting import append_default_language_instruction
 from pgvector.django import CosineDistance
 
 from .models import Event, Source, Category
+from .tasks import refresh_event_embedding
 
 
 CONFIDENCE_THRESHOLD = 0.85
@@ -276,19 +278,14 @@ def create_event(request, payload: EventCreateRequest):
     )
 
     if payload.sources:
-        for url in payload.sources:
-            source_obj, _ = Source.objects.get_or_create(url=url)
-            event.sources.add(source_obj)
+        event.sources.add(*Source.get_or_create_many(payload.sources).values())
 
     if payload.categories:
-        for name in payload.categories:
-            category, _ = Category.objects.get_or_create(name=name)
-            event.categories.add(category)
-
-    # Recompute embedding now that categories and sources are set
-    event.embedding = event.get_embedding()
-    if event.embedding is not None:
-        event.save(update_fields=["embedding"])
+        event.categories.add(*Category.get_or_create_many(payload.categories).values())
+
+    # Embed in the background now that categories are set; the request does
+    # not wait on the embeddings API.
+    transaction.on_commit(partial(refresh_event_embedding.delay, event.id))
 
     return EventCreateResponse(
         uuid=str(event.uuid),
@@ -1,6 +1,6 @@
 import uuid
 from datetime import date
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 from django.conf import settings
 from django.db import models
@@ -120,20 +120,37 @@ class EventManager(models.Manager):
         if not filtered_suggestions:
             return created_events
 
-        # Reuse one OpenAI client for all suggestions
-        with OpenAI() as client:
-            for suggestion in filtered_suggestions:
-                with transaction.atomic():
-                    embed_text = f"{suggestion.title} - {suggestion.date}\n{', '.join(suggestion.categories or [])}"
-                    embedding = client.embeddings.create(
-                        input=embed_text,
+        # An exact title/date match needs no embedding; the rest are embedded
+        # together in a single request.
+        exact_matches = [
+            self.filter(date=suggestion.date, title=suggestion.title).first()
+            for suggestion in filtered_suggestions
+        ]
+        embed_texts = [
+            f"{suggestion.title} - {suggestion.date}\n{', '.join(suggestion.categories or [])}"
+            for suggestion, match in zip(filtered_suggestions, exact_matches)
+            if match is None
+        ]
+        embeddings = []
+        if embed_texts:
+            with OpenAI() as client:
+                embeddings = [
+                    item.embedding
+                    for item in client.embeddings.create(
+                        input=embed_texts,
                         model="text-embedding-3-small",
-                    ).data[0].embedding
-
+                    ).data
+                ]
+        embeddings = iter(embeddings)
+
+        for suggestion, event in zip(filtered_suggestions, exact_matches):
+            with transaction.atomic():
+                created = False
+                if event is None:
                     # Semantic de-dup on SAME DATE using L2 distance
                     event, created = self.get_or_create_semantic(
                         date=suggestion.date,
-                        embedding=embedding,
+                        embedding=next(embeddings),
                         defaults={
                             "title": suggestion.title,
                             "confidence": None,
@@ -144,37 +161,37 @@ class EventManager(models.Manager):
                         distance_threshold=distance_threshold,
                     )
 
-                    updated_fields: list[str] = []
+                updated_fields: list[str] = []
 
-                    # If matched existing and it lacks locality, attach it (don’t override if set)
-                    if not created and locality_code and not event.locality:
-                        event.locality = locality_code
-                        updated_fields.append("locality")
+                # If matched existing and it lacks locality, attach it (don’t override if set)
+                if not created and locality_code and not event.locality:
+                    event.locality = locality_code
+                    updated_fields.append("locality")
 
-                    if not created and event.significance != suggestion.significance:
-                        event.significance = suggestion.significance
-                        updated_fields.append("significance")
+                if not created and event.significance != suggestion.significance:
+                    event.significance = suggestion.significance
+                    updated_fields.append("significance")
 
-                    if updated_fields:
-                        event.save(update_fields=updated_fields)
+                if updated_fields:
+                    event.save(update_fields=updated_fields)
 
-                    # Attach categories
-                    for name in suggestion.categories or []:
-                        cat, _ = Category.objects.get_or_create(name=name)
-                        event.categories.add(cat)
+                # Attach categories
+                for name in suggestion.categories or []:
+                    cat, _ = Category.objects.get_or_create(name=name)
+                    event.categories.add(cat)
 
-                    # Attach sources
-                    for url in suggestion.sources or []:
-                        src, _ = Source.objects.get_or_create(url=url)
-                        event.sources.add(src)
+                # Attach sources
+                for url in suggestion.sources or []:
+                    src, _ = Source.objects.get_or_create(url=url)
+                    event.sources.add(src)
 
-                    # Recompute embedding after M2M changes to keep it fresh
-                    new_emb = event.get_embedding()
-                    if new_emb is not None:
-                        event.embedding = new_emb
-                        event.save(update_fields=["embedding"])
+                # Recompute embedding after M2M changes to keep it fresh
+                new_emb = event.get_embedding()
+                if new_emb is not None:
+                    event.embedding = new_emb
+                    event.save(update_fields=["embedding"])
 
-                    created_events.append(event)
+                created_events.append(event)
 
         return created_events
 
@@ -295,6 +312,30 @@ class Description(models.Model):
     def __str__(self):
         return self.description
 
+
+def _get_or_create_many(model, field, values, build=None):
+    """Return ``{value: instance}`` for ``values``, creating missing rows in bulk.
+
+    ``field`` is not unique, so when duplicates already exist the oldest row
+    wins. ``build`` creates the unsaved instance for a missing value, for
+    models whose ``save()`` fills in derived fields that ``bulk_create`` skips.
+    """
+
+    values = list(dict.fromkeys(values))
+    if not values:
+        return {}
+
+    found = {}
+    for obj in model.objects.filter(**{f"{field}__in": values}).order_by("-pk"):
+        found[getattr(obj, field)] = obj
+
+    build = build or (lambda value: model(**{field: value}))
+    missing = [build(value) for value in values if value not in found]
+    for obj in model.objects.bulk_create(missing):
+        found[getattr(obj, field)] = obj
+    return found
+
+
 class Category(models.Model):
     name = models.CharField(max_length=100)
 
@@ -304,6 +345,11 @@ class Category(models.Model):
     class Meta:
         verbose_name_plural = 'categories'
 
+    @classmethod
+    def get_or_create_many(cls, names):
+        """Return ``{name: Category}`` for ``names`` using one SELECT and one INSERT."""
+        return _get_or_create_many(cls, "name", names)
+
 
 class Source(models.Model):
     url = models.URLField(max_length=200)
@@ -318,8 +364,16 @@ class Source(models.Model):
         super().save(*args, **kwargs)
 
     def get_domain(self):
-        parsed_url = urlparse(self.url)
-        domain = parsed_url.netloc
-        if domain.startswith('www.'):
-            domain = domain[4:]
-        return domain
+        # ``hostname`` is already lower-cased and stripped of port/credentials.
+        domain = urlsplit(self.url).hostname or ''
+        return domain.removeprefix('www.')
+
+    @classmethod
+    def get_or_create_many(cls, urls):
+        """Return ``{url: Source}`` for ``urls`` using one SELECT and one INSERT."""
+        def build(url):
+            source = cls(url=url)
+            source.domain = source.get_domain()
+            return source
+
+        return _get_or_create_many(cls, "url", urls, build=build)
@@ -0,0 +1,22 @@
+from celery import shared_task
+
+from .models import Event
+
+
+@shared_task(name="agenda.refresh_event_embedding")
+def refresh_event_embedding(event_id: int) -> dict:
+    """Recompute an event's embedding from its title, date and categories."""
+
+    event = Event.objects.filter(pk=event_id).first()
+    if event is None:
+        return {"success": False, "message": "Event not found"}
+
+    # ``get_embedding`` only calls the API when no embedding is set.
+    event.embedding = None
+    embedding = event.get_embedding()
+    if embedding is None:
+        return {"success": False, "message": "No embedding returned"}
+
+    # ``update`` skips ``save`` so the slug/embedding hooks are not re-run.
+    Event.objects.filter(pk=event_id).update(embedding=embedding)
+    return {"success": True}
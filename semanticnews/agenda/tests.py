@@ -7,8 +7,9 @@ from django.urls import reverse
 from django.utils import timezone
 
 from semanticnews.prompting import get_default_language_instruction
+from semanticnews.testing import EmbeddingMockMixin
 from .api import EventValidationResponse, AgendaEventList, AgendaEventResponse
-from .models import Event
+from .models import Event, Source
 
 
 class ValidateEventTests(SimpleTestCase):
@@ -62,6 +63,15 @@ class ValidateEventTests(SimpleTestCase):
         self.assertIn(get_default_language_instruction(), kwargs["input"])
 
 
+class SourceDomainTests(SimpleTestCase):
+    def test_domain_uses_hostname(self):
+        source = Source(url="https://user@WWW.Example.com:8443/path?q=www.other.com")
+        self.assertEqual(source.get_domain(), "example.com")
+
+    def test_domain_is_empty_without_host(self):
+        self.assertEqual(Source(url="not a url").get_domain(), "")
+
+
 class SuggestEventsTests(SimpleTestCase):
     @patch("semanticnews.agenda.api.OpenAI")
     def test_suggest_events_returns_events(self, mock_openai):
@@ -322,9 +332,12 @@ class GetExistingTests(TestCase):
 
 
 class CreateEventTests(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         User = get_user_model()
-        self.user = User.objects.create_user(username="tester", password="pass")
+        cls.user = User.objects.create_user(username="tester", password="pass")
+
+    def setUp(self):
         self.client.force_login(self.user)
 
     @patch("semanticnews.agenda.models.Event.get_embedding", return_value=[0.0] * 1536)
@@ -372,6 +385,37 @@ class CreateEventTests(TestCase):
         event = Event.objects.first()
         self.assertEqual(event.status, "draft")
 
+    @patch("semanticnews.agenda.api.refresh_event_embedding.delay")
+    @patch("semanticnews.agenda.models.Event.get_embedding", return_value=None)
+    def test_create_event_queues_embedding(self, mock_get_embedding, mock_delay):
+        payload = {"title": "Queued", "date": "2024-01-04", "categories": ["Politics"]}
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/api/agenda/create", payload, content_type="application/json"
+            )
+        self.assertEqual(response.status_code, 200)
+
+        from .models import Event
+
+        event = Event.objects.get()
+        mock_delay.assert_called_once_with(event.id)
+        mock_get_embedding.assert_called_once()
+
+
+class RefreshEventEmbeddingTaskTests(TestCase):
+    @patch("semanticnews.agenda.models.Event.get_embedding", return_value=[0.5] * 1536)
+    def test_task_stores_embedding(self, mock_get_embedding):
+        from .models import Event
+        from .tasks import refresh_event_embedding
+
+        event = Event.objects.create(title="Stored", date="2024-01-05")
+
+        result = refresh_event_embedding(event.id)
+
+        event.refresh_from_db()
+        self.assertTrue(result["success"])
+        self.assertEqual(list(event.embedding), [0.5] * 1536)
+
 
 class PublishEventTests(TestCase):
     def setUp(self):
@@ -564,10 +608,68 @@ class EventManagerTests(TestCase):
         self.assertEqual(event.significance, 5)
         self.assertFalse(Event.objects.filter(title="Low impact").exists())
 
+    @patch("semanticnews.agenda.models.OpenAI")
+    @patch("semanticnews.agenda.api.suggest_events")
+    def test_find_major_events_embeds_new_suggestions_in_one_request(
+        self, mock_suggest, mock_openai
+    ):
+        from datetime import date
+
+        existing = Event.objects.create(
+            title="Known event", date=date(2024, 6, 2), embedding=[0.0] * 1536
+        )
+        mock_suggest.return_value = [
+            AgendaEventResponse(title="First", date=date(2024, 6, 2), significance=5),
+            AgendaEventResponse(title="Known event", date=date(2024, 6, 2), significance=5),
+            AgendaEventResponse(title="Second", date=date(2024, 6, 2), significance=5),
+        ]
+        mock_client = mock_openai.return_value.__enter__.return_value
+        mock_client.embeddings.create.return_value.data = [
+            type("obj", (), {"embedding": [1.0] + [0.0] * 1535})(),
+            type("obj", (), {"embedding": [0.0, 1.0] + [0.0] * 1534})(),
+        ]
+
+        created = Event.objects.find_major_events(date(2024, 6, 2), limit=3)
+
+        mock_client.embeddings.create.assert_called_once()
+        self.assertEqual(
+            mock_client.embeddings.create.call_args.kwargs["input"],
+            ["First - 2024-06-02\n", "Second - 2024-06-02\n"],
+        )
+        self.assertEqual(
+            [event.title for event in created], ["First", "Known event", "Second"]
+        )
+        self.assertEqual(created[1].id, existing.id)
+
+    @patch("semanticnews.agenda.models.OpenAI")
+    @patch("semanticnews.agenda.api.suggest_events")
+    def test_find_major_events_reuses_exact_match_without_embedding(
+        self, mock_suggest, mock_openai
+    ):
+        from datetime import date
+
+        existing = Event.objects.create(
+            title="Known event", date=date(2024, 6, 2), embedding=[0.0] * 1536
+        )
+        mock_suggest.return_value = [
+            AgendaEventResponse(
+                title="Known event",
+                date=date(2024, 6, 2),
+                categories=["Economy"],
+                significance=5,
+            )
+        ]
+
+        created = Event.objects.find_major_events(date(2024, 6, 2))
+
+        self.assertEqual([event.id for event in created], [existing.id])
+        mock_client = mock_openai.return_value.__enter__.return_value
+        mock_client.embeddings.create.assert_not_called()
+        self.assertEqual(Event.objects.count(), 1)
+
 
-class EventListRelatedTopicsTests(TestCase):
-    @patch("semanticnews.topics.models.Topic.get_embedding", return_value=[0.0] * 1536)
-    def test_related_topics_in_context(self, mock_topic_embedding):
+class EventListRelatedTopicsTests(EmbeddingMockMixin, TestCase):
+    def test_related_topics_in_context(self):
         from datetime import date
         from semanticnews.topics.models import Topic, RelatedEvent, Source
         from semanticnews.topics.models import TopicRecap
@@ -603,9 +705,8 @@ class EventListRelatedTopicsTests(TestCase):
         self.assertIn(topic, related_topics)
 
 
-class EventDetailRelatedTopicsTests(TestCase):
-    @patch("semanticnews.topics.models.Topic.get_embedding", return_value=[0.0] * 1536)
-    def test_related_topics_in_context(self, mock_topic_embedding):
+class EventDetailRelatedTopicsTests(EmbeddingMockMixin, TestCase):
+    def test_related_topics_in_context(self):
         from datetime import date
         from semanticnews.topics.models import Topic, RelatedEvent, Source
         from semanticnews.topics.models import TopicRecap
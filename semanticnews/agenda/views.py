@@ -121,7 +121,7 @@ def event_detail(request, year, month, day, slug):
         "domains": domains,
     }
     if request.user.is_authenticated:
-        context["user_topics"] = Topic.objects.filter(created_by=request.user)
+        context["user_topics"] = Topic.objects.filter(created_by=request.user).defer("embedding")
     return render(
         request,
         "agenda/event_detail.html",
@@ -266,5 +266,5 @@ def event_list(request, year, month=None, day=None):
         "related_topics": related_topics,
     }
     if request.user.is_authenticated:
-        context["user_topics"] = Topic.objects.filter(created_by=request.user)
+        context["user_topics"] = Topic.objects.filter(created_by=request.user).defer("embedding")
     return render(request, "agenda/event_list.html", context)
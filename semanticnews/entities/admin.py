@@ -13,10 +13,12 @@ class KeywordAdmin(admin.ModelAdmin):
 @admin.register(Description)
 class DescriptionAdmin(admin.ModelAdmin):
     list_display = ("entity", "created_by", "created_at")
+    list_select_related = ("entity", "created_by")
     search_fields = ("entity__name", "description")
 
 
 @admin.register(EntityAlias)
 class EntityAliasAdmin(admin.ModelAdmin):
     list_display = ("name", "entity")
+    list_select_related = ("entity",)
     search_fields = ("name", "entity__name")
@@ -1,68 +1,69 @@
 import logging
+import threading
+
 from django.conf import settings
 import httpx
-from openai import OpenAI as _OpenAI, AsyncOpenAI as _AsyncOpenAI
+from openai import DefaultHttpxClient, OpenAI as _OpenAI
 
 logger = logging.getLogger(__name__)
 
+_shared_http_client: httpx.Client | None = None
+_shared_http_client_lock = threading.Lock()
 
-def _get_http_client():
-    if not getattr(settings, "DEBUG", False):
-        return None
 
-    def log_request(request: httpx.Request):
-        try:
-            body = request.content.decode()
-        except Exception:
-            body = str(request.content)
-        logger.debug("OpenAI request %s %s: %s", request.method, request.url, body)
+def _get_shared_http_client() -> httpx.Client:
+    """Return the process-wide HTTP client shared by :class:`OpenAI` instances.
 
-    def log_response(response: httpx.Response):
-        body = response.read().decode()
-        logger.debug(
-            "OpenAI response %s %s: %s", response.status_code, response.url, body
-        )
+    Reusing one connection pool keeps TLS connections to the API alive between
+    ``with OpenAI() as client:`` blocks instead of handshaking on every call.
+    """
 
-    return httpx.Client(event_hooks={"request": [log_request], "response": [log_response]})
+    global _shared_http_client
+    with _shared_http_client_lock:
+        if _shared_http_client is None or _shared_http_client.is_closed:
+            _shared_http_client = DefaultHttpxClient()
+        return _shared_http_client
 
 
-def _get_async_http_client():
+def _get_http_client():
     if not getattr(settings, "DEBUG", False):
         return None
 
-    async def log_request(request: httpx.Request):
+    def log_request(request: httpx.Request):
         try:
             body = request.content.decode()
         except Exception:
             body = str(request.content)
         logger.debug("OpenAI request %s %s: %s", request.method, request.url, body)
 
-    async def log_response(response: httpx.Response):
-        body = (await response.aread()).decode()
+    def log_response(response: httpx.Response):
+        body = response.read().decode()
         logger.debug(
             "OpenAI response %s %s: %s", response.status_code, response.url, body
         )
 
-    return httpx.AsyncClient(event_hooks={"request": [log_request], "response": [log_response]})
+    return httpx.Client(event_hooks={"request": [log_request], "response": [log_response]})
 
 
 class OpenAI(_OpenAI):
-    """OpenAI client that logs requests and responses when DEBUG is True."""
+    """OpenAI client that logs requests and responses when DEBUG is True.
+
+    Outside of DEBUG, instances share one pooled HTTP client, which is left
+    open when an instance is closed.
+    """
 
     def __init__(self, *args, **kwargs):
+        self._uses_shared_http_client = False
         if "http_client" not in kwargs:
             client = _get_http_client()
-            if client is not None:
-                kwargs["http_client"] = client
+            if client is None:
+                client = _get_shared_http_client()
+                self._uses_shared_http_client = True
+            kwargs["http_client"] = client
         super().__init__(*args, **kwargs)
 
+    def close(self) -> None:
+        if self._uses_shared_http_client:
+            return
+        super().close()
 
-class AsyncOpenAI(_AsyncOpenAI):
-    """AsyncOpenAI client that logs requests and responses when DEBUG is True."""
-
-    def __init__(self, *args, **kwargs):
-        if "http_client" not in kwargs:
-            client = _get_async_http_client()
-            if client is not None:
-                kwargs["http_client"] = client
-        super().__init__(*args, **kwargs)
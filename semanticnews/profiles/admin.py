@@ -9,12 +9,14 @@ from .models import (
 @admin.register(Profile)
 class ProfileAdmin(admin.ModelAdmin):
     list_display = ('user',)
+    list_select_related = ('user',)
     search_fields = ('user__username', 'user__email')
 
 
 @admin.register(TopicBookmark)
 class TopicBookmarkAdmin(admin.ModelAdmin):
     list_display = ('user', 'topic')
+    list_select_related = ('user', 'topic')
     search_fields = ('user__username', 'topic__name')
     list_filter = ('user',)
 
@@ -22,5 +24,6 @@ class TopicBookmarkAdmin(admin.ModelAdmin):
 @admin.register(UserReference)
 class UserReferenceAdmin(admin.ModelAdmin):
     list_display = ('user', 'reference', 'added_at')
+    list_select_related = ('user', 'reference')
     search_fields = ('user__username', 'user__email', 'reference__url')
     list_filter = ('user',)
@@ -9,10 +9,11 @@ from semanticnews.agenda.models import Event
 from semanticnews.topics.models import Topic
 
 class UserListViewTests(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         User = get_user_model()
-        self.alice = User.objects.create_user("alice", "alice@example.com", "password")
-        self.bob = User.objects.create_user("bob", "bob@example.com", "password", is_active=False)
+        cls.alice = User.objects.create_user("alice", "alice@example.com", "password")
+        cls.bob = User.objects.create_user("bob", "bob@example.com", "password", is_active=False)
 
     def test_lists_active_users(self):
         Topic.objects.create(title="Alice Topic", created_by=self.alice, status="published")
@@ -2,7 +2,7 @@ from django.contrib.auth.decorators import login_required
 from datetime import datetime, timezone as dt_timezone
 
 from django.conf import settings
-from django.db.models import Q, Count, Max, Value, DateTimeField, Prefetch
+from django.db.models import Q, Count, Max, Value, DateTimeField
 from django.db.models.functions import Coalesce, Greatest
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.models import User
@@ -1,9 +1,12 @@
 """Shared prompt utilities for Semantic News AI interactions."""
 
 from collections.abc import Iterable
+from functools import lru_cache
 
 from django.conf import settings
-from django.utils.translation import get_language_info
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.translation import get_language, get_language_info
 
 
 _DEFAULT_LANGUAGE_CODE = "en"
@@ -17,7 +20,7 @@ def get_default_language_instruction() -> str:
 
     if getattr(settings, "configured", False):
         language_code = getattr(settings, "LANGUAGE_CODE", _DEFAULT_LANGUAGE_CODE)
-        resolved_name = _resolve_language_name(language_code, getattr(settings, "LANGUAGES", ()))
+        resolved_name = _configured_language_name(language_code, get_language())
         if resolved_name:
             language_name = resolved_name
 
@@ -37,6 +40,23 @@ def append_default_language_instruction(prompt: str) -> str:
     return prompt + "\n" + instruction
 
 
+@lru_cache(maxsize=None)
+def _configured_language_name(language_code: str, active_language: str | None) -> str | None:
+    """Memoized :func:`_resolve_language_name` for the configured ``LANGUAGES``.
+
+    ``active_language`` is part of the key because configured names may be
+    lazy translations that render differently per active language.
+    """
+
+    return _resolve_language_name(language_code, getattr(settings, "LANGUAGES", ()))
+
+
+@receiver(setting_changed)
+def _clear_language_name_cache(*, setting, **kwargs):
+    if setting in {"LANGUAGE_CODE", "LANGUAGES"}:
+        _configured_language_name.cache_clear()
+
+
 def _resolve_language_name(language_code: str, languages: Iterable[tuple[str, str]]) -> str | None:
     """Return a human-readable language name for ``language_code``."""
 
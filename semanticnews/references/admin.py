@@ -18,6 +18,7 @@ class ReferenceAdmin(admin.ModelAdmin):
 @admin.register(TopicReference)
 class TopicReferenceAdmin(admin.ModelAdmin):
     list_display = ("reference", "topic", "added_by", "added_at", "is_deleted")
+    list_select_related = ("reference", "topic", "added_by")
     list_filter = ("is_deleted",)
     search_fields = (
         "reference__meta_title",
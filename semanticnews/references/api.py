@@ -2,29 +2,42 @@ from datetime import datetime
 from typing import List, Optional
 
 from django.db import transaction
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, Substr
 from django.utils import timezone
 from django.utils.timezone import make_naive
+from django.views.decorators.http import condition
 from ninja import Router, Schema
+from ninja.decorators import decorate_view
 from ninja.errors import HttpError
 from celery import chord
 from celery.result import AsyncResult
 
-from semanticnews.agenda.models import Event, Source
 from semanticnews.profiles.models import UserReference
 from semanticnews.topics.models import (
     Topic,
     TopicSection,
     TopicSectionSuggestion,
     TopicSectionSuggestionStatus,
+    TopicTitle,
 )
+from semanticnews.topics.permissions import require_owned_topic
 from semanticnews.topics.tasks import TopicSectionSuggestionsPayload, _validate_suggestions
 from semanticnews.topics.widgets import get_widget
 
 from .models import Reference, TopicReference
-from .tasks import generate_reference_insights, generate_reference_suggestions
+from .tasks import (
+    enrich_reference_metadata,
+    generate_reference_insights,
+    generate_reference_suggestions,
+)
 
 router = Router()
 
+# Excerpt length returned by list endpoints unless the full text is requested.
+LIST_EXCERPT_LENGTH = 280
+
 
 class ReferenceCreateRequest(Schema):
     url: str
@@ -60,6 +73,7 @@ class LibraryReferenceDetail(Schema):
     domain: Optional[str]
     meta_title: Optional[str] = None
     meta_published_at: Optional[datetime] = None
+    fetch_status: Optional[str] = None
     added_at: datetime
     topics: List[LibraryReferenceTopicDetail]
 
@@ -100,22 +114,6 @@ class ReferenceSuggestionApplyResponse(Schema):
     message: Optional[str] = None
 
 
-def _require_owned_topic(request, topic_uuid: str) -> Topic:
-    user = getattr(request, "user", None)
-    if not user or not user.is_authenticated:
-        raise HttpError(401, "Unauthorized")
-
-    try:
-        topic = Topic.objects.get(uuid=topic_uuid)
-    except Topic.DoesNotExist:
-        raise HttpError(404, "Topic not found")
-
-    if topic.created_by_id != user.id:
-        raise HttpError(403, "Forbidden")
-
-    return topic
-
-
 def _get_latest_section_suggestion(topic: Topic) -> Optional[TopicSectionSuggestion]:
     return (
         TopicSectionSuggestion.objects.filter(topic=topic)
@@ -240,6 +238,65 @@ def _serialize_link(link: TopicReference) -> ReferenceDetail:
     )
 
 
+_LINK_ROW_FIELDS = (
+    "id",
+    "added_at",
+    "reference__uuid",
+    "reference__url",
+    "reference__domain",
+    "reference__meta_title",
+    "reference__meta_description",
+    "reference__meta_published_at",
+    "reference__lead_image_url",
+    "reference__content_excerpt",
+    "reference__last_fetched_at",
+    "reference__status_code",
+    "reference__fetch_status",
+    "reference__fetch_error",
+)
+
+
+def _serialize_link_row(row: tuple) -> dict:
+    """Build the ``ReferenceDetail`` payload from a ``_LINK_ROW_FIELDS`` row.
+
+    List endpoints read flat rows instead of instantiating link and
+    reference models just to copy their attributes out again.
+    """
+
+    (
+        link_id,
+        added_at,
+        ref_uuid,
+        url,
+        domain,
+        meta_title,
+        meta_description,
+        published_at,
+        lead_image_url,
+        content_excerpt,
+        last_fetched_at,
+        status_code,
+        fetch_status,
+        fetch_error,
+    ) = row
+    return {
+        "id": link_id,
+        "uuid": str(ref_uuid),
+        "url": url,
+        "domain": domain,
+        "meta_title": meta_title or None,
+        "meta_description": meta_description or None,
+        "meta_published_at": make_naive(published_at) if published_at else None,
+        "lead_image_url": lead_image_url or None,
+        "content_excerpt": content_excerpt or None,
+        "last_fetched_at": make_naive(last_fetched_at) if last_fetched_at else None,
+        "status_code": status_code,
+        "fetch_status": fetch_status,
+        "fetch_error": fetch_error or None,
+        "added_at": make_naive(added_at) if added_at else timezone.now(),
+    }
+
+
 def _serialize_user_reference(
     link: UserReference,
     topics: List[LibraryReferenceTopicDetail],
@@ -259,47 +316,26 @@ def _serialize_user_reference(
         domain=ref.domain,
         meta_title=ref.meta_title or None,
         meta_published_at=published_at,
+        fetch_status=ref.fetch_status,
         added_at=added_at or timezone.now(),
         topics=topics,
     )
 
 
-def _get_or_create_reference(url: str, user=None) -> tuple[Reference, bool]:
+def _get_or_create_reference(url: str) -> tuple[Reference, bool]:
     normalized = Reference.normalize_url(url)
-    defaults = {"url": url, "normalized_url": normalized, "domain": ""}
+    # Store a fetchable URL (with scheme) up front rather than fixing the row
+    # with a second UPDATE right after inserting it.
+    stored_url = url if url and "://" in url else normalized
+    defaults = {"url": stored_url, "normalized_url": normalized, "domain": ""}
     reference, created = Reference.objects.get_or_create(
         normalized_url=normalized,
         defaults=defaults,
     )
 
-    # Ensure the stored URL is fetchable (normalized with scheme).
-    if created and (not reference.url or "://" not in reference.url):
-        reference.url = normalized
-        reference.save(update_fields=["url"])
-    elif not created and reference.url and "://" not in reference.url:
+    if not created and reference.url and "://" not in reference.url:
         reference.url = normalized
-        reference.save(update_fields=["url"])
-
-    if _should_refresh(reference):
-        reference.refresh_metadata()
-
-    if created:
-        event_date = (
-            reference.meta_published_at.date()
-            if reference.meta_published_at
-            else timezone.now().date()
-        )
-        title = reference.meta_title or reference.url
-        event, _ = Event.objects.get_or_create(
-            title=title,
-            date=event_date,
-            defaults={
-                "status": "draft",
-                "created_by": user,
-            },
-        )
-        source, _ = Source.objects.get_or_create(url=reference.url)
-        event.sources.add(source)
+        reference.save(update_fields=["url", "updated_at"])
 
     return reference, created
 
@@ -308,16 +344,85 @@ def _should_refresh(reference: Reference) -> bool:
     return reference.should_refresh()
 
 
-@router.get("/{topic_uuid}/references", response=List[ReferenceDetail])
-def list_topic_references(request, topic_uuid: str):
-    topic = _require_owned_topic(request, topic_uuid)
+def _queue_metadata_enrichment(reference: Reference, user=None, *, created: bool) -> bool:
+    """Queue a background metadata fetch for ``reference`` when it is stale.
 
-    links = (
-        TopicReference.objects.filter(topic=topic, is_deleted=False)
-        .select_related("reference")
-        .order_by("-added_at")
+    Returns ``True`` while metadata is still being fetched so callers can
+    answer with ``202 Accepted``; clients poll ``fetch_status`` for completion.
+    Resubmitting a URL whose first fetch is still pending reuses that fetch,
+    unless it has been pending longer than ``PENDING_FETCH_TIMEOUT``.
+    """
+
+    if not _should_refresh(reference):
+        return False
+
+    if not created and reference.has_fetch_in_flight():
+        return True
+
+    user_id = getattr(user, "id", None) if user else None
+    enrich_reference_metadata.delay(reference.id, user_id, record_event=created)
+    return True
+
+
+def _topic_references_etag(request, topic_uuid: str) -> Optional[str]:
+    """Fingerprint a topic's reference list without building it.
+
+    Every change to a link or its reference bumps ``updated_at``, so the
+    newest timestamps and the active link count stand in for the payload.
+    Returns ``None`` unless the requester owns the topic, leaving the view
+    to answer with the error.
+    """
+
+    user = getattr(request, "user", None)
+    if not user or not user.is_authenticated:
+        return None
+    try:
+        if not Topic.objects.filter(uuid=topic_uuid, created_by=user).exists():
+            return None
+    except ValidationError:
+        return None
+
+    active = Q(is_deleted=False)
+    stats = TopicReference.objects.filter(topic__uuid=topic_uuid).aggregate(
+        count=Count("id", filter=active),
+        links_updated=Max("updated_at"),
+        references_updated=Max("reference__updated_at", filter=active),
     )
-    return [_serialize_link(link) for link in links]
+    parts = [
+        stats["count"],
+        *(
+            stamp.timestamp() if stamp else 0
+            for stamp in (stats["links_updated"], stats["references_updated"])
+        ),
+        request.GET.get("full", ""),
+    ]
+    return "-".join(str(part) for part in parts)
+
+
+@router.get("/{topic_uuid}/references", response=List[ReferenceDetail])
+@decorate_view(condition(etag_func=_topic_references_etag))
+def list_topic_references(request, topic_uuid: str, full: bool = False):
+    """List a topic's references.
+
+    Excerpts are truncated in the database to ``LIST_EXCERPT_LENGTH``
+    characters unless ``?full=1`` is passed.
+    """
+
+    topic = require_owned_topic(request, topic_uuid)
+
+    queryset = TopicReference.objects.filter(topic=topic, is_deleted=False)
+    fields = _LINK_ROW_FIELDS
+    if not full:
+        queryset = queryset.annotate(
+            short_excerpt=Substr("reference__content_excerpt", 1, LIST_EXCERPT_LENGTH)
+        )
+        fields = tuple(
+            "short_excerpt" if field == "reference__content_excerpt" else field
+            for field in fields
+        )
+
+    rows = queryset.order_by("-added_at").values_list(*fields)
+    return [_serialize_link_row(row) for row in rows]
 
 
 @router.get("/references/library", response=LibraryReferencesResponse)
@@ -326,31 +431,61 @@ def list_library_references(request):
     if not user or not user.is_authenticated:
         raise HttpError(401, "Unauthorized")
 
+    # Resolve each topic's current title (latest draft, else latest published,
+    # as ``Topic.title`` does) in the same query instead of two per link.
+    titles = TopicTitle.objects.filter(topic=OuterRef("topic_id"))
     topic_links = (
         TopicReference.objects.filter(topic__created_by=user, is_deleted=False)
-        .select_related("reference", "topic", "topic__created_by")
+        .annotate(
+            topic_title=Coalesce(
+                Subquery(
+                    titles.filter(published_at__isnull=True)
+                    .order_by("-created_at", "-id")
+                    .values("title")[:1]
+                ),
+                Subquery(
+                    titles.filter(published_at__isnull=False)
+                    .order_by("-published_at", "-id")
+                    .values("title")[:1]
+                ),
+            )
+        )
         .order_by("-added_at")
+        .values_list(
+            "reference_id",
+            "topic__uuid",
+            "topic__status",
+            "topic__created_by__username",
+            "topic_title",
+        )
     )
 
     topics_by_reference: dict[int, list[LibraryReferenceTopicDetail]] = {}
-    for link in topic_links:
-        topic = link.topic
-        topic_owner = topic.created_by
+    for reference_id, topic_uuid, status, owner_username, title in topic_links:
         topic_url = ""
-        if topic_owner:
-            topic_url = f"/{topic_owner.username}/{topic.uuid}/"
-        topics_by_reference.setdefault(link.reference_id, []).append(
+        if owner_username:
+            topic_url = f"/{owner_username}/{topic_uuid}/"
+        topics_by_reference.setdefault(reference_id, []).append(
             LibraryReferenceTopicDetail(
-                topic_uuid=str(topic.uuid),
-                topic_title=topic.title,
+                topic_uuid=str(topic_uuid),
+                topic_title=title,
                 topic_url=topic_url,
-                status=topic.status,
+                status=status,
             )
         )
 
     user_links = (
         UserReference.objects.filter(user=user)
         .select_related("reference")
+        .only(
+            "added_at",
+            "reference__uuid",
+            "reference__url",
+            "reference__domain",
+            "reference__meta_title",
+            "reference__meta_published_at",
+            "reference__fetch_status",
+        )
         .order_by("-added_at")
     )
 
@@ -365,12 +500,15 @@ def list_library_references(request):
     )
 
 
-@router.post("/{topic_uuid}/references", response=ReferenceDetail)
+@router.post(
+    "/{topic_uuid}/references",
+    response={200: ReferenceDetail, 202: ReferenceDetail},
+)
 def add_topic_reference(request, topic_uuid: str, payload: ReferenceCreateRequest):
-    topic = _require_owned_topic(request, topic_uuid)
+    topic = require_owned_topic(request, topic_uuid)
     user = getattr(request, "user", None)
 
-    reference, created = _get_or_create_reference(payload.url, user)
+    reference, created = _get_or_create_reference(payload.url)
 
     link, link_created = TopicReference.objects.get_or_create(
         topic=topic,
@@ -385,27 +523,33 @@ def add_topic_reference(request, topic_uuid: str, payload: ReferenceCreateReques
         link.is_deleted = False
         link.added_by = link.added_by or user
         link.added_at = link.added_at or timezone.now()
-        link.save(update_fields=["is_deleted", "added_by", "added_at"])
+        link.save(update_fields=["is_deleted", "added_by", "added_at", "updated_at"])
     elif not link_created and link.added_by is None and user:
         link.added_by = user
-        link.save(update_fields=["added_by"])
+        link.save(update_fields=["added_by", "updated_at"])
 
     if user:
         UserReference.objects.get_or_create(user=user, reference=reference)
 
+    if _queue_metadata_enrichment(reference, user, created=created):
+        return 202, _serialize_link(link)
+
     if reference.content_excerpt and not link.summary and not link.key_facts:
         generate_reference_insights.delay(link.id)
 
-    return _serialize_link(link)
+    return 200, _serialize_link(link)
 
 
-@router.post("/references/library", response=LibraryReferenceDetail)
+@router.post(
+    "/references/library",
+    response={200: LibraryReferenceDetail, 202: LibraryReferenceDetail},
+)
 def add_library_reference(request, payload: ReferenceCreateRequest):
     user = getattr(request, "user", None)
     if not user or not user.is_authenticated:
         raise HttpError(401, "Unauthorized")
 
-    reference, _ = _get_or_create_reference(payload.url, user)
+    reference, created = _get_or_create_reference(payload.url)
     link, _ = UserReference.objects.get_or_create(user=user, reference=reference)
 
     topic_links = (
@@ -432,23 +576,21 @@ def add_library_reference(request, payload: ReferenceCreateRequest):
             )
         )
 
-    return _serialize_user_reference(link, topics)
+    status = 202 if _queue_metadata_enrichment(reference, user, created=created) else 200
+    return status, _serialize_user_reference(link, topics)
 
 
 @router.delete("/{topic_uuid}/references/{link_id}", response={204: None})
 def delete_topic_reference(request, topic_uuid: str, link_id: int):
-    topic = _require_owned_topic(request, topic_uuid)
-
-    try:
-        link = TopicReference.objects.get(id=link_id, topic=topic)
-    except TopicReference.DoesNotExist:
-        raise HttpError(404, "Reference not found")
-
-    if link.is_deleted:
-        return 204, None
-
-    link.is_deleted = True
-    link.save(update_fields=["is_deleted"])
+    topic = require_owned_topic(request, topic_uuid)
+
+    links = TopicReference.objects.filter(id=link_id, topic=topic)
+    if not links.filter(is_deleted=False).update(
+        is_deleted=True, updated_at=timezone.now()
+    ):
+        # Nothing to flip: either already deleted (idempotent) or unknown.
+        if not links.exists():
+            raise HttpError(404, "Reference not found")
     return 204, None
 
 
@@ -457,7 +599,7 @@ def delete_topic_reference(request, topic_uuid: str, link_id: int):
     response=ReferenceSuggestionTaskResponse,
 )
 def request_reference_suggestions(request, topic_uuid: str):
-    topic = _require_owned_topic(request, topic_uuid)
+    topic = require_owned_topic(request, topic_uuid)
 
     pending_links = _get_links_missing_insights(topic)
     if pending_links:
@@ -473,7 +615,7 @@ def request_reference_suggestions(request, topic_uuid: str):
     response=ReferenceSuggestionStatusResponse,
 )
 def reference_suggestions_status(request, topic_uuid: str, task_id: str):
-    topic = _require_owned_topic(request, topic_uuid)
+    topic = require_owned_topic(request, topic_uuid)
 
     result = AsyncResult(task_id)
     state = result.state
@@ -526,7 +668,7 @@ def reference_suggestions_status(request, topic_uuid: str, task_id: str):
     response=ReferenceSuggestionLatestResponse,
 )
 def reference_suggestions_latest(request, topic_uuid: str):
-    topic = _require_owned_topic(request, topic_uuid)
+    topic = require_owned_topic(request, topic_uuid)
     latest_suggestion = _get_latest_section_suggestion(topic)
     if latest_suggestion is None:
         return ReferenceSuggestionLatestResponse(has_suggestions=False)
@@ -550,7 +692,7 @@ def reference_suggestions_latest(request, topic_uuid: str):
     response=ReferenceSuggestionApplyResponse,
 )
 def apply_reference_suggestions(request, topic_uuid: str, payload: ReferenceSuggestionApplyRequest):
-    topic = _require_owned_topic(request, topic_uuid)
+    topic = require_owned_topic(request, topic_uuid)
     suggestion: Optional[TopicSectionSuggestion] = None
     if payload.suggestion_id:
         suggestion = TopicSectionSuggestion.objects.filter(
@@ -564,9 +706,9 @@ def apply_reference_suggestions(request, topic_uuid: str, payload: ReferenceSugg
     suggestions = payload.payload or TopicSectionSuggestionsPayload(**suggestion.payload)
     _apply_section_suggestions(topic, suggestions)
 
-    suggestion.status = TopicSectionSuggestionStatus.APPLIED
-    suggestion.applied_at = timezone.now()
-    suggestion.save(update_fields=["status", "applied_at"])
+    TopicSectionSuggestion.objects.filter(pk=suggestion.pk).update(
+        status=TopicSectionSuggestionStatus.APPLIED, applied_at=timezone.now()
+    )
 
     return ReferenceSuggestionApplyResponse(
         success=True,
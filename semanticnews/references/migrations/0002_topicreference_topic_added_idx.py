@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('references', '0001_initial'),
+        ('topics', '0003_topic_created_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='topicreference',
+            index=models.Index(fields=['topic', '-added_at'], name='topicref_topic_added_idx'),
+        ),
+    ]
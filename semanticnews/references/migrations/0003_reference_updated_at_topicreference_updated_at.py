@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('references', '0002_topicreference_topic_added_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reference',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='topicreference',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -1,4 +1,8 @@
 import hashlib
+import html as html_lib
+import posixpath
+import re
+import threading
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -41,6 +45,84 @@ class ReferenceMetadata:
     raw_payload: Optional[dict] = None
 
 
+# How long a never-fetched reference may stay pending before its metadata
+# fetch is queued again (e.g. because the first task was lost).
+PENDING_FETCH_TIMEOUT = timedelta(minutes=5)
+
+_FETCH_HEADERS = {
+    "User-Agent": "SemanticNews/1.0 (+https://example.com)",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+_http_local = threading.local()
+
+
+def _get_http_session() -> requests.Session:
+    """Return this thread's pooled session so fetches reuse keep-alive connections."""
+
+    session = getattr(_http_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(_FETCH_HEADERS)
+        _http_local.session = session
+    return session
+
+
+# Links to these files never carry HTML metadata, so they are not fetched.
+_NON_HTML_EXTENSIONS = frozenset({
+    ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".odt", ".ods",
+    ".csv", ".zip", ".gz", ".rar", ".7z", ".jpg", ".jpeg", ".png", ".gif",
+    ".webp", ".svg", ".mp3", ".mp4", ".mov", ".avi", ".webm",
+})
+
+
+def _has_non_html_extension(url: str) -> bool:
+    path = urlparse(url).path
+    return posixpath.splitext(path)[1].lower() in _NON_HTML_EXTENSIONS
+
+
+def _is_html_content_type(content_type: str) -> bool:
+    content_type = content_type.split(";", 1)[0].strip().lower()
+    if not content_type:
+        return True
+    return content_type.startswith("text/") or "html" in content_type or "xml" in content_type
+
+
+_META_TAG_RE = re.compile(r"<meta\b[^>]*>", re.IGNORECASE)
+_TAG_ATTR_RE = re.compile(
+    r"""([a-zA-Z_:][-a-zA-Z0-9_:.]*)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+))"""
+)
+_TITLE_RE = re.compile(r"<title\b[^>]*>(.*?)</title\s*>", re.IGNORECASE | re.DOTALL)
+_BODY_OPEN_RE = re.compile(r"<body\b", re.IGNORECASE)
+
+
+def _scan_head_metadata(html: str) -> tuple[dict[str, str], dict[str, str], Optional[str]]:
+    """Collect ``<meta>`` contents and the ``<title>`` text in a single pass.
+
+    Returns ``(by_property, by_name, title)`` where the dictionaries map the
+    first ``property``/``name`` occurrence to its raw ``content`` value.
+    Entities in meta contents are left for the caller to decode, so only the
+    values that are actually used pay for ``html.unescape``.
+    """
+
+    by_property: dict[str, str] = {}
+    by_name: dict[str, str] = {}
+    for tag in _META_TAG_RE.finditer(html):
+        attrs = {
+            key.lower(): double or single or bare
+            for key, double, single, bare in _TAG_ATTR_RE.findall(tag.group(0))
+        }
+        content = attrs.get("content", "")
+        if "property" in attrs:
+            by_property.setdefault(attrs["property"], content)
+        if "name" in attrs:
+            by_name.setdefault(attrs["name"], content)
+
+    title_match = _TITLE_RE.search(html)
+    title = html_lib.unescape(title_match.group(1)).strip() if title_match else None
+    return by_property, by_name, title or None
+
+
 def _extract_body_text(soup: BeautifulSoup) -> str:
     for tag in soup(["script", "style", "noscript"]):
         tag.decompose()
@@ -66,6 +148,7 @@ class Reference(models.Model):
     domain = models.CharField(max_length=200, db_index=True, blank=True)
 
     first_seen_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     last_fetched_at = models.DateTimeField(null=True, blank=True)
     fetch_status = models.CharField(
         max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING
@@ -97,6 +180,13 @@ class Reference(models.Model):
 
     @staticmethod
     def normalize_url(url: str) -> str:
+        normalized, _ = Reference._split_normalized_url(url)
+        return normalized
+
+    @staticmethod
+    def _split_normalized_url(url: str) -> tuple[str, str]:
+        """Return the normalized URL together with its (``www.``-less) host."""
+
         if not url:
             raise ValueError("URL is required")
 
@@ -117,7 +207,7 @@ class Reference(models.Model):
         normalized = urlunparse(
             (scheme, netloc, path.rstrip("/") or "/", "", parsed.query, "")
         )
-        return normalized
+        return normalized, netloc
 
     @staticmethod
     def extract_metadata(html: str, status_code: Optional[int] = None) -> ReferenceMetadata:
@@ -125,15 +215,17 @@ class Reference(models.Model):
             payload = {"status_code": status_code} if status_code is not None else {}
             return ReferenceMetadata(status_code=status_code, raw_payload=payload)
 
-        soup = BeautifulSoup(html, "html.parser")
+        by_property, by_name, title_text = _scan_head_metadata(html)
 
         def _first_meta(*names: str) -> Optional[str]:
             for name in names:
-                tag = soup.find("meta", attrs={"property": name}) or soup.find(
-                    "meta", attrs={"name": name}
-                )
-                if tag and tag.get("content"):
-                    return tag.get("content").strip()
+                content = by_property.get(name)
+                if content is None:
+                    content = by_name.get(name)
+                if content:
+                    content = html_lib.unescape(content).strip()
+                    if content:
+                        return content
             return None
 
         og_title = _first_meta("og:title")
@@ -141,11 +233,13 @@ class Reference(models.Model):
         og_image = _first_meta("og:image") or _first_meta("twitter:image")
         og_published_at = _first_meta("article:published_time", "og:published_time")
 
-        title_tag = soup.find("title")
-        title_text = title_tag.text.strip() if title_tag and title_tag.text else None
-
         meta_description = _first_meta("description")
 
+        # The head has already been scanned, so only the body is handed to the
+        # (much slower) tree builder.
+        body_match = _BODY_OPEN_RE.search(html)
+        body_html = html[body_match.start():] if body_match else html
+        soup = BeautifulSoup(body_html, "html.parser")
         content_excerpt = _extract_body_text(soup) if soup else ""
 
         payload = {"status_code": status_code}
@@ -173,6 +267,17 @@ class Reference(models.Model):
             self.content_version = self.content_version or 1
         self.content_hash = new_hash
 
+    def has_fetch_in_flight(self) -> bool:
+        """Whether the queued first fetch can still be expected to finish.
+
+        References are only pending until their first fetch completes, so
+        ``first_seen_at`` is when that fetch was queued.
+        """
+        return (
+            self.fetch_status == self.STATUS_PENDING
+            and self.first_seen_at > timezone.now() - PENDING_FETCH_TIMEOUT
+        )
+
     def should_refresh(self) -> bool:
         if self.fetch_status == self.STATUS_PENDING:
             return True
@@ -180,21 +285,35 @@ class Reference(models.Model):
             return True
         return self.last_fetched_at < timezone.now() - timedelta(hours=6)
 
-    def refresh_metadata(self, *, timeout: int = 8, commit: bool = True) -> ReferenceMetadata:
-        headers = {
-            "User-Agent": "SemanticNews/1.0 (+https://example.com)",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        }
+    def _fetch_metadata(self, *, timeout: int) -> ReferenceMetadata:
+        # Stream so the body is only downloaded once the response is known to be HTML.
+        response = _get_http_session().get(
+            self.url,
+            timeout=timeout,
+            allow_redirects=True,
+            stream=True,
+        )
+        try:
+            content_type = response.headers.get("Content-Type") or ""
+            if not _is_html_content_type(content_type):
+                return ReferenceMetadata(
+                    status_code=response.status_code,
+                    raw_payload={
+                        "status_code": response.status_code,
+                        "content_type": content_type,
+                    },
+                )
+            return self.extract_metadata(response.text, response.status_code)
+        finally:
+            response.close()
 
+    def refresh_metadata(self, *, timeout: int = 8, commit: bool = True) -> ReferenceMetadata:
         metadata = ReferenceMetadata()
         try:
-            response = requests.get(
-                self.url,
-                timeout=timeout,
-                headers=headers,
-                allow_redirects=True,
-            )
-            metadata = self.extract_metadata(response.text, response.status_code)
+            if _has_non_html_extension(self.url):
+                metadata = ReferenceMetadata(raw_payload={"skipped": "non_html_extension"})
+            else:
+                metadata = self._fetch_metadata(timeout=timeout)
             self.fetch_status = self.STATUS_SUCCEEDED
             self.fetch_error = ""
         except Exception as exc:
@@ -223,7 +342,9 @@ class Reference(models.Model):
 
     def save(self, *args, **kwargs):
         if self.url:
-            self.normalized_url = self.normalize_url(self.url)
+            self.normalized_url, netloc = self._split_normalized_url(self.url)
+            if not self.domain:
+                self.domain = netloc
         if not self.domain and self.normalized_url:
             parsed = urlparse(self.normalized_url)
             domain = parsed.netloc
@@ -233,6 +354,33 @@ class Reference(models.Model):
         super().save(*args, **kwargs)
 
 
+class TopicReferenceQuerySet(models.QuerySet):
+    """Query helpers for topic reference links."""
+
+    def for_listing(self):
+        """Return active links with only the reference columns lists render.
+
+        Excerpts, raw payloads and descriptions can be large and are left
+        unloaded.
+        """
+
+        return (
+            self.filter(is_deleted=False)
+            .select_related("reference")
+            .only(
+                "topic",
+                "reference",
+                "added_at",
+                "reference__uuid",
+                "reference__url",
+                "reference__domain",
+                "reference__meta_title",
+                "reference__meta_published_at",
+            )
+            .order_by("-added_at")
+        )
+
+
 class TopicReference(models.Model):
     reference = models.ForeignKey(
         Reference, related_name="topic_links", on_delete=models.CASCADE
@@ -244,15 +392,21 @@ class TopicReference(models.Model):
         settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL
     )
     added_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     is_suggested = models.BooleanField(default=False)
     is_deleted = models.BooleanField(default=False)
     summary = models.TextField(blank=True)
     key_facts = models.JSONField(default=list, blank=True)
     content_version_snapshot = models.PositiveIntegerField(default=1)
 
+    objects = TopicReferenceQuerySet.as_manager()
+
     class Meta:
         unique_together = ("reference", "topic")
         ordering = ("-added_at",)
+        indexes = [
+            models.Index(fields=["topic", "-added_at"], name="topicref_topic_added_idx"),
+        ]
 
     def __str__(self):
         return f"{self.reference} → {self.topic}"
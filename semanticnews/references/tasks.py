@@ -1,17 +1,27 @@
 import json
+from typing import Optional
 
 from celery import shared_task
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
 
 from semanticnews.openai import OpenAI
 from semanticnews.prompting import append_default_language_instruction
 
+from semanticnews.agenda.models import Event, Source
 from semanticnews.topics.models import Topic
 from semanticnews.topics.tasks import generate_section_suggestions
 
 from .models import Reference, TopicReference
 
 
+# Seconds to wait before retrying an event-recording fetch that found
+# another worker already fetching the same reference.
+REFERENCE_FETCH_RETRY_DELAY = 10
+
+
 def _extract_response_text(response) -> str:
     text = getattr(response, "output_text", None)
     if text:
@@ -53,16 +63,13 @@ def _parse_reference_insights(response_text: str) -> tuple[str, list[str]]:
 
 @shared_task(name="references.generate_reference_insights")
 def generate_reference_insights(link_id: int) -> dict:
-    link = (
-        TopicReference.objects.select_related("reference")
-        .filter(id=link_id, is_deleted=False)
-        .first()
-    )
-    if link is None:
+    # Only the excerpt is read; the insights are written back with an UPDATE.
+    links = TopicReference.objects.filter(id=link_id, is_deleted=False)
+    row = links.values_list("reference__content_excerpt").first()
+    if row is None:
         return {"success": False, "message": "Reference link not found."}
 
-    reference = link.reference
-    content = reference.content_excerpt or ""
+    content = row[0] or ""
     if not content.strip():
         return {"success": False, "message": "Reference content is empty."}
 
@@ -90,12 +97,105 @@ def generate_reference_insights(link_id: int) -> dict:
     except Exception as exc:
         return {"success": False, "message": f"Unable to generate insights: {exc}"}
 
-    link.summary = summary
-    link.key_facts = key_facts
-    link.save(update_fields=["summary", "key_facts"])
+    links.update(summary=summary, key_facts=key_facts, updated_at=timezone.now())
     return {"success": True, "message": "Reference insights saved."}
 
 
+def _refresh_reference_metadata(reference: Reference) -> bool:
+    """Refresh ``reference`` unless another worker is already fetching it.
+
+    The reference row stays locked while the fetch runs, so concurrent
+    workers never fetch the same URL twice. Returns ``False`` without
+    touching ``reference`` when another worker holds the lock.
+    """
+
+    with transaction.atomic():
+        locked = (
+            Reference.objects.select_for_update(skip_locked=True)
+            .filter(pk=reference.pk)
+            .values_list("pk", flat=True)
+            .first()
+        )
+        if locked is None:
+            return False
+        # The previous lock holder may have just stored fresh metadata.
+        reference.refresh_from_db()
+        if reference.should_refresh():
+            reference.refresh_metadata()
+    return True
+
+
+def _record_reference_event(reference: Reference, user_id: Optional[int] = None) -> Event:
+    event_date = (
+        reference.meta_published_at.date()
+        if reference.meta_published_at
+        else timezone.now().date()
+    )
+    title = reference.meta_title or reference.url
+    user = get_user_model().objects.filter(id=user_id).first() if user_id else None
+    event, _ = Event.objects.get_or_create(
+        title=title,
+        date=event_date,
+        defaults={
+            "status": "draft",
+            "created_by": user,
+        },
+    )
+    source, _ = Source.objects.get_or_create(url=reference.url)
+    event.sources.add(source)
+    return event
+
+
+@shared_task(bind=True, name="references.enrich_reference_metadata", max_retries=3)
+def enrich_reference_metadata(
+    self,
+    reference_id: int,
+    user_id: Optional[int] = None,
+    record_event: bool = False,
+) -> dict:
+    """Fetch page metadata for a reference outside of the request cycle.
+
+    When ``record_event`` is set (the reference was just created), a draft
+    agenda event is recorded from the fetched metadata. Insights are then
+    queued for any active topic links that do not have them yet.
+
+    If another worker is already fetching the reference, that worker queues
+    the insights; the event is recorded by retrying this task once the
+    fetch has finished.
+    """
+
+    reference = Reference.objects.filter(id=reference_id).first()
+    if reference is None:
+        return {"success": False, "message": "Reference not found."}
+
+    if reference.should_refresh() and not _refresh_reference_metadata(reference):
+        if record_event:
+            raise self.retry(countdown=REFERENCE_FETCH_RETRY_DELAY)
+        return {
+            "success": False,
+            "fetch_status": reference.fetch_status,
+            "message": "Metadata is already being fetched.",
+        }
+
+    if record_event:
+        _record_reference_event(reference, user_id)
+
+    if reference.content_excerpt:
+        pending_link_ids = TopicReference.objects.filter(
+            reference=reference,
+            is_deleted=False,
+            summary="",
+            key_facts=[],
+        ).values_list("id", flat=True)
+        for link_id in pending_link_ids:
+            generate_reference_insights.delay(link_id)
+
+    return {
+        "success": reference.fetch_status == Reference.STATUS_SUCCEEDED,
+        "fetch_status": reference.fetch_status,
+    }
+
+
 def _refresh_stale_references_for_topic(topic: Topic) -> list[Reference]:
     references = (
         Reference.objects.filter(topic_links__topic=topic, topic_links__is_deleted=False)
@@ -104,8 +204,7 @@ def _refresh_stale_references_for_topic(topic: Topic) -> list[Reference]:
     )
     refreshed: list[Reference] = []
     for reference in references:
-        if reference.should_refresh():
-            reference.refresh_metadata()
+        if reference.should_refresh() and _refresh_reference_metadata(reference):
             refreshed.append(reference)
     return refreshed
 
@@ -113,7 +212,7 @@ def _refresh_stale_references_for_topic(topic: Topic) -> list[Reference]:
 @shared_task(name="references.refresh_stale_references")
 def refresh_stale_references(topic_uuid: str) -> dict:
     try:
-        topic = Topic.objects.get(uuid=topic_uuid)
+        topic = Topic.objects.defer("embedding").get(uuid=topic_uuid)
     except Topic.DoesNotExist:
         return {"success": False, "message": "Topic not found.", "refreshed_count": 0}
 
@@ -141,5 +240,5 @@ def generate_reference_suggestions(*args, simulate_failure: bool = False):
     if result.get("success"):
         TopicReference.objects.filter(
             topic__uuid=topic_uuid, is_deleted=False
-        ).update(is_suggested=True)
+        ).update(is_suggested=True, updated_at=timezone.now())
     return result
@@ -1,3 +1,344 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from celery.exceptions import Retry
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.utils import timezone
+
+from semanticnews.agenda.models import Event
+from semanticnews.profiles.models import UserReference
+from semanticnews.topics.models import Topic, TopicTitle
+
+from .models import Reference, TopicReference
+from .tasks import enrich_reference_metadata, generate_reference_insights
+
+
+class AddTopicReferenceAPITests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.user = User.objects.create_user("user", "user@example.com", "password")
+        cls.topic = Topic.objects.create(created_by=cls.user)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    @patch("semanticnews.references.models.requests.Session.get")
+    @patch("semanticnews.references.api.enrich_reference_metadata.delay")
+    def test_add_reference_queues_enrichment_without_fetching(self, mock_delay, mock_get):
+        response = self.client.post(
+            f"/api/topics/{self.topic.uuid}/references",
+            {"url": "https://example.com/article"},
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 202)
+        data = response.json()
+        self.assertEqual(data["fetch_status"], Reference.STATUS_PENDING)
+        self.assertIsNone(data["meta_title"])
+        mock_get.assert_not_called()
+
+        reference = Reference.objects.get()
+        mock_delay.assert_called_once_with(reference.id, self.user.id, record_event=True)
+        self.assertTrue(
+            TopicReference.objects.filter(topic=self.topic, reference=reference).exists()
+        )
+
+    @patch("semanticnews.references.api.enrich_reference_metadata.delay")
+    def test_duplicate_submission_reuses_pending_fetch(self, mock_delay):
+        for url in ("https://example.com/article", "https://www.example.com/article/"):
+            response = self.client.post(
+                f"/api/topics/{self.topic.uuid}/references",
+                {"url": url},
+                content_type="application/json",
+            )
+            self.assertEqual(response.status_code, 202)
+
+        self.assertEqual(Reference.objects.count(), 1)
+        self.assertEqual(TopicReference.objects.filter(topic=self.topic).count(), 1)
+        mock_delay.assert_called_once()
+
+    @patch("semanticnews.references.api.enrich_reference_metadata.delay")
+    def test_resubmission_requeues_fetch_pending_too_long(self, mock_delay):
+        reference = Reference.objects.create(url="https://example.com/article")
+        Reference.objects.filter(id=reference.id).update(
+            first_seen_at=timezone.now() - timedelta(hours=1)
+        )
+
+        response = self.client.post(
+            f"/api/topics/{self.topic.uuid}/references",
+            {"url": "https://example.com/article"},
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 202)
+        mock_delay.assert_called_once_with(reference.id, self.user.id, record_event=False)
+
+    @patch("semanticnews.topics.api.enrich_reference_metadata.delay")
+    def test_topic_creation_requeues_fetch_pending_too_long(self, mock_delay):
+        stale = Reference.objects.create(url="https://example.com/stale")
+        Reference.objects.filter(id=stale.id).update(
+            first_seen_at=timezone.now() - timedelta(hours=1)
+        )
+        Reference.objects.create(url="https://example.com/recent")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/api/topics/create-with-references",
+                {"urls": ["https://example.com/stale", "https://example.com/recent"]},
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.status_code, 200)
+        mock_delay.assert_called_once_with(stale.id, self.user.id)
+
+    def test_list_references_returns_active_links(self):
+        reference = Reference.objects.create(
+            url="https://www.example.com/article",
+            meta_title="Example title",
+        )
+        deleted = Reference.objects.create(url="https://example.org/removed")
+        TopicReference.objects.create(topic=self.topic, reference=reference)
+        TopicReference.objects.create(topic=self.topic, reference=deleted, is_deleted=True)
+
+        response = self.client.get(f"/api/topics/{self.topic.uuid}/references")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["uuid"], str(reference.uuid))
+        self.assertEqual(data[0]["domain"], "example.com")
+        self.assertEqual(data[0]["meta_title"], "Example title")
+        self.assertIsNone(data[0]["meta_description"])
+        self.assertEqual(data[0]["fetch_status"], Reference.STATUS_PENDING)
+
+    def test_list_references_truncates_excerpts_unless_full(self):
+        reference = Reference.objects.create(
+            url="https://example.com/long",
+            content_excerpt="x" * 1000,
+        )
+        TopicReference.objects.create(topic=self.topic, reference=reference)
+        url = f"/api/topics/{self.topic.uuid}/references"
+
+        short = self.client.get(url).json()[0]["content_excerpt"]
+        full = self.client.get(url, {"full": "1"}).json()[0]["content_excerpt"]
+
+        self.assertEqual(len(short), 280)
+        self.assertEqual(len(full), 1000)
+
+    def test_delete_reference_soft_deletes_the_topic_link(self):
+        reference = Reference.objects.create(url="https://example.com/article")
+        link = TopicReference.objects.create(topic=self.topic, reference=reference)
+        url = f"/api/topics/{self.topic.uuid}/references/{link.id}"
+
+        self.assertEqual(self.client.delete(url).status_code, 204)
+        link.refresh_from_db()
+        self.assertTrue(link.is_deleted)
+
+        self.assertEqual(self.client.delete(url).status_code, 204)
+        missing = f"/api/topics/{self.topic.uuid}/references/{link.id + 1}"
+        self.assertEqual(self.client.delete(missing).status_code, 404)
+
+    def test_list_answers_matching_etag_with_not_modified(self):
+        reference = Reference.objects.create(url="https://example.com/article")
+        TopicReference.objects.create(topic=self.topic, reference=reference)
+        url = f"/api/topics/{self.topic.uuid}/references"
+
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(first.has_header("ETag"))
+
+        with patch("semanticnews.references.api._serialize_link_row") as mock_serialize:
+            repeat = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(repeat.status_code, 304)
+        mock_serialize.assert_not_called()
+
+        reference.meta_title = "Changed"
+        reference.save()
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(changed.status_code, 200)
+
+        deleted = self.client.delete(f"{url}/{changed.json()[0]['id']}")
+        self.assertEqual(deleted.status_code, 204)
+        emptied = self.client.get(url, HTTP_IF_NONE_MATCH=changed["ETag"])
+        self.assertEqual(emptied.status_code, 200)
+        self.assertEqual(emptied.json(), [])
+
+    def test_list_etag_is_not_offered_to_other_users(self):
+        other = get_user_model().objects.create_user("other", "other@example.com", "password")
+        self.client.force_login(other)
+
+        response = self.client.get(f"/api/topics/{self.topic.uuid}/references")
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(response.has_header("ETag"))
+
+    @patch("semanticnews.references.api.enrich_reference_metadata.delay")
+    def test_add_reference_stores_url_with_scheme(self, mock_delay):
+        response = self.client.post(
+            f"/api/topics/{self.topic.uuid}/references",
+            {"url": "example.com/no-scheme"},
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 202)
+        reference = Reference.objects.get()
+        self.assertIn("://", reference.url)
+        self.assertEqual(reference.url, reference.normalized_url)
+
+    def test_library_lists_user_references_with_topics(self):
+        reference = Reference.objects.create(
+            url="https://example.com/article", meta_title="Example title"
+        )
+        UserReference.objects.create(user=self.user, reference=reference)
+        TopicReference.objects.create(topic=self.topic, reference=reference)
+
+        response = self.client.get("/api/topics/references/library")
+
+        self.assertEqual(response.status_code, 200)
+        entries = response.json()["user_references"]
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["meta_title"], "Example title")
+        self.assertEqual(entries[0]["fetch_status"], Reference.STATUS_PENDING)
+        self.assertEqual(entries[0]["topics"][0]["topic_uuid"], str(self.topic.uuid))
+
+    def test_library_reports_current_topic_titles_in_constant_queries(self):
+        other_topic = Topic.objects.create(created_by=self.user, title="Draft title")
+        TopicTitle.objects.create(
+            topic=self.topic, title="Published title", published_at=timezone.now()
+        )
+        for index in range(3):
+            reference = Reference.objects.create(url=f"https://example.com/{index}")
+            UserReference.objects.create(user=self.user, reference=reference)
+            TopicReference.objects.create(topic=self.topic, reference=reference)
+            TopicReference.objects.create(topic=other_topic, reference=reference)
+
+        with self.assertNumQueries(4):
+            response = self.client.get("/api/topics/references/library")
+
+        self.assertEqual(response.status_code, 200)
+        titles = {
+            topic["topic_title"]
+            for entry in response.json()["user_references"]
+            for topic in entry["topics"]
+        }
+        self.assertEqual(titles, {"Published title", "Draft title"})
+
+
+class EnrichReferenceMetadataTaskTests(TestCase):
+    @patch("semanticnews.references.tasks.generate_reference_insights.delay")
+    @patch("semanticnews.references.models.requests.Session.get")
+    def test_task_fills_metadata(self, mock_get, mock_insights):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {"Content-Type": "text/html; charset=utf-8"}
+        mock_get.return_value.text = (
+            "<html><head><title>Example title</title></head>"
+            "<body><p>Body text</p></body></html>"
+        )
+        reference = Reference.objects.create(url="https://example.com/article")
+
+        result = enrich_reference_metadata(reference.id)
+
+        reference.refresh_from_db()
+        self.assertTrue(result["success"])
+        self.assertEqual(reference.fetch_status, Reference.STATUS_SUCCEEDED)
+        self.assertEqual(reference.meta_title, "Example title")
+        mock_insights.assert_not_called()
+
+    @patch("semanticnews.references.models.requests.Session.get")
+    def test_task_skips_fetch_for_document_links(self, mock_get):
+        reference = Reference.objects.create(url="https://example.com/report.PDF")
+
+        enrich_reference_metadata(reference.id)
+
+        reference.refresh_from_db()
+        mock_get.assert_not_called()
+        self.assertEqual(reference.fetch_status, Reference.STATUS_SUCCEEDED)
+        self.assertEqual(reference.meta_title, "")
+
+    @patch("semanticnews.references.models.requests.Session.get")
+    def test_task_does_not_read_non_html_bodies(self, mock_get):
+        response = mock_get.return_value
+        response.status_code = 200
+        response.headers = {"Content-Type": "application/octet-stream"}
+        reference = Reference.objects.create(url="https://example.com/download")
+
+        enrich_reference_metadata(reference.id)
+
+        reference.refresh_from_db()
+        self.assertEqual(reference.status_code, 200)
+        self.assertEqual(reference.content_excerpt, "")
+        response.close.assert_called_once()
+
+
+    @patch("semanticnews.references.tasks.enrich_reference_metadata.retry")
+    @patch("semanticnews.references.tasks._refresh_reference_metadata", return_value=False)
+    def test_task_defers_event_while_another_worker_fetches(self, mock_refresh, mock_retry):
+        mock_retry.side_effect = Retry()
+        reference = Reference.objects.create(url="https://example.com/article")
+
+        with self.assertRaises(Retry):
+            enrich_reference_metadata(reference.id, record_event=True)
+
+        self.assertFalse(Event.objects.exists())
+
+    @patch("semanticnews.references.tasks._refresh_reference_metadata", return_value=False)
+    def test_task_leaves_locked_fetch_to_its_holder(self, mock_refresh):
+        reference = Reference.objects.create(url="https://example.com/article")
+
+        result = enrich_reference_metadata(reference.id)
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["fetch_status"], Reference.STATUS_PENDING)
+
+class GenerateReferenceInsightsTaskTests(TestCase):
+    @patch("semanticnews.references.tasks.OpenAI")
+    def test_task_stores_summary_and_key_facts(self, mock_openai):
+        user = get_user_model().objects.create_user("user", "user@example.com", "password")
+        topic = Topic.objects.create(created_by=user)
+        reference = Reference.objects.create(
+            url="https://example.com/article", content_excerpt="Body text"
+        )
+        link = TopicReference.objects.create(topic=topic, reference=reference)
+        client = mock_openai.return_value.__enter__.return_value
+        client.responses.create.return_value.output_text = (
+            '{"summary": " Short. ", "key_facts": ["One", " "]}'
+        )
+
+        result = generate_reference_insights(link.id)
+
+        link.refresh_from_db()
+        self.assertTrue(result["success"])
+        self.assertEqual(link.summary, "Short.")
+        self.assertEqual(link.key_facts, ["One"])
+
+        link.is_deleted = True
+        link.save(update_fields=["is_deleted"])
+        self.assertFalse(generate_reference_insights(link.id)["success"])
+
+
+class ReferenceMetadataExtractionTests(TestCase):
+    def test_extracts_meta_tags_in_any_attribute_order(self):
+        html = (
+            "<html><head><title>Fallback &amp; title</title>"
+            '<meta content="OG &quot;title&quot;" property="og:title">'
+            "<meta name='description' content='Plain description'>"
+            '<META PROPERTY="article:published_time" CONTENT="2024-01-02T03:04:05Z">'
+            "</head><body><p>Body</p></body></html>"
+        )
+
+        metadata = Reference.extract_metadata(html, 200)
+
+        self.assertEqual(metadata.title, 'OG "title"')
+        self.assertEqual(metadata.description, "Plain description")
+        self.assertEqual(metadata.published_at.isoformat(), "2024-01-02T03:04:05+00:00")
+        self.assertEqual(metadata.content_excerpt, "Body")
+
+    def test_falls_back_to_title_tag(self):
+        metadata = Reference.extract_metadata(
+            "<html><head><title> Fish &amp; Chips </title></head></html>", 200
+        )
 
-# Create your tests here.
+        self.assertEqual(metadata.title, "Fish & Chips")
+        self.assertIsNone(metadata.description)
@@ -102,6 +102,8 @@ DATABASES = {
         'PASSWORD': os.getenv('DATABASE_PASSWORD'),
         'HOST': os.getenv('DATABASE_HOST', 'localhost'),
         'PORT': os.getenv('DATABASE_PORT', '5432'),
+        'CONN_MAX_AGE': int(os.getenv('DATABASE_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -197,6 +199,17 @@ STATICFILES_DIRS = tuple(str(path) for path in _static_dirs if path.exists())
 # AI / LLM configuration
 DEFAULT_AI_MODEL = os.getenv("DEFAULT_AI_MODEL", "gpt-5-nano")
 
+# Extra options for the image_generation tool used by the image widget, e.g.
+# IMAGE_GENERATION_SIZE=1024x1024 to pay for fewer pixels than the default.
+IMAGE_GENERATION_TOOL_OPTIONS = {
+    key: value
+    for key, value in (
+        ("size", os.getenv("IMAGE_GENERATION_SIZE")),
+        ("quality", os.getenv("IMAGE_GENERATION_QUALITY")),
+    )
+    if value
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
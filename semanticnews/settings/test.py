@@ -0,0 +1,4 @@
+# Loaded on top of base.py with ENV_NAME=test.
+
+# Test fixtures create many users; a deliberately slow hasher only adds setup time there.
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
@@ -0,0 +1,23 @@
+"""Shared helpers for the project's test suites."""
+
+from unittest.mock import patch
+
+ZERO_EMBEDDING = [0.0] * 1536
+
+
+class EmbeddingMockMixin:
+    """Stub embedding lookups for a whole ``TestCase`` class.
+
+    The patchers start once in ``setUpClass`` (before ``setUpTestData`` runs)
+    instead of being re-entered around every test method.
+    """
+
+    embedding_mock_targets = ("semanticnews.topics.models.Topic.get_embedding",)
+
+    @classmethod
+    def setUpClass(cls):
+        for target in cls.embedding_mock_targets:
+            patcher = patch(target, return_value=ZERO_EMBEDDING)
+            patcher.start()
+            cls.addClassCleanup(patcher.stop)
+        super().setUpClass()
@@ -1,5 +1,9 @@
-from asgiref.sync import async_to_sync
+from functools import partial
+
 from django.contrib import admin
+from django.db import transaction
+from django.db.models.functions import Substr
+
 from .models import (
     Topic,
     TopicRecap,
@@ -11,6 +15,8 @@ from .models import (
     RelatedEntity,
     RelatedEvent,
 )
+from .recaps.services import write_draft_recap
+from .tasks import extract_related_entities, generate_recap
 
 
 @admin.register(Topic)
@@ -26,16 +32,17 @@ class TopicAdmin(admin.ModelAdmin):
     readonly_fields = ('uuid', 'created_at', 'last_published_at')
 
     def update_recap(self, request, queryset):
-        for topic in queryset:
-            async_to_sync(topic.update_recap)()
-            self.message_user(request, f"Updated recap for '{topic}'")
+        # Generation runs in the recap worker, like suggestions from the topic
+        # page, instead of blocking the admin request on the model.
+        for topic in queryset.defer("embedding"):
+            recap = write_draft_recap(topic, recap="", status="in_progress")
+            transaction.on_commit(partial(generate_recap.delay, recap.id))
+            self.message_user(request, f"Queued recap update for '{topic}'")
 
     def extract_entity_graph(self, request, queryset):
-        for topic in queryset:
-            # Run the asynchronous method in a synchronous context
-            async_to_sync(topic.extract_entity_graph)()
-            # Display the result to the admin user
-            self.message_user(request, f"Extracted entity graph for '{topic}'")
+        for topic in queryset.defer("embedding"):
+            transaction.on_commit(partial(extract_related_entities.delay, topic.id))
+            self.message_user(request, f"Queued entity graph extraction for '{topic}'")
 
 
 @admin.register(TopicSection)
@@ -51,6 +58,7 @@ class TopicSectionAdmin(admin.ModelAdmin):
         "is_deleted",
         "is_draft_deleted",
     )
+    list_select_related = ("topic",)
     list_filter = (
         "language_code",
         "is_deleted",
@@ -91,13 +99,25 @@ class _RecapPublishedFilter(admin.SimpleListFilter):
 @admin.register(TopicRecap)
 class TopicRecapAdmin(admin.ModelAdmin):
     list_display = ("topic", "created_at", "short_recap", "status", "is_published")
+    list_select_related = ("topic",)
     list_filter = ("status", _RecapPublishedFilter)
     search_fields = ("topic__titles__title", "recap")
     readonly_fields = ("created_at",)
 
+    def get_queryset(self, request):
+        # Only a short prefix of each recap is shown in the changelist, so the
+        # full text is left in the database until a recap is opened.
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(recap_preview=Substr("recap", 1, 51))
+            .defer("recap")
+        )
+
     @admin.display(description="recap")
     def short_recap(self, obj):
-        return obj.recap[:50] + ("..." if len(obj.recap) > 50 else "")
+        preview = obj.recap_preview or ""
+        return preview[:50] + ("..." if len(preview) > 50 else "")
 
     @admin.display(boolean=True, description="Published")
     def is_published(self, obj):
@@ -107,6 +127,7 @@ class TopicRecapAdmin(admin.ModelAdmin):
 @admin.register(TopicTitle)
 class TopicTitleAdmin(admin.ModelAdmin):
     list_display = ("topic", "title", "slug", "published_at", "created_at")
+    list_select_related = ("topic",)
     list_filter = ("published_at",)
     search_fields = ("title", "subtitle", "topic__titles__title")
     readonly_fields = ("created_at",)
@@ -115,6 +136,7 @@ class TopicTitleAdmin(admin.ModelAdmin):
 @admin.register(RelatedEvent)
 class RelatedEventAdmin(admin.ModelAdmin):
     list_display = ("topic", "event", "source", "is_deleted", "created_at")
+    list_select_related = ("topic", "event")
     list_filter = ("source", "is_deleted")
     search_fields = ("topic__titles__title", "event__title")
     readonly_fields = ("created_at",)
@@ -129,6 +151,7 @@ class RelatedTopicAdmin(admin.ModelAdmin):
         "is_deleted",
         "created_at",
     )
+    list_select_related = ("topic", "related_topic")
     list_filter = ("source", "is_deleted")
     search_fields = (
         "topic__titles__title",
@@ -147,6 +170,7 @@ class RelatedEntityAdmin(admin.ModelAdmin):
         "is_deleted",
         "created_at",
     )
+    list_select_related = ("topic", "entity")
     list_filter = ("source", "is_deleted")
     search_fields = (
         "topic__titles__title",
@@ -165,6 +189,7 @@ class TopicSectionContentAdmin(admin.ModelAdmin):
         "published_at",
         "created_at",
     )
+    list_select_related = ("section",)
     list_filter = ("stage", "published_at")
     search_fields = (
         "uuid",
@@ -188,6 +213,7 @@ class TopicSectionSuggestionAdmin(admin.ModelAdmin):
         "created_at",
         "applied_at",
     )
+    list_select_related = ("topic", "created_by")
     list_filter = ("status",)
     search_fields = ("topic__titles__title", "created_by__username")
     readonly_fields = ("created_at", "applied_at")
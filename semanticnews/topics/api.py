@@ -1,29 +1,32 @@
-from typing import Dict, List, Literal, Optional, Set
+from typing import List, Optional
 from datetime import date, datetime
+from functools import partial
+from uuid import UUID
 
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.utils.timezone import make_naive
 from django.urls import reverse
 from django.db import transaction
-from django.db.models import Case, F, Q, Value, When
+from django.db.models import Case, Count, F, Max, Q, Value, When
 from django.db.models.fields import FloatField
-from django.db.models.functions import Coalesce
-
-from slugify import slugify
+from django.db.models.functions import Coalesce, Lower
+from django.views.decorators.http import condition
 
 from ninja import NinjaAPI, Router, Schema
+from ninja.decorators import decorate_view
 from ninja.errors import HttpError
 
 from pgvector.django import CosineDistance
 
 from semanticnews.agenda.localities import get_locality_label, resolve_locality_code
 from semanticnews.agenda.models import Category, Event, Source as AgendaSource
-from semanticnews.entities.models import Entity
 from semanticnews.openai import OpenAI
 from semanticnews.prompting import append_default_language_instruction
 from semanticnews.profiles.models import UserReference
 from semanticnews.references.models import Reference, TopicReference
+from semanticnews.references.tasks import enrich_reference_metadata
 
 from .models import (
     Topic,
@@ -32,8 +35,15 @@ from .models import (
     RelatedEvent,
     Source,
 )
+from .entities import (
+    RelatedEntityInput,
+    normalize_related_entities,
+    save_related_entities,
+    suggest_related_entities,
+)
+from .permissions import require_owned_topic
 from .publishing import publish_topic
-from .recaps.api import router as recaps_router
+from .recaps.api import StatusLiteral, router as recaps_router
 from .widgets.api import router as widgets_router
 from semanticnews.references.api import router as references_router
 
@@ -43,8 +53,6 @@ api.add_router("/recap", recaps_router)
 api.add_router("/widgets", widgets_router)
 api.add_router("", references_router)
 
-StatusLiteral = Literal["in_progress", "finished", "error"]
-
 
 class GenerationStatus(Schema):
     status: Optional[StatusLiteral] = None
@@ -67,12 +75,6 @@ class GenerationStatusResponse(Schema):
     data: Optional[DataGenerationStatuses] = None
 
 
-class RelatedEntityInput(Schema):
-    name: str
-    role: Optional[str] = None
-    disambiguation: Optional[str] = None
-
-
 class TopicRelatedEntityCreateRequest(Schema):
     topic_uuid: str
     entities: Optional[List[RelatedEntityInput]] = None
@@ -98,16 +100,6 @@ class TopicRelatedEntityListResponse(Schema):
     items: List[TopicRelatedEntityItem]
 
 
-class _TopicRelatedEntitySuggestion(Schema):
-    name: str
-    role: Optional[str] = None
-    disambiguation: Optional[str] = None
-
-
-class _TopicRelatedEntitySuggestionResponse(Schema):
-    entities: List[_TopicRelatedEntitySuggestion]
-
-
 def _serialize_related_entity(relation: RelatedEntity) -> TopicRelatedEntityItem:
     entity = relation.entity
     created_at = relation.created_at
@@ -125,112 +117,6 @@ def _serialize_related_entity(relation: RelatedEntity) -> TopicRelatedEntityItem
     )
 
 
-def _normalize_inputs(items: List[RelatedEntityInput]) -> List[RelatedEntityInput]:
-    normalized: List[RelatedEntityInput] = []
-    for item in items:
-        name = (item.name or "").strip()
-        if not name:
-            continue
-        role = (item.role or "").strip() or None
-        disambiguation = (item.disambiguation or "").strip() or None
-        normalized.append(
-            RelatedEntityInput(name=name, role=role, disambiguation=disambiguation)
-        )
-    return normalized
-
-
-def _save_related_entities(
-    *,
-    topic: Topic,
-    entries: List[RelatedEntityInput],
-    source: str,
-) -> List[RelatedEntity]:
-    existing_relations: Dict[int, RelatedEntity] = {
-        relation.entity_id: relation
-        for relation in topic.related_entities.select_related("entity")
-    }
-
-    retained_entity_ids: Set[int] = set()
-    results: List[RelatedEntity] = []
-
-    for entry in entries:
-        slug_base = entry.name if not entry.disambiguation else f"{entry.name} {entry.disambiguation}"
-        entity_slug = slugify(slug_base)
-        defaults = {"name": entry.name}
-        if entry.disambiguation:
-            defaults["disambiguation"] = entry.disambiguation
-
-        entity, _ = Entity.objects.get_or_create(slug=entity_slug, defaults=defaults)
-
-        update_fields: List[str] = []
-        if entity.name != entry.name:
-            entity.name = entry.name
-            update_fields.append("name")
-        if entry.disambiguation is not None and entity.disambiguation != entry.disambiguation:
-            entity.disambiguation = entry.disambiguation
-            update_fields.append("disambiguation")
-        if update_fields:
-            entity.save(update_fields=update_fields)
-
-        relation = existing_relations.get(entity.id)
-        if relation is None:
-            relation = RelatedEntity.objects.create(
-                topic=topic,
-                entity=entity,
-                role=entry.role,
-                source=source,
-            )
-        else:
-            relation_update_fields: List[str] = []
-            if relation.role != entry.role:
-                relation.role = entry.role
-                relation_update_fields.append("role")
-            if relation.source != source:
-                relation.source = source
-                relation_update_fields.append("source")
-            if relation.is_deleted:
-                relation.is_deleted = False
-                relation_update_fields.append("is_deleted")
-            if relation_update_fields:
-                relation.save(update_fields=relation_update_fields)
-
-        if entity.id not in retained_entity_ids:
-            results.append(relation)
-            retained_entity_ids.add(entity.id)
-
-    for relation in existing_relations.values():
-        if relation.entity_id not in retained_entity_ids and not relation.is_deleted:
-            relation.is_deleted = True
-            relation.save(update_fields=["is_deleted"])
-
-    return results
-
-
-def _suggest_related_entities(topic: Topic) -> List[RelatedEntityInput]:
-    content_md = topic.build_context()
-    prompt = (
-        f"Below is a set of events and contents about {topic.title}. "
-        "Identify the key entities mentioned in connection with this topic. "
-        "Respond with a JSON object containing a list 'entities' where each item "
-        "has the fields 'name', optional 'role', and optional 'disambiguation'."
-    )
-    prompt = append_default_language_instruction(prompt)
-    prompt += f"\n\n{content_md}"
-
-    with OpenAI() as client:
-        response = client.responses.parse(
-            model=settings.DEFAULT_AI_MODEL,
-            input=prompt,
-            text_format=_TopicRelatedEntitySuggestionResponse,
-        )
-
-    suggestions = [
-        RelatedEntityInput(**suggestion.dict())
-        for suggestion in response.output_parsed.entities
-    ]
-    return suggestions
-
-
 @relation_router.post("/extract", response=TopicRelatedEntityCreateResponse)
 def extract_related_entities(request, payload: TopicRelatedEntityCreateRequest):
     user = getattr(request, "user", None)
@@ -238,41 +124,66 @@ def extract_related_entities(request, payload: TopicRelatedEntityCreateRequest):
         raise HttpError(401, "Unauthorized")
 
     try:
-        topic = Topic.objects.get(uuid=payload.topic_uuid)
+        topic = Topic.objects.defer("embedding").get(uuid=payload.topic_uuid)
     except Topic.DoesNotExist:
         raise HttpError(404, "Topic not found")
 
     entries: List[RelatedEntityInput]
     source: str
     if payload.entities is not None:
-        entries = _normalize_inputs(payload.entities)
+        entries = normalize_related_entities(payload.entities)
         source = Source.USER
     else:
         try:
-            entries = _normalize_inputs(_suggest_related_entities(topic))
+            entries = normalize_related_entities(suggest_related_entities(topic))
         except Exception as exc:  # pragma: no cover - surfaced to API consumer
             raise HttpError(500, str(exc))
         source = Source.AGENT
 
     with transaction.atomic():
-        created = _save_related_entities(topic=topic, entries=entries, source=source)
+        created = save_related_entities(topic=topic, entries=entries, source=source)
     serialized = [_serialize_related_entity(rel) for rel in created]
     return TopicRelatedEntityCreateResponse(entities=serialized)
 
 
-@relation_router.get("/{topic_uuid}/list", response=TopicRelatedEntityListResponse)
-def list_related_entities(request, topic_uuid: str):
+def _related_entities_etag(request, topic_uuid: str) -> Optional[str]:
+    """Fingerprint a topic's related-entity list without building it.
+
+    Relations and entities bump ``updated_at`` on every change, so the newest
+    timestamps and the active relation count stand in for the payload.
+    Returns ``None`` unless the requester owns the topic, leaving the view
+    to answer with the error.
+    """
+
     user = getattr(request, "user", None)
     if not user or not user.is_authenticated:
-        raise HttpError(401, "Unauthorized")
-
+        return None
     try:
-        topic = Topic.objects.get(uuid=topic_uuid)
-    except Topic.DoesNotExist:
-        raise HttpError(404, "Topic not found")
+        if not Topic.objects.filter(uuid=topic_uuid, created_by=user).exists():
+            return None
+    except ValidationError:
+        return None
+
+    active = Q(is_deleted=False)
+    stats = RelatedEntity.objects.filter(topic__uuid=topic_uuid).aggregate(
+        count=Count("id", filter=active),
+        relations_updated=Max("updated_at"),
+        entities_updated=Max("entity__updated_at", filter=active),
+    )
+    parts = [
+        stats["count"],
+        *(
+            stamp.timestamp() if stamp else 0
+            for stamp in (stats["relations_updated"], stats["entities_updated"])
+        ),
+    ]
+    return "-".join(str(part) for part in parts)
 
-    if topic.created_by_id != user.id:
-        raise HttpError(403, "Forbidden")
+
+@relation_router.get("/{topic_uuid}/list", response=TopicRelatedEntityListResponse)
+@decorate_view(condition(etag_func=_related_entities_etag))
+def list_related_entities(request, topic_uuid: str):
+    topic = require_owned_topic(request, topic_uuid)
 
     relations = (
         topic.related_entities.filter(is_deleted=False)
@@ -301,23 +212,13 @@ def delete_related_entity(request, relation_id: int):
         return 204, None
 
     relation.is_deleted = True
-    relation.save(update_fields=["is_deleted"])
+    relation.save(update_fields=["is_deleted", "updated_at"])
     return 204, None
 
 
 @api.get("/{topic_uuid}/generation-status", response=GenerationStatusResponse)
 def generation_status(request, topic_uuid: str):
-    user = getattr(request, "user", None)
-    if not user or not user.is_authenticated:
-        raise HttpError(401, "Unauthorized")
-
-    try:
-        topic = Topic.objects.get(uuid=topic_uuid)
-    except Topic.DoesNotExist:
-        raise HttpError(404, "Topic not found")
-
-    if topic.created_by_id != user.id:
-        raise HttpError(403, "Forbidden")
+    topic = require_owned_topic(request, topic_uuid)
 
     def latest(qs):
         row = (
@@ -373,10 +274,10 @@ def _link_reference_to_topic(
         link.is_deleted = False
         link.added_by = link.added_by or user
         link.added_at = link.added_at or timezone.now()
-        link.save(update_fields=["is_deleted", "added_by", "added_at"])
+        link.save(update_fields=["is_deleted", "added_by", "added_at", "updated_at"])
     elif not link_created and link.added_by is None and user:
         link.added_by = user
-        link.save(update_fields=["added_by"])
+        link.save(update_fields=["added_by", "updated_at"])
 
     if user:
         UserReference.objects.get_or_create(user=user, reference=reference)
@@ -433,13 +334,16 @@ def create_topic_with_references(
 
             if created and (not reference.url or "://" not in reference.url):
                 reference.url = normalized
-                reference.save(update_fields=["url"])
+                reference.save(update_fields=["url", "updated_at"])
             elif not created and reference.url and "://" not in reference.url:
                 reference.url = normalized
-                reference.save(update_fields=["url"])
+                reference.save(update_fields=["url", "updated_at"])
 
-            if reference.should_refresh():
-                reference.refresh_metadata()
+            fetch_in_flight = not created and reference.has_fetch_in_flight()
+            if reference.should_refresh() and not fetch_in_flight:
+                transaction.on_commit(
+                    partial(enrich_reference_metadata.delay, reference.id, user.id)
+                )
 
             _link_reference_to_topic(reference=reference, topic=topic, user=user)
 
@@ -510,17 +414,7 @@ def set_topic_status(request, payload: TopicStatusUpdateRequest):
         Data for the topic with its new status.
     """
 
-    user = getattr(request, "user", None)
-    if not user or not user.is_authenticated:
-        raise HttpError(401, "Unauthorized")
-
-    try:
-        topic = Topic.objects.get(uuid=payload.topic_uuid)
-    except Topic.DoesNotExist:
-        raise HttpError(404, "Topic not found")
-
-    if topic.created_by != user:
-        raise HttpError(403, "Forbidden")
+    topic = require_owned_topic(request, payload.topic_uuid, with_embedding=True)
 
     valid_statuses = {choice[0] for choice in Topic._meta.get_field("status").choices}
     if payload.status not in valid_statuses:
@@ -540,7 +434,7 @@ def set_topic_status(request, payload: TopicStatusUpdateRequest):
         if not has_finished_recap:
             raise HttpError(400, "A recap is required to publish a topic.")
 
-        publish_topic(topic, user)
+        publish_topic(topic, request.user)
         return TopicStatusUpdateResponse(topic_uuid=str(topic.uuid), status=topic.status)
 
     allowed_transitions = {
@@ -562,7 +456,7 @@ def set_topic_status(request, payload: TopicStatusUpdateRequest):
             if not has_finished_recap:
                 raise HttpError(400, "A recap is required to publish a topic.")
 
-        publish_topic(topic, user)
+        publish_topic(topic, request.user)
     else:
         topic.status = target_status
         topic.save(update_fields=["status"])
@@ -574,17 +468,7 @@ def set_topic_status(request, payload: TopicStatusUpdateRequest):
 def set_topic_title(request, payload: TopicTitleUpdateRequest):
     """Update the title of a topic owned by the authenticated user."""
 
-    user = getattr(request, "user", None)
-    if not user or not user.is_authenticated:
-        raise HttpError(401, "Unauthorized")
-
-    try:
-        topic = Topic.objects.get(uuid=payload.topic_uuid)
-    except Topic.DoesNotExist:
-        raise HttpError(404, "Topic not found")
-
-    if topic.created_by != user:
-        raise HttpError(403, "Forbidden")
+    topic = require_owned_topic(request, payload.topic_uuid, with_embedding=True)
 
     new_title = (payload.title or "").strip()
     topic.title = new_title or None
@@ -613,22 +497,6 @@ def set_topic_title(request, payload: TopicTitleUpdateRequest):
     )
 
 
-def _get_owned_topic(request, topic_uuid: str) -> Topic:
-    user = getattr(request, "user", None)
-    if not user or not user.is_authenticated:
-        raise HttpError(401, "Unauthorized")
-
-    try:
-        topic = Topic.objects.get(uuid=topic_uuid)
-    except Topic.DoesNotExist:
-        raise HttpError(404, "Topic not found")
-
-    if topic.created_by != user:
-        raise HttpError(403, "Forbidden")
-
-    return topic
-
-
 class TopicRelatedEventAddRequest(Schema):
     """Request body for adding an agenda event to a topic.
 
@@ -670,15 +538,15 @@ def add_event_to_topic(request, payload: TopicRelatedEventAddRequest):
         raise HttpError(401, "Unauthorized")
 
     try:
-        topic = Topic.objects.get(uuid=payload.topic_uuid)
+        topic = Topic.objects.defer("embedding").get(uuid=payload.topic_uuid)
     except Topic.DoesNotExist:
         raise HttpError(404, "Topic not found")
 
-    if topic.created_by != user:
+    if topic.created_by_id != user.id:
         topic = topic.clone_for_user(user)
 
     try:
-        event = Event.objects.get(uuid=payload.event_uuid)
+        event = Event.objects.only("id", "uuid").get(uuid=payload.event_uuid)
     except Event.DoesNotExist:
         raise HttpError(404, "Event not found")
 
@@ -687,13 +555,13 @@ def add_event_to_topic(request, payload: TopicRelatedEventAddRequest):
             topic=topic,
             event=event,
             defaults={
-                "source": Source.AGENT if topic.created_by != user else Source.USER
+                "source": Source.AGENT if topic.created_by_id != user.id else Source.USER
             },
         )
 
         if not created and relation.is_deleted:
             relation.is_deleted = False
-            if topic.created_by != user:
+            if topic.created_by_id != user.id:
                 relation.source = Source.AGENT
                 relation.save(update_fields=["is_deleted", "source"])
             else:
@@ -748,7 +616,7 @@ def remove_event_from_topic(request, payload: TopicRelatedEventRemoveRequest):
         raise HttpError(401, "Unauthorized")
 
     try:
-        topic = Topic.objects.get(uuid=payload.topic_uuid)
+        topic = Topic.objects.defer("embedding").get(uuid=payload.topic_uuid)
     except Topic.DoesNotExist:
         raise HttpError(404, "Topic not found")
 
@@ -849,7 +717,7 @@ TIMELINE_RELATED_EVENTS_SEARCH_LIMIT = 5
 def list_related_events(request, topic_uuid: str):
     """Return the existing timeline events linked to a topic."""
 
-    topic = _require_owned_topic(request, topic_uuid)
+    topic = require_owned_topic(request, topic_uuid)
 
     links = (
         RelatedEvent.objects.filter(topic=topic, is_deleted=False)
@@ -866,17 +734,21 @@ def list_related_events(request, topic_uuid: str):
 def search_related_events(request, topic_uuid: str, query: Optional[str] = None):
     """Search for timeline events to relate to a topic."""
 
-    topic = _require_owned_topic(request, topic_uuid)
+    topic = require_owned_topic(request, topic_uuid, with_embedding=True)
 
     trimmed_query = (query or "").strip()
     if not trimmed_query:
         return []
 
-    existing_links = {
-        link.event_id: link for link in RelatedEvent.objects.filter(topic=topic)
-    }
+    linked_event_ids = set(
+        RelatedEvent.objects.filter(topic=topic, is_deleted=False).values_list(
+            "event_id", flat=True
+        )
+    )
 
-    queryset = Event.objects.filter(status="published", title__icontains=trimmed_query)
+    queryset = Event.objects.filter(
+        status="published", title__icontains=trimmed_query
+    ).only("id", "uuid", "title", "date")
 
     if topic.embedding is not None:
         queryset = queryset.annotate(
@@ -896,15 +768,13 @@ def search_related_events(request, topic_uuid: str, query: Optional[str] = None)
 
     results: List[TimelineRelatedEventSearchResult] = []
     for event in queryset:
-        link = existing_links.get(event.id)
-        is_linked = link is not None and not link.is_deleted
         results.append(
             TimelineRelatedEventSearchResult(
                 uuid=str(event.uuid),
                 title=event.title,
                 date=event.date,
                 similarity=getattr(event, "similarity", None),
-                is_already_linked=is_linked,
+                is_already_linked=event.id in linked_event_ids,
             )
         )
 
@@ -918,48 +788,50 @@ def search_related_events(request, topic_uuid: str, query: Optional[str] = None)
 def suggest_related_events(request, topic_uuid: str):
     """Suggest new timeline events based on embeddings."""
 
-    topic = _require_owned_topic(request, topic_uuid)
+    topic = require_owned_topic(request, topic_uuid, with_embedding=True)
 
     if topic.embedding is None:
         return []
 
-    existing_links = {
-        link.event_id: link for link in RelatedEvent.objects.filter(topic=topic)
-    }
-
     threshold = TIMELINE_RELATED_EVENTS_SUGGESTION_THRESHOLD
     limit = TIMELINE_RELATED_EVENTS_SUGGESTION_LIMIT
 
+    # Already linked events are excluded in SQL, so the limit applies to
+    # real candidates and no link rows are loaded.
     queryset = (
         Event.objects.filter(status="published")
         .exclude(embedding__isnull=True)
+        .exclude(
+            id__in=RelatedEvent.objects.filter(topic=topic, is_deleted=False).values(
+                "event_id"
+            )
+        )
         .annotate(distance=CosineDistance("embedding", topic.embedding))
         .annotate(similarity=Value(1.0) - F("distance"))
         .filter(similarity__gte=threshold)
-        .order_by("-similarity")[: limit * 2]
+        .order_by("-similarity")
+        .only("uuid", "title", "date")[:limit]
     )
 
-    suggestions: List[TimelineRelatedEventSuggestion] = []
-    for candidate in queryset:
-        link = existing_links.get(candidate.id)
-        is_linked = link is not None and not link.is_deleted
-        if is_linked:
-            continue
-
-        suggestions.append(
-            TimelineRelatedEventSuggestion(
-                uuid=str(candidate.uuid),
-                title=getattr(candidate, "title", None),
-                date=getattr(candidate, "date", None),
-                similarity=getattr(candidate, "similarity", None),
-                is_already_linked=is_linked,
-            )
+    return [
+        TimelineRelatedEventSuggestion(
+            uuid=str(candidate.uuid),
+            title=candidate.title,
+            date=candidate.date,
+            similarity=candidate.similarity,
+            is_already_linked=False,
         )
+        for candidate in queryset
+    ]
 
-        if len(suggestions) >= limit:
-            break
 
-    return suggestions
+_TIMELINE_SUGGESTION_PROMPT = (
+    "List the top {limit} significant events related to the topic "
+    '"{title}" {descriptor}. '
+    "Generate event titles as concise factual statements. "
+    "State the core fact directly and neutrally. "
+    "For each event, include a few source URLs as citations."
+)
 
 
 class TimelineSuggestRequest(Schema):
@@ -982,7 +854,7 @@ def suggest_topic_events(request, payload: TimelineSuggestRequest):
         raise HttpError(401, "Unauthorized")
 
     try:
-        topic = Topic.objects.get(uuid=payload.topic_uuid)
+        topic = Topic.objects.defer("embedding").get(uuid=payload.topic_uuid)
     except Topic.DoesNotExist:
         raise HttpError(404, "Topic not found")
 
@@ -1012,20 +884,18 @@ def suggest_topic_events(request, payload: TimelineSuggestRequest):
     descriptor_parts.append(timeframe)
     descriptor = " ".join(descriptor_parts)
 
-    prompt = (
-        f"List the top {payload.limit} significant events related to the topic "
-        f'"{topic.title}" {descriptor}. '
-        "Generate event titles as concise factual statements. "
-        "State the core fact directly and neutrally. "
-        "For each event, include a few source URLs as citations."
+    prompt = append_default_language_instruction(
+        _TIMELINE_SUGGESTION_PROMPT.format(
+            limit=payload.limit, title=topic.title, descriptor=descriptor
+        )
     )
-    prompt = append_default_language_instruction(prompt)
 
     context = topic.build_context()
     if context:
-        prompt += "\n\nContext:\n" + context
+        prompt = f"{prompt}\n\nContext:\n{context}"
 
     created_events: List[TimelineSuggestedEventOut] = []
+    new_events = []
 
     with OpenAI() as client:
         response = client.responses.parse(
@@ -1035,21 +905,34 @@ def suggest_topic_events(request, payload: TimelineSuggestRequest):
             text_format=TimelineEventList,
         )
 
-        existing_titles = {
-            title.lower()
-            for title in topic.events.filter(relatedevent__is_deleted=False)
-            .values_list("title", flat=True)
-        }
+        # Only linked events whose title matches a suggestion are read back.
+        candidate_titles = {ev.title.lower() for ev in response.output_parsed.events}
+        existing_titles = set(
+            topic.events.filter(relatedevent__is_deleted=False)
+            .annotate(lower_title=Lower("title"))
+            .filter(lower_title__in=candidate_titles)
+            .values_list("lower_title", flat=True)
+        )
         suggestions = [
             ev for ev in response.output_parsed.events if ev.title.lower() not in existing_titles
         ]
 
-        for ev in suggestions:
-            text = f"{ev.title} - {ev.date}\n{', '.join(ev.categories or [])}"
-            embedding = client.embeddings.create(
-                input=text,
-                model="text-embedding-3-small",
-            ).data[0].embedding
+        # One embeddings request for the whole batch; results come back in
+        # input order.
+        embeddings = []
+        if suggestions:
+            embeddings = [
+                item.embedding
+                for item in client.embeddings.create(
+                    input=[
+                        f"{ev.title} - {ev.date}\n{', '.join(ev.categories or [])}"
+                        for ev in suggestions
+                    ],
+                    model="text-embedding-3-small",
+                ).data
+            ]
+
+        for ev, embedding in zip(suggestions, embeddings):
             event, created = Event.objects.get_or_create_semantic(
                 date=ev.date,
                 embedding=embedding,
@@ -1062,13 +945,7 @@ def suggest_topic_events(request, payload: TimelineSuggestRequest):
             )
 
             if created:
-                for url in ev.sources or []:
-                    source_obj, _ = AgendaSource.objects.get_or_create(url=url)
-                    event.sources.add(source_obj)
-
-                for name in ev.categories or []:
-                    category, _ = Category.objects.get_or_create(name=name)
-                    event.categories.add(category)
+                new_events.append((event, ev))
 
             if not created and locality_code and not event.locality:
                 event.locality = locality_code
@@ -1084,9 +961,48 @@ def suggest_topic_events(request, payload: TimelineSuggestRequest):
                 )
             )
 
+    if new_events:
+        _attach_suggested_event_metadata(new_events)
+
     return created_events
 
 
+def _attach_suggested_event_metadata(new_events) -> None:
+    """Link sources and categories to newly created events in bulk.
+
+    Sources and categories for every event are resolved with one SELECT and
+    one INSERT each, and the M2M links are written with one INSERT per
+    relation instead of a ``get_or_create`` and ``add`` per item.
+    """
+
+    sources = AgendaSource.get_or_create_many(
+        url for _, ev in new_events for url in ev.sources or []
+    )
+    categories = Category.get_or_create_many(
+        name for _, ev in new_events for name in ev.categories or []
+    )
+
+    EventSource = Event.sources.through
+    EventCategory = Event.categories.through
+    with transaction.atomic():
+        EventSource.objects.bulk_create(
+            [
+                EventSource(event_id=event.id, source_id=sources[url].id)
+                for event, ev in new_events
+                for url in dict.fromkeys(ev.sources or [])
+            ],
+            ignore_conflicts=True,
+        )
+        EventCategory.objects.bulk_create(
+            [
+                EventCategory(event_id=event.id, category_id=categories[name].id)
+                for event, ev in new_events
+                for name in dict.fromkeys(ev.categories or [])
+            ],
+            ignore_conflicts=True,
+        )
+
+
 class TimelineCreateRequest(Schema):
     """Request body for relating selected events to the topic."""
 
@@ -1111,35 +1027,44 @@ def create_topic_events(request, payload: TimelineCreateRequest):
         raise HttpError(401, "Unauthorized")
 
     try:
-        topic = Topic.objects.get(uuid=payload.topic_uuid)
+        topic = Topic.objects.defer("embedding").get(uuid=payload.topic_uuid)
     except Topic.DoesNotExist:
         raise HttpError(404, "Topic not found")
 
-    created: List[TimelineCreatedEvent] = []
-    for event_uuid in payload.event_uuids:
-        try:
-            event = Event.objects.get(uuid=event_uuid)
-        except Event.DoesNotExist:
-            raise HttpError(404, "Event not found")
+    try:
+        requested = [UUID(value) for value in payload.event_uuids]
+    except ValueError:
+        raise HttpError(404, "Event not found")
 
-        relation, relation_created = RelatedEvent.objects.get_or_create(
-            topic=topic,
-            event=event,
-            defaults={"source": Source.AGENT},
+    events = {
+        event.uuid: event
+        for event in Event.objects.filter(uuid__in=requested).only(
+            "id", "uuid", "title", "date"
         )
+    }
+    if len(events) != len(set(requested)):
+        raise HttpError(404, "Event not found")
 
-        if not relation_created and relation.is_deleted:
-            relation.is_deleted = False
-            relation.source = Source.AGENT
-            relation.save(update_fields=["is_deleted", "source"])
-
-        created.append(
-            TimelineCreatedEvent(
-                uuid=str(event.uuid), title=event.title, date=event.date
-            )
+    # One INSERT for the new links and one UPDATE to restore soft-deleted ones,
+    # instead of a get_or_create round trip per event.
+    with transaction.atomic():
+        RelatedEvent.objects.bulk_create(
+            [
+                RelatedEvent(topic=topic, event=event, source=Source.AGENT)
+                for event in events.values()
+            ],
+            ignore_conflicts=True,
         )
+        RelatedEvent.objects.filter(
+            topic=topic, event__in=events.values(), is_deleted=True
+        ).update(is_deleted=False, source=Source.AGENT)
 
-    return created
+    return [
+        TimelineCreatedEvent(
+            uuid=str(event.uuid), title=event.title, date=event.date
+        )
+        for event in (events[event_uuid] for event_uuid in requested)
+    ]
 
 
 class RelatedTopicLinkSchema(Schema):
@@ -1171,22 +1096,6 @@ class RelatedTopicCreateRequest(Schema):
     related_topic_uuid: str
 
 
-def _require_owned_topic(request, topic_uuid: str) -> Topic:
-    user = getattr(request, "user", None)
-    if not user or not user.is_authenticated:
-        raise HttpError(401, "Unauthorized")
-
-    try:
-        topic = Topic.objects.get(uuid=topic_uuid)
-    except Topic.DoesNotExist:
-        raise HttpError(404, "Topic not found")
-
-    if topic.created_by_id != user.id:
-        raise HttpError(403, "Forbidden")
-
-    return topic
-
-
 def _serialize_related_topic_link(link: RelatedTopic) -> RelatedTopicLinkSchema:
     related_topic = link.related_topic
     created_by = getattr(related_topic, "created_by", None)
@@ -1219,7 +1128,7 @@ RELATED_TOPICS_SEARCH_LIMIT = 5
 
 @api.get("/{topic_uuid}/related-topics", response=List[RelatedTopicLinkSchema])
 def list_related_topics(request, topic_uuid: str):
-    topic = _require_owned_topic(request, topic_uuid)
+    topic = require_owned_topic(request, topic_uuid)
     links = (
         RelatedTopic.objects.filter(topic=topic, is_deleted=False)
         .select_related("related_topic__created_by")
@@ -1233,7 +1142,7 @@ def list_related_topics(request, topic_uuid: str):
     response=List[RelatedTopicSearchResult],
 )
 def search_related_topics(request, topic_uuid: str, query: Optional[str] = None):
-    topic = _require_owned_topic(request, topic_uuid)
+    topic = require_owned_topic(request, topic_uuid)
     existing_links = {
         link.related_topic_id: link
         for link in RelatedTopic.objects.filter(topic=topic)
@@ -1243,6 +1152,7 @@ def search_related_topics(request, topic_uuid: str, query: Optional[str] = None)
         Topic.objects.filter(status="published")
         .exclude(uuid=topic.uuid)
         .select_related("created_by")
+        .defer("embedding")
     )
 
     if query:
@@ -1283,7 +1193,7 @@ def search_related_topics(request, topic_uuid: str, query: Optional[str] = None)
     response=List[RelatedTopicSuggestion],
 )
 def suggest_related_topics(request, topic_uuid: str):
-    topic = _require_owned_topic(request, topic_uuid)
+    topic = require_owned_topic(request, topic_uuid, with_embedding=True)
 
     if not topic.title or topic.embedding is None:
         return []
@@ -1304,6 +1214,7 @@ def suggest_related_topics(request, topic_uuid: str):
         .annotate(similarity=Value(1.0) - F("distance"))
         .filter(similarity__gte=threshold)
         .select_related("created_by")
+        .defer("embedding")
         .order_by("-similarity")[: limit * 2]
     )
 
@@ -1338,10 +1249,10 @@ def suggest_related_topics(request, topic_uuid: str):
 def add_related_topic(
     request, topic_uuid: str, payload: RelatedTopicCreateRequest
 ):
-    topic = _require_owned_topic(request, topic_uuid)
+    topic = require_owned_topic(request, topic_uuid)
 
     try:
-        related_topic = Topic.objects.get(uuid=payload.related_topic_uuid)
+        related_topic = Topic.objects.defer("embedding").get(uuid=payload.related_topic_uuid)
     except Topic.DoesNotExist:
         raise HttpError(404, "Related topic not found")
 
@@ -1375,7 +1286,7 @@ def add_related_topic(
     response=RelatedTopicLinkSchema,
 )
 def remove_related_topic(request, topic_uuid: str, link_id: int):
-    topic = _require_owned_topic(request, topic_uuid)
+    topic = require_owned_topic(request, topic_uuid)
 
     try:
         link = RelatedTopic.objects.select_related("related_topic").get(
@@ -1397,7 +1308,7 @@ def remove_related_topic(request, topic_uuid: str, link_id: int):
     response=RelatedTopicLinkSchema,
 )
 def restore_related_topic(request, topic_uuid: str, link_id: int):
-    topic = _require_owned_topic(request, topic_uuid)
+    topic = require_owned_topic(request, topic_uuid)
 
     try:
         link = RelatedTopic.objects.select_related("related_topic").get(
@@ -1463,6 +1374,13 @@ def _has_meaningful_context(context: str) -> bool:
     return bool(stripped.strip("# \n\t"))
 
 
+_TITLE_SUGGESTION_PROMPT = (
+    "Suggest {limit} concise title{plural} for this news topic. "
+    "Use the recap and paragraph context to create a clear, descriptive headline. "
+    "Avoid quotes, trailing punctuation, or overly specific phrasing."
+)
+
+
 def suggest_topic_titles(*, topic: Topic, limit: int = 1) -> List[str]:
     """Return a list of suggested titles for a topic."""
 
@@ -1475,14 +1393,10 @@ def suggest_topic_titles(*, topic: Topic, limit: int = 1) -> List[str]:
             400, "Add content to the topic before requesting title suggestions."
         )
 
-    prompt = (
-        f"Suggest {limit} concise title{'s' if limit != 1 else ''} for this news topic. "
-        "Use the recap and paragraph context to create a clear, descriptive headline. "
-        "Avoid quotes, trailing punctuation, or overly specific phrasing."
+    prompt = append_default_language_instruction(
+        _TITLE_SUGGESTION_PROMPT.format(limit=limit, plural="s" if limit != 1 else "")
     )
-    prompt = append_default_language_instruction(prompt)
-    prompt += "\n\nContext:\n\n"
-    prompt += context.strip()
+    prompt = f"{prompt}\n\nContext:\n\n{context.strip()}"
 
     with OpenAI() as client:
         response = client.responses.parse(
@@ -1494,6 +1408,15 @@ def suggest_topic_titles(*, topic: Topic, limit: int = 1) -> List[str]:
     return [title for title in response.output_parsed.titles if title and title.strip()]
 
 
+_TOPIC_SUGGESTION_PROMPT = (
+    "Suggest {limit} topic ideas for a news topic. "
+    "Each topic should be a short, broad phrase in nominalized passive form. "
+    "Avoid overly specific or literal restatements of the subject. "
+    "Make the {limit} suggestions vary in scope, but none too specific. "
+    "\n\nUse the following information as context:\n\n{context}"
+)
+
+
 def suggest_topics(
     *, about: Optional[str] = None, limit: int = 3, topic_uuid: Optional[str] = None
 ) -> List[str]:
@@ -1504,7 +1427,7 @@ def suggest_topics(
     topic_context = ""
     if topic_uuid:
         try:
-            topic = Topic.objects.get(uuid=topic_uuid)
+            topic = Topic.objects.defer("embedding").get(uuid=topic_uuid)
         except Topic.DoesNotExist:
             raise HttpError(404, "Topic not found")
         topic_context = topic.build_context()
@@ -1521,17 +1444,12 @@ def suggest_topics(
             "Provide a description or add content to the topic before requesting suggestions.",
         )
 
-    prompt = (
-        f"Suggest {limit} topic ideas for a news topic. "
-        f"Each topic should be a short, broad phrase in nominalized passive form. "
-        f"Avoid overly specific or literal restatements of the subject. "
-        f"Make the {limit} suggestions vary in scope, but none too specific. "
+    prompt = append_default_language_instruction(
+        _TOPIC_SUGGESTION_PROMPT.format(
+            limit=limit, context="\n\n".join(context_parts)
+        )
     )
 
-    prompt += "\n\nUse the following information as context:\n\n"
-    prompt += "\n\n".join(context_parts)
-    prompt = append_default_language_instruction(prompt)
-
     with OpenAI() as client:
         response = client.responses.parse(
             model=settings.DEFAULT_AI_MODEL,
@@ -1564,7 +1482,7 @@ def suggest_topics_post(request, payload: SuggestTopicsRequest):
 def suggest_topic_title_get(request, topic_uuid: str, limit: int = 1):
     """Return suggested titles for a topic via GET."""
 
-    topic = _get_owned_topic(request, topic_uuid)
+    topic = require_owned_topic(request, topic_uuid)
     return suggest_topic_titles(topic=topic, limit=limit)
 
 
@@ -1572,5 +1490,5 @@ def suggest_topic_title_get(request, topic_uuid: str, limit: int = 1):
 def suggest_topic_title_post(request, payload: SuggestTopicTitleRequest):
     """Return suggested titles for a topic via POST."""
 
-    topic = _get_owned_topic(request, payload.topic_uuid)
+    topic = require_owned_topic(request, payload.topic_uuid)
     return suggest_topic_titles(topic=topic, limit=payload.limit)
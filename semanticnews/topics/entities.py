@@ -0,0 +1,150 @@
+"""Helpers for extracting and storing a topic's related entities."""
+
+import hashlib
+from typing import Dict, List, Optional, Set
+
+from django.conf import settings
+from django.core.cache import cache
+from ninja import Schema
+from slugify import slugify
+
+from semanticnews.entities.models import Entity
+from semanticnews.openai import OpenAI
+from semanticnews.prompting import append_default_language_instruction
+
+from .models import RelatedEntity, Topic
+
+
+class RelatedEntityInput(Schema):
+    name: str
+    role: Optional[str] = None
+    disambiguation: Optional[str] = None
+
+
+class _RelatedEntitySuggestions(Schema):
+    entities: List[RelatedEntityInput]
+
+
+def normalize_related_entities(items: List[RelatedEntityInput]) -> List[RelatedEntityInput]:
+    normalized: List[RelatedEntityInput] = []
+    for item in items:
+        name = (item.name or "").strip()
+        if not name:
+            continue
+        role = (item.role or "").strip() or None
+        disambiguation = (item.disambiguation or "").strip() or None
+        normalized.append(
+            RelatedEntityInput(name=name, role=role, disambiguation=disambiguation)
+        )
+    return normalized
+
+
+def save_related_entities(
+    *,
+    topic: Topic,
+    entries: List[RelatedEntityInput],
+    source: str,
+) -> List[RelatedEntity]:
+    existing_relations: Dict[int, RelatedEntity] = {
+        relation.entity_id: relation
+        for relation in topic.related_entities.select_related("entity")
+    }
+
+    retained_entity_ids: Set[int] = set()
+    results: List[RelatedEntity] = []
+
+    for entry in entries:
+        slug_base = entry.name if not entry.disambiguation else f"{entry.name} {entry.disambiguation}"
+        entity_slug = slugify(slug_base)
+        defaults = {"name": entry.name}
+        if entry.disambiguation:
+            defaults["disambiguation"] = entry.disambiguation
+
+        entity, _ = Entity.objects.get_or_create(slug=entity_slug, defaults=defaults)
+
+        update_fields: List[str] = []
+        if entity.name != entry.name:
+            entity.name = entry.name
+            update_fields.append("name")
+        if entry.disambiguation is not None and entity.disambiguation != entry.disambiguation:
+            entity.disambiguation = entry.disambiguation
+            update_fields.append("disambiguation")
+        if update_fields:
+            entity.save(update_fields=[*update_fields, "updated_at"])
+
+        relation = existing_relations.get(entity.id)
+        if relation is None:
+            relation = RelatedEntity.objects.create(
+                topic=topic,
+                entity=entity,
+                role=entry.role,
+                source=source,
+            )
+        else:
+            relation_update_fields: List[str] = []
+            if relation.role != entry.role:
+                relation.role = entry.role
+                relation_update_fields.append("role")
+            if relation.source != source:
+                relation.source = source
+                relation_update_fields.append("source")
+            if relation.is_deleted:
+                relation.is_deleted = False
+                relation_update_fields.append("is_deleted")
+            if relation_update_fields:
+                relation.save(update_fields=[*relation_update_fields, "updated_at"])
+
+        if entity.id not in retained_entity_ids:
+            results.append(relation)
+            retained_entity_ids.add(entity.id)
+
+    for relation in existing_relations.values():
+        if relation.entity_id not in retained_entity_ids and not relation.is_deleted:
+            relation.is_deleted = True
+            relation.save(update_fields=["is_deleted", "updated_at"])
+
+    return results
+
+
+# Entity suggestions for an unchanged context are reused for a day.
+ENTITY_SUGGESTION_CACHE_TIMEOUT = 60 * 60 * 24
+
+_ENTITY_SUGGESTION_PROMPT = (
+    "Below is a set of events and contents about {title}. "
+    "Identify the key entities mentioned in connection with this topic. "
+    "Respond with a JSON object containing a list 'entities' where each item "
+    "has the fields 'name', optional 'role', and optional 'disambiguation'."
+)
+
+
+def suggest_related_entities(topic: Topic) -> List[RelatedEntityInput]:
+    content_md = topic.build_context()
+    prompt = append_default_language_instruction(
+        _ENTITY_SUGGESTION_PROMPT.format(title=topic.title)
+    )
+    prompt = f"{prompt}\n\n{content_md}"
+
+    # The prompt fully determines the suggestion, so an unchanged topic context
+    # reuses the previous answer instead of paying for another model call.
+    key = "topics:entity-suggestions:{}:{}".format(
+        settings.DEFAULT_AI_MODEL,
+        hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        return [RelatedEntityInput(**suggestion) for suggestion in cached]
+
+    with OpenAI() as client:
+        response = client.responses.parse(
+            model=settings.DEFAULT_AI_MODEL,
+            input=prompt,
+            text_format=_RelatedEntitySuggestions,
+        )
+
+    suggestions = response.output_parsed.entities
+    cache.set(
+        key,
+        [suggestion.model_dump() for suggestion in suggestions],
+        ENTITY_SUGGESTION_CACHE_TIMEOUT,
+    )
+    return suggestions
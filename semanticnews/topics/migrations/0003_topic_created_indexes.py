@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('topics', '0002_topicsectionsuggestion'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='topicrecap',
+            index=models.Index(fields=['topic', '-created_at'], name='topicrecap_topic_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='topicsectionsuggestion',
+            index=models.Index(fields=['topic', '-created_at', '-id'], name='sectionsugg_topic_created_idx'),
+        ),
+    ]
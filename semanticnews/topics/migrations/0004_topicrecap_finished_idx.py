@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('topics', '0003_topic_created_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='topicrecap',
+            index=models.Index(condition=models.Q(('is_deleted', False), ('status', 'finished')), fields=['topic', 'created_at'], name='topicrecap_finished_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations
+
+
+def _set_recap_compression(method):
+    # Column compression needs PostgreSQL 14+, and lz4 additionally needs a
+    # server built with lz4 support; elsewhere the column keeps pglz.
+    return f"""
+        DO $$
+        BEGIN
+            IF current_setting('server_version_num')::int >= 140000 THEN
+                ALTER TABLE topics_topicrecap ALTER COLUMN recap SET COMPRESSION {method};
+            END IF;
+        EXCEPTION WHEN feature_not_supported THEN
+            NULL;
+        END
+        $$;
+    """
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('topics', '0004_topicrecap_finished_idx'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=_set_recap_compression('lz4'),
+            reverse_sql=_set_recap_compression('default'),
+        ),
+    ]
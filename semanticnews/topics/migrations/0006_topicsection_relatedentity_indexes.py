@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entities', '0001_initial'),
+        ('topics', '0005_topicrecap_recap_lz4'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='relatedentity',
+            index=models.Index(fields=['topic', '-created_at'], name='relentity_topic_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='topicsection',
+            index=models.Index(condition=models.Q(('is_deleted', False), ('is_draft_deleted', False)), fields=['topic', 'draft_display_order'], name='topicsection_active_order_idx'),
+        ),
+    ]
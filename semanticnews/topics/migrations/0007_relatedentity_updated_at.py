@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('topics', '0006_topicsection_relatedentity_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='relatedentity',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -8,13 +8,14 @@ from types import SimpleNamespace
 
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import Q
+from django.db.models import OuterRef, Q, Subquery
 from django.utils.functional import cached_property
-from django.utils.translation import gettext, get_supported_language_variant
+from django.utils.translation import gettext
 from django.urls import reverse
 from django.conf import settings
 from slugify import slugify
-from semanticnews.openai import OpenAI, AsyncOpenAI
+from semanticnews.entities.models import Description
+from semanticnews.openai import OpenAI
 from pgvector.django import VectorField, L2Distance, HnswIndex
 from semanticnews.topics.widgets import get_widget
 
@@ -482,62 +483,69 @@ class Topic(models.Model):
             parts.append("\n")
 
         # Events
-        events_qs = self.events.filter(relatedevent__is_deleted=False).order_by("date")
-        if events_qs.exists():
-            event_lines = [f"- {event.title} ({event.date})" for event in events_qs]
-            append_section("Events", "\n".join(event_lines))
-
-        # Entities
-        entities_qs = self.entities.all().order_by("name")
-        if entities_qs.exists():
-            entity_lines = []
-            for entity in entities_qs:
-                description = getattr(entity, "description", None) or ""
-                line = entity.name
-                if entity.disambiguation:
-                    line = f"{line} ({entity.disambiguation})"
-                if description:
-                    line = f"{line}\n  Description: {description}"
-                entity_lines.append(f"- {line}")
-            append_section("Entities", "\n".join(entity_lines))
+        events_qs = (
+            self.events.filter(relatedevent__is_deleted=False)
+            .order_by("date")
+            .values_list("title", "date")
+        )
+        event_lines = [f"- {title} ({event_date})" for title, event_date in events_qs]
+        append_section("Events", "\n".join(event_lines))
+
+        # Entities (latest description fetched in the same query, matching
+        # ``Entity.description``)
+        latest_description = Description.objects.filter(
+            entity=OuterRef("pk")
+        ).order_by("-pk").values("description")[:1]
+        entities_qs = (
+            self.entities.all()
+            .order_by("name")
+            .annotate(latest_description=Subquery(latest_description))
+            .values_list("name", "disambiguation", "latest_description")
+        )
+        entity_lines = []
+        for name, disambiguation, description in entities_qs:
+            line = name
+            if disambiguation:
+                line = f"{line} ({disambiguation})"
+            if description:
+                line = f"{line}\n  Description: {description}"
+            entity_lines.append(f"- {line}")
+        append_section("Entities", "\n".join(entity_lines))
 
         # Documents
         documents_rel = getattr(self, "documents", None)
         if documents_rel is not None:
             documents_qs = documents_rel.filter(is_deleted=False).order_by("created_at")
-            if documents_qs.exists():
-                document_lines = []
-                for document in documents_qs:
-                    description = document.description or ""
-                    display_title = document.display_title
-                    line = f"- {display_title}: {document.url}"
-                    if description:
-                        line = f"{line}\n  {description}"
-                    document_lines.append(line)
-                append_section("Documents", "\n".join(document_lines))
+            document_lines = []
+            for document in documents_qs:
+                description = document.description or ""
+                display_title = document.display_title
+                line = f"- {display_title}: {document.url}"
+                if description:
+                    line = f"{line}\n  {description}"
+                document_lines.append(line)
+            append_section("Documents", "\n".join(document_lines))
 
         # Webpages
         webpages_rel = getattr(self, "webpages", None)
         if webpages_rel is not None:
             webpages_qs = webpages_rel.filter(is_deleted=False).order_by("created_at")
-            if webpages_qs.exists():
-                webpage_lines = []
-                for webpage in webpages_qs:
-                    description = webpage.description or ""
-                    title = webpage.title or webpage.url
-                    line = f"- {title}: {webpage.url}"
-                    if description:
-                        line = f"{line}\n  {description}"
-                    webpage_lines.append(line)
-                append_section("Webpages", "\n".join(webpage_lines))
+            webpage_lines = []
+            for webpage in webpages_qs:
+                description = webpage.description or ""
+                title = webpage.title or webpage.url
+                line = f"- {title}: {webpage.url}"
+                if description:
+                    line = f"{line}\n  {description}"
+                webpage_lines.append(line)
+            append_section("Webpages", "\n".join(webpage_lines))
 
         # Text notes
         texts_rel = getattr(self, "texts", None)
         if texts_rel is not None:
             texts_qs = texts_rel.filter(is_deleted=False).order_by("created_at")
-            if texts_qs.exists():
-                text_blocks = [text.content for text in texts_qs if text.content]
-                append_section("Text Notes", "\n\n".join(text_blocks))
+            text_blocks = [text.content for text in texts_qs if text.content]
+            append_section("Text Notes", "\n\n".join(text_blocks))
 
         # Paragraphs
         paragraph_blocks = []
@@ -563,12 +571,13 @@ class Topic(models.Model):
             append_section("Paragraphs", "\n\n".join(paragraph_blocks))
 
         # Recaps
-        recaps_qs = self.recaps.filter(is_deleted=False, status="finished").order_by(
-            "created_at"
+        recaps_qs = (
+            self.recaps.filter(is_deleted=False, status="finished")
+            .order_by("created_at")
+            .values_list("recap", flat=True)
         )
-        if recaps_qs.exists():
-            recap_blocks = [recap.recap for recap in recaps_qs if recap.recap]
-            append_section("Recaps", "\n\n".join(recap_blocks))
+        recap_blocks = [recap for recap in recaps_qs if recap]
+        append_section("Recaps", "\n\n".join(recap_blocks))
 
         # Images
         images_rel = getattr(self, "images", None)
@@ -576,26 +585,24 @@ class Topic(models.Model):
             images_qs = images_rel.filter(is_deleted=False, status="finished").order_by(
                 "created_at"
             )
-            if images_qs.exists():
-                image_lines = []
-                for image in images_qs:
-                    image_name = getattr(image.image, "name", "") or ""
-                    thumbnail_name = getattr(image.thumbnail, "name", "") or ""
-                    line = f"- Image: {image_name}" if image_name else "- Image"
-                    if thumbnail_name:
-                        line = f"{line}\n  Thumbnail: {thumbnail_name}"
-                    image_lines.append(line)
-                append_section("Images", "\n".join(image_lines))
+            image_lines = []
+            for image in images_qs:
+                image_name = getattr(image.image, "name", "") or ""
+                thumbnail_name = getattr(image.thumbnail, "name", "") or ""
+                line = f"- Image: {image_name}" if image_name else "- Image"
+                if thumbnail_name:
+                    line = f"{line}\n  Thumbnail: {thumbnail_name}"
+                image_lines.append(line)
+            append_section("Images", "\n".join(image_lines))
 
         # Tweets
         tweets_rel = getattr(self, "tweets", None)
         if tweets_rel is not None:
             tweets_qs = tweets_rel.filter(is_deleted=False).order_by("created_at")
-            if tweets_qs.exists():
-                tweet_lines = []
-                for tweet in tweets_qs:
-                    tweet_lines.append(f"- {tweet.url}\n  {tweet.html}")
-                append_section("Tweets", "\n".join(tweet_lines))
+            tweet_lines = []
+            for tweet in tweets_qs:
+                tweet_lines.append(f"- {tweet.url}\n  {tweet.html}")
+            append_section("Tweets", "\n".join(tweet_lines))
 
         # YouTube videos
         videos_rel = getattr(self, "youtube_videos", None)
@@ -603,59 +610,56 @@ class Topic(models.Model):
             videos_qs = videos_rel.filter(is_deleted=False, status="finished").order_by(
                 "created_at"
             )
-            if videos_qs.exists():
-                video_lines = []
-                for video in videos_qs:
-                    description = video.description or ""
-                    title = video.title or "Video"
-                    line = f"- {title}: {video.url or video.video_id}"
-                    if description:
-                        line = f"{line}\n  {description}"
-                    video_lines.append(line)
-                append_section("Videos", "\n".join(video_lines))
+            video_lines = []
+            for video in videos_qs:
+                description = video.description or ""
+                title = video.title or "Video"
+                line = f"- {title}: {video.url or video.video_id}"
+                if description:
+                    line = f"{line}\n  {description}"
+                video_lines.append(line)
+            append_section("Videos", "\n".join(video_lines))
 
         # Data
         datas_rel = getattr(self, "datas", None)
         if datas_rel is not None:
             data_qs = datas_rel.filter(is_deleted=False).order_by("created_at")
-            if data_qs.exists():
-                data_sections = []
-                for dataset in data_qs:
-                    name = dataset.name or "Dataset"
-                    explanation = dataset.explanation or ""
+            data_sections = []
+            for dataset in data_qs:
+                name = dataset.name or "Dataset"
+                explanation = dataset.explanation or ""
+                try:
+                    data_payload = json.dumps(dataset.data, indent=2, sort_keys=True)
+                except TypeError:
+                    data_payload = str(dataset.data)
+                sources = dataset.sources or []
+                sources_repr = ""
+                if sources:
                     try:
-                        data_payload = json.dumps(dataset.data, indent=2, sort_keys=True)
+                        sources_repr = json.dumps(sources, ensure_ascii=False)
                     except TypeError:
-                        data_payload = str(dataset.data)
-                    sources = dataset.sources or []
-                    sources_repr = ""
-                    if sources:
-                        try:
-                            sources_repr = json.dumps(sources, ensure_ascii=False)
-                        except TypeError:
-                            sources_repr = str(sources)
-                    section_lines = [f"### {name}", data_payload]
-                    if explanation:
-                        section_lines.insert(1, explanation)
-                    if sources_repr:
-                        section_lines.append(f"Sources: {sources_repr}")
-                    data_sections.append("\n\n".join(section_lines))
-                append_section("Data", "\n\n".join(data_sections))
+                        sources_repr = str(sources)
+                section_lines = [f"### {name}", data_payload]
+                if explanation:
+                    section_lines.insert(1, explanation)
+                if sources_repr:
+                    section_lines.append(f"Sources: {sources_repr}")
+                data_sections.append("\n\n".join(section_lines))
+            append_section("Data", "\n\n".join(data_sections))
 
         # Data insights
         insights_rel = getattr(self, "data_insights", None)
         if insights_rel is not None:
             insights_qs = insights_rel.filter(is_deleted=False).order_by("created_at")
-            if insights_qs.exists():
-                insight_lines = []
-                for insight in insights_qs:
-                    sources = insight.sources.all()
-                    source_names = [source.name or "Dataset" for source in sources]
-                    line = insight.insight
-                    if source_names:
-                        line = f"{line}\n  Sources: {', '.join(source_names)}"
-                    insight_lines.append(f"- {line}")
-                append_section("Data Insights", "\n".join(insight_lines))
+            insight_lines = []
+            for insight in insights_qs:
+                sources = insight.sources.all()
+                source_names = [source.name or "Dataset" for source in sources]
+                line = insight.insight
+                if source_names:
+                    line = f"{line}\n  Sources: {', '.join(source_names)}"
+                insight_lines.append(f"- {line}")
+            append_section("Data Insights", "\n".join(insight_lines))
 
         # Data visualizations
         visualizations_rel = getattr(self, "data_visualizations", None)
@@ -663,27 +667,26 @@ class Topic(models.Model):
             visualizations_qs = visualizations_rel.filter(is_deleted=False).select_related(
                 "insight"
             ).order_by("created_at")
-            if visualizations_qs.exists():
-                visualization_sections = []
-                for visualization in visualizations_qs:
-                    try:
-                        chart_payload = json.dumps(
-                            visualization.chart_data, indent=2, sort_keys=True
-                        )
-                    except TypeError:
-                        chart_payload = str(visualization.chart_data)
-                    title = (
-                        visualization.chart_type.title()
-                        if visualization.chart_type
-                        else "Visualization"
+            visualization_sections = []
+            for visualization in visualizations_qs:
+                try:
+                    chart_payload = json.dumps(
+                        visualization.chart_data, indent=2, sort_keys=True
+                    )
+                except TypeError:
+                    chart_payload = str(visualization.chart_data)
+                title = (
+                    visualization.chart_type.title()
+                    if visualization.chart_type
+                    else "Visualization"
+                )
+                section_lines = [f"### {title}", chart_payload]
+                if visualization.insight_id and visualization.insight:
+                    section_lines.insert(
+                        1, f"Insight: {visualization.insight.insight}"
                     )
-                    section_lines = [f"### {title}", chart_payload]
-                    if visualization.insight_id and visualization.insight:
-                        section_lines.insert(
-                            1, f"Insight: {visualization.insight.insight}"
-                        )
-                    visualization_sections.append("\n\n".join(section_lines))
-                append_section("Data Visualizations", "\n\n".join(visualization_sections))
+                visualization_sections.append("\n\n".join(section_lines))
+            append_section("Data Visualizations", "\n\n".join(visualization_sections))
 
         return "".join(parts)
 
@@ -746,25 +749,28 @@ class Topic(models.Model):
             status="draft",
         )
 
-        for relation in RelatedEvent.objects.filter(topic=self, is_deleted=False):
-            RelatedEvent.objects.create(
-                topic=cloned,
-                event=relation.event,
-                source=relation.source,
-            )
+        RelatedEvent.objects.bulk_create(
+            RelatedEvent(topic=cloned, event_id=event_id, source=source)
+            for event_id, source in RelatedEvent.objects.filter(
+                topic=self, is_deleted=False
+            ).values_list("event_id", "source")
+        )
 
-        for recap in self.recaps.filter(is_deleted=False):
-            TopicRecap.objects.create(
-                topic=cloned, recap=recap.recap, status="finished"
+        TopicRecap.objects.bulk_create(
+            TopicRecap(topic=cloned, recap=recap, status="finished")
+            for recap in self.recaps.filter(is_deleted=False).values_list(
+                "recap", flat=True
             )
+        )
 
-        for relation in self.related_entities.filter(is_deleted=False):
-            RelatedEntity.objects.create(
-                topic=cloned,
-                entity=relation.entity,
-                role=relation.role,
-                source=relation.source,
+        RelatedEntity.objects.bulk_create(
+            RelatedEntity(
+                topic=cloned, entity_id=entity_id, role=role, source=source
             )
+            for entity_id, role, source in self.related_entities.filter(
+                is_deleted=False
+            ).values_list("entity_id", "role", "source")
+        )
 
         for link in self.topic_related_topics.filter(is_deleted=False):
             RelatedTopic.objects.create(
@@ -827,6 +833,16 @@ class TopicRecap(models.Model):
     error_message = models.TextField(blank=True, null=True)
     error_code = models.CharField(blank=True, null=True, max_length=20)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["topic", "-created_at"], name="topicrecap_topic_created_idx"),
+            models.Index(
+                fields=["topic", "created_at"],
+                condition=Q(status="finished", is_deleted=False),
+                name="topicrecap_finished_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"Recap for {self.topic}"
 
@@ -856,6 +872,12 @@ class TopicSectionSuggestion(models.Model):
 
     class Meta:
         ordering = ["-created_at", "-id"]
+        indexes = [
+            models.Index(
+                fields=["topic", "-created_at", "-id"],
+                name="sectionsugg_topic_created_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Section suggestion for {self.topic}"
@@ -1006,6 +1028,13 @@ class TopicSection(models.Model):
 
     class Meta:
         ordering = ("draft_display_order", "published_at", "id")
+        indexes = [
+            models.Index(
+                fields=["topic", "draft_display_order"],
+                condition=Q(is_deleted=False, is_draft_deleted=False),
+                name="topicsection_active_order_idx",
+            ),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - trivial
         widget_name = self.widget_name or "unknown"
@@ -1260,6 +1289,7 @@ class RelatedEntity(models.Model):
     )
     is_deleted = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     @property
     def entity_name(self) -> str:
@@ -1277,6 +1307,9 @@ class RelatedEntity(models.Model):
                 name="unique_topic_related_entity",
             )
         ]
+        indexes = [
+            models.Index(fields=["topic", "-created_at"], name="relentity_topic_created_idx"),
+        ]
         ordering = ["-created_at"]
 
     def __str__(self):
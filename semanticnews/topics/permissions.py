@@ -0,0 +1,31 @@
+from ninja.errors import HttpError
+
+from .models import Topic
+
+
+def require_owned_topic(request, topic_uuid, *, with_embedding: bool = False) -> Topic:
+    """Return the topic identified by ``topic_uuid`` if the requester owns it.
+
+    Raises ``HttpError`` 401 for anonymous users, 404 for unknown topics and
+    403 when the topic belongs to someone else. The embedding vector is
+    deferred unless ``with_embedding`` is set, since most handlers only need
+    the topic for ownership and foreign keys.
+    """
+
+    user = getattr(request, "user", None)
+    if not user or not user.is_authenticated:
+        raise HttpError(401, "Unauthorized")
+
+    queryset = Topic.objects.all()
+    if not with_embedding:
+        queryset = queryset.defer("embedding")
+
+    try:
+        topic = queryset.get(uuid=topic_uuid)
+    except Topic.DoesNotExist:
+        raise HttpError(404, "Topic not found")
+
+    if topic.created_by_id != user.id:
+        raise HttpError(403, "Forbidden")
+
+    return topic
@@ -1,8 +0,0 @@
-"""Admin stubs for the topics.recaps package.
-
-The original admin module was removed when the recap app moved, but the
-main topics admin still imports it for side effects.  Defining this module
-prevents import errors during app initialization.
-"""
-
-__all__ = []
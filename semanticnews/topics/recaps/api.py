@@ -1,18 +1,22 @@
 from datetime import datetime
-from typing import Optional, Literal, List, Iterable
+from functools import partial
+from typing import Optional, Literal, List
 
-from django.conf import settings
-from django.utils.timezone import make_naive
+from django.db import transaction
+from django.db.models import DateTimeField
+from django.db.models.expressions import RawSQL
+from django.utils.timezone import get_current_timezone_name
 from ninja import Router, Schema
 from ninja.errors import HttpError
 
-from ..models import Topic, TopicRecap
-from semanticnews.openai import OpenAI
-from semanticnews.prompting import append_default_language_instruction
+from ..models import TopicRecap
+from ..permissions import require_owned_topic
+from ..tasks import generate_recap
+from .services import write_draft_recap
 
 router = Router()
 
-StatusLiteral = Literal["finished", "error"]
+StatusLiteral = Literal["in_progress", "finished", "error"]
 
 
 class TopicRecapCreateRequest(Schema):
@@ -33,149 +37,40 @@ class TopicRecapCreateResponse(Schema):
     error_code: Optional[str] = None
 
 
-class _TopicRecapResponse(Schema):
-    recap: str
-
-
-def _get_current_recap(topic: Topic) -> Optional[TopicRecap]:
-    """Return the recap instance currently being edited for ``topic``.
-
-    Prefer the most recent non-deleted recap that has not been published yet
-    (the working draft). When none exists (for example, legacy data that only
-    has published recaps), create an unsaved draft copy from the latest
-    published recap so edits never modify the published text.
-    """
-
-    current = (
-        TopicRecap.objects
-        .filter(topic=topic, is_deleted=False, published_at__isnull=True)
-        .order_by("-created_at")
-        .first()
-    )
-    if current:
-        return current
-
-    published = (
-        TopicRecap.objects
-        .filter(topic=topic, is_deleted=False, published_at__isnull=False)
-        .order_by("-published_at", "-created_at")
-        .first()
-    )
-    if published:
-        return TopicRecap(topic=topic, recap=published.recap, status=published.status)
-
-    return None
-
-
-def _save_recap(instance: TopicRecap, *, update_fields: Iterable[str]) -> TopicRecap:
-    """Persist ``instance`` handling new vs existing records safely."""
-
-    is_new = instance.pk is None
-    if is_new:
-        instance.save()
-    else:
-        instance.save(update_fields=list(update_fields))
-    return instance
-
-
-@router.post("/create", response=TopicRecapCreateResponse)
+@router.post(
+    "/create",
+    response={200: TopicRecapCreateResponse, 202: TopicRecapCreateResponse},
+)
 def create_recap(request, payload: TopicRecapCreateRequest):
-    """Create a recap or return an AI-generated suggestion."""
+    """Create a recap or queue an AI-generated one.
 
-    user = getattr(request, "user", None)
-    if not user or not user.is_authenticated:
-        raise HttpError(401, "Unauthorized")
+    Manual recaps are saved immediately and answered with ``200``. AI
+    suggestions are queued and answered with ``202 Accepted``; clients follow
+    the draft's status until the worker finishes it.
+    """
 
-    try:
-        topic = Topic.objects.get(uuid=payload.topic_uuid)
-    except Topic.DoesNotExist:
-        raise HttpError(404, "Topic not found")
+    topic = require_owned_topic(request, payload.topic_uuid)
 
     if payload.recap is not None:
-        recap_text = payload.recap
-        recap_obj = _get_current_recap(topic)
-        if recap_obj is None:
-            recap_obj = TopicRecap(topic=topic)
-
-        recap_obj.topic = topic
-        recap_obj.recap = recap_text
-        recap_obj.status = "finished"
-        recap_obj.error_message = None
-        recap_obj.error_code = None
-        update_fields: Iterable[str]
-        if recap_obj.pk is None:
-            update_fields = ("topic", "recap", "status", "error_message", "error_code")
-        else:
-            update_fields = ("recap", "status", "error_message", "error_code")
-        recap_obj = _save_recap(recap_obj, update_fields=update_fields)
-        status: StatusLiteral = recap_obj.status  # always "finished" for manual updates
+        recap_obj = write_draft_recap(topic, recap=payload.recap, status="finished")
+        status: StatusLiteral = "finished"
         return TopicRecapCreateResponse(recap=recap_obj.recap, status=status)
 
-    recap_obj = _get_current_recap(topic)
-    if recap_obj is None:
-        recap_obj = TopicRecap(topic=topic)
-
-    recap_obj.topic = topic
-    recap_obj.recap = ""
-    recap_obj.status = "in_progress"
-    recap_obj.error_message = None
-    recap_obj.error_code = None
-    if recap_obj.pk is None:
-        _save_recap(
-            recap_obj,
-            update_fields=("topic", "recap", "status", "error_message", "error_code"),
-        )
-    else:
-        _save_recap(
-            recap_obj,
-            update_fields=("recap", "status", "error_message", "error_code"),
-        )
-
-    context_override = (payload.context or "").strip()
-    content_md = context_override or topic.build_context()
+    # Generation runs in a worker; the in_progress draft is what the topic
+    # page's generation-status poller watches until the task settles it.
+    recap_obj = write_draft_recap(topic, recap="", status="in_progress")
 
-    prompt = (
-        f"Below is a list of events and contents related to {topic.title}."
-        " Provide a concise, coherent recap summarizing the essential narrative and main points. "
-        "Respond in Markdown and highlight key entities by making them **bold**. "
-        "Give paragraph breaks where appropriate. Do not use any other formatting such as lists, titles, etc. "
+    transaction.on_commit(
+        partial(
+            generate_recap.delay,
+            recap_obj.id,
+            instructions=payload.instructions,
+            context=payload.context,
+        )
     )
-    instructions = (payload.instructions or "").strip()
-    if instructions:
-        prompt += "\n\nFollow these additional instructions while drafting the recap:\n"
-        prompt += instructions
-    prompt = append_default_language_instruction(prompt)
-    prompt += f"\n\n{content_md}"
-
-    try:
-        with OpenAI() as client:
-            response = client.responses.parse(
-                model=settings.DEFAULT_AI_MODEL,
-                input=prompt,
-                text_format=_TopicRecapResponse,
-            )
-
-        recap_text = response.output_parsed.recap
-        recap_obj.recap = recap_text
-        recap_obj.status = "finished"
-        recap_obj.error_message = None
-        recap_obj.error_code = None
-        recap_obj.save(update_fields=["recap", "status", "error_message", "error_code"])
-
-        status: StatusLiteral = "finished"
-        return TopicRecapCreateResponse(recap=recap_text, status=status)
 
-    except Exception as e:
-        error_code = getattr(e, "code", None) or "openai_error"
-        error_message = str(e)
-
-        recap_obj.status = "error"
-        recap_obj.error_message = error_message
-        recap_obj.error_code = error_code
-        recap_obj.save(update_fields=["status", "error_message", "error_code"])
-
-        status: StatusLiteral = "error"
-        return TopicRecapCreateResponse(recap=recap_obj.recap or "", status=status)
+    status: StatusLiteral = "in_progress"
+    return 202, TopicRecapCreateResponse(recap="", status=status)
 
 
 class TopicRecapItem(Schema):
@@ -190,34 +85,55 @@ class TopicRecapListResponse(Schema):
 
 
 @router.get("/{topic_uuid}/list", response=TopicRecapListResponse)
-def list_recaps(request, topic_uuid: str):
-    user = getattr(request, "user", None)
-    if not user or not user.is_authenticated:
-        raise HttpError(401, "Unauthorized")
-    try:
-        topic = Topic.objects.get(uuid=topic_uuid)
-    except Topic.DoesNotExist:
-        raise HttpError(404, "Topic not found")
-    if topic.created_by_id != user.id:
-        raise HttpError(403, "Forbidden")
-
-    recaps_qs = (
-        TopicRecap.objects
-        .filter(topic=topic, status="finished", is_deleted=False)
-        .order_by("created_at")
+def list_recaps(
+    request, topic_uuid: str, limit: Optional[int] = None, offset: int = 0
+):
+    """Return a topic's finished recaps, oldest first.
+
+    Every recap is returned unless ``limit`` is given, in which case only the
+    ``limit`` most recent ones are; ``offset`` skips that many of the newest
+    recaps. ``total`` always counts every finished recap of the topic.
+    """
+
+    if (limit is not None and limit < 1) or offset < 0:
+        raise HttpError(400, "Invalid pagination parameters")
+
+    topic = require_owned_topic(request, topic_uuid)
+
+    recaps_qs = TopicRecap.objects.filter(
+        topic=topic, status="finished", is_deleted=False
     )
 
-    recaps = recaps_qs.values("id", "recap", "created_at")
+    # Convert to local wall-clock time in SQL rather than calling make_naive()
+    # on every row.
+    created_local = RawSQL(
+        f'"{TopicRecap._meta.db_table}"."created_at" AT TIME ZONE %s',
+        (get_current_timezone_name(),),
+        output_field=DateTimeField(),
+    )
+    rows = (
+        recaps_qs.annotate(created_local=created_local)
+        .order_by("-created_at")
+        .values_list("id", "recap", "created_local")
+    )
+    end = offset + limit if limit is not None else None
+    recaps = list(rows[offset:end])
+    recaps.reverse()
+
+    # When the fetched rows run out before the page does, they already reach
+    # the oldest recap, so only count when there may be more.
+    if offset == 0 and (limit is None or len(recaps) < limit):
+        total = len(recaps)
+    else:
+        total = recaps_qs.count()
 
+    # Ninja validates the response against TopicRecapListResponse on the way
+    # out, so plain dicts avoid building each item as a schema first.
     items = [
-        TopicRecapItem(
-            id=r["id"],
-            recap=r["recap"],
-            created_at=make_naive(r["created_at"]),
-        )
-        for r in recaps
+        {"id": recap_id, "recap": recap, "created_at": created_at}
+        for recap_id, recap, created_at in recaps
     ]
-    return TopicRecapListResponse(total=len(items), items=items)
+    return {"total": total, "items": items}
 
 
 @router.delete("/{recap_id}", response={204: None})
@@ -226,17 +142,14 @@ def delete_recap(request, recap_id: int):
     if not user or not user.is_authenticated:
         raise HttpError(401, "Unauthorized")
 
-    try:
-        recap = TopicRecap.objects.select_related("topic").get(id=recap_id)
-    except TopicRecap.DoesNotExist:
+    # Soft-delete in a single UPDATE scoped to the owner's topics; only a miss
+    # needs a second query to tell "not found" from "not yours".
+    updated = TopicRecap.objects.filter(
+        id=recap_id, topic__created_by_id=user.id
+    ).update(is_deleted=True)
+    if not updated:
+        if TopicRecap.objects.filter(id=recap_id).exists():
+            raise HttpError(403, "Forbidden")
         raise HttpError(404, "Recap not found")
 
-    if recap.topic.created_by_id != user.id:
-        raise HttpError(403, "Forbidden")
-
-    if recap.is_deleted:
-        return 204, None
-
-    recap.is_deleted = True
-    recap.save(update_fields=["is_deleted"])
     return 204, None
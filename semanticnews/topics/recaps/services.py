@@ -0,0 +1,30 @@
+"""Service layer utilities for topic recaps."""
+
+from ..models import Topic, TopicRecap
+
+
+def write_draft_recap(topic: Topic, *, recap: str, status: str) -> TopicRecap:
+    """Store ``recap`` as the topic's working draft and return it.
+
+    The working draft is the most recent non-deleted recap that has not been
+    published yet; when none exists a new one is created, so edits never
+    modify published text. Its previous contents are always overwritten, so
+    only the draft's id is loaded.
+    """
+
+    draft = (
+        TopicRecap.objects
+        .filter(topic=topic, is_deleted=False, published_at__isnull=True)
+        .order_by("-created_at")
+        .only("id")
+        .first()
+    )
+    if draft is None:
+        return TopicRecap.objects.create(topic=topic, recap=recap, status=status)
+
+    draft.recap = recap
+    draft.status = status
+    draft.error_message = None
+    draft.error_code = None
+    draft.save(update_fields=["recap", "status", "error_message", "error_code"])
+    return draft
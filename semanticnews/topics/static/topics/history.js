@@ -782,6 +782,15 @@ window.setupTopicHistory = function (options) {
           throw new Error(errorMessage);
         }
 
+        if (data && data.status === 'in_progress' && typeof window.watchGenerationStatus === 'function') {
+          // Generated in the background; the status checker reloads the
+          // history and settles the button once the task finishes.
+          setButtonError(null);
+          clearStatusMessage();
+          window.watchGenerationStatus();
+          return;
+        }
+
         controller && controller.showSuccess();
         setButtonError(null);
         clearStatusMessage();
@@ -47,6 +47,7 @@
   const deleteButtonSelector = '[data-remove-reference]';
 
   let pendingDeleteId = null;
+  let pendingReferencesTimer = null;
   let suggestionsPollTimer = null;
   let suggestionsState = 'idle';
   let latestSuggestionPayload = null;
@@ -164,6 +165,7 @@
     el.className = 'list-group-item d-flex gap-2 justify-content-between align-items-start';
     el.dataset.referenceItem = 'true';
     el.dataset.linkId = item.id;
+    if (item.fetch_status) el.dataset.fetchStatus = item.fetch_status;
     if (item.uuid) el.dataset.referenceUuid = item.uuid;
     else if (item.reference_uuid) el.dataset.referenceUuid = item.reference_uuid;
 
@@ -234,6 +236,7 @@
       }
       data.forEach((item) => listEl.appendChild(buildItem(item)));
       updateSuggestionsVisibility();
+      schedulePendingReferencesPoll();
     } catch (err) {
       console.error(err);
       renderEmptyState();
@@ -241,6 +244,39 @@
     }
   }
 
+  function hasPendingReferences() {
+    return Boolean(listEl?.querySelector('[data-fetch-status="pending"]'));
+  }
+
+  // Newly added references are fetched in the background; poll the list
+  // until their metadata arrives and swap the placeholder cards for it.
+  function schedulePendingReferencesPoll(attempt = 0) {
+    const pollInterval = 2000;
+    const maxAttempts = 30;
+
+    if (pendingReferencesTimer || attempt >= maxAttempts || !hasPendingReferences()) return;
+    pendingReferencesTimer = setTimeout(() => {
+      pendingReferencesTimer = null;
+      refreshPendingReferences(attempt);
+    }, pollInterval);
+  }
+
+  async function refreshPendingReferences(attempt) {
+    if (!topicUuid || !listEl) return;
+
+    try {
+      const data = await api(`/api/topics/${topicUuid}/references`);
+      (Array.isArray(data) ? data : []).forEach((item) => {
+        if (item.fetch_status === 'pending') return;
+        const row = listEl.querySelector(`[data-link-id="${item.id}"][data-fetch-status="pending"]`);
+        if (row) row.replaceWith(buildItem(item));
+      });
+    } catch (err) {
+      console.error(err);
+    }
+    schedulePendingReferencesPoll(attempt + 1);
+  }
+
   function getSectionEntries() {
     return Array.from(document.querySelectorAll('[data-topic-widget-entry][data-widget-section-id]'));
   }
@@ -565,8 +601,10 @@
         if (listEl.children.length === 1 && listEl.firstElementChild?.classList.contains('text-secondary')) {
           listEl.innerHTML = '';
         }
+        listEl.querySelector(`[data-link-id="${data.id}"]`)?.remove();
         listEl.prepend(buildItem(data));
         updateSuggestionsVisibility();
+        schedulePendingReferencesPoll();
       }
       form.reset();
     } catch (err) {
@@ -170,6 +170,13 @@ document.addEventListener('DOMContentLoaded', () => {
     }
   };
 
+  // Lets other scripts resume polling after queueing a new generation.
+  window.watchGenerationStatus = () => {
+    if (intervalId) return;
+    fetchStatus();
+    intervalId = setInterval(fetchStatus, 3000);
+  };
+
   neutralizeStaleInitial();
   fetchStatus();
   intervalId = setInterval(fetchStatus, 3000);
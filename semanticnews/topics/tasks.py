@@ -3,13 +3,19 @@ from typing import Any, Iterable, List, Optional, Sequence
 
 from celery import shared_task
 from django.conf import settings
+from django.db import transaction
 from pydantic import BaseModel, Field
 
 from semanticnews.openai import OpenAI
 from semanticnews.prompting import append_default_language_instruction
 from semanticnews.references.models import TopicReference
 
-from .models import Topic, TopicSectionSuggestion
+from .entities import (
+    normalize_related_entities,
+    save_related_entities,
+    suggest_related_entities,
+)
+from .models import Source, Topic, TopicRecap, TopicSectionSuggestion
 
 
 class TopicSectionSuggestionCreate(BaseModel):
@@ -217,7 +223,7 @@ def _validate_suggestions(
 @shared_task(name="topics.generate_section_suggestions")
 def generate_section_suggestions(topic_uuid: str) -> dict:
     try:
-        topic = Topic.objects.get(uuid=topic_uuid)
+        topic = Topic.objects.defer("embedding").get(uuid=topic_uuid)
     except Topic.DoesNotExist:
         return {"success": False, "message": "Topic not found."}
 
@@ -270,3 +276,98 @@ def generate_section_suggestions(topic_uuid: str) -> dict:
         "message": "Section suggestions generated successfully.",
         "payload": suggestion.payload,
     }
+
+
+class _TopicRecapResponse(BaseModel):
+    recap: str
+
+
+_RECAP_PROMPT = (
+    "Below is a list of events and contents related to {title}."
+    " Provide a concise, coherent recap summarizing the essential narrative and main points. "
+    "Respond in Markdown and highlight key entities by making them **bold**. "
+    "Give paragraph breaks where appropriate. Do not use any other formatting such as lists, titles, etc. "
+)
+
+_RECAP_INSTRUCTIONS_PROMPT = (
+    "\n\nFollow these additional instructions while drafting the recap:\n{instructions}"
+)
+
+
+def _build_recap_prompt(
+    topic: Topic, *, instructions: Optional[str] = None, context: Optional[str] = None
+) -> str:
+    content_md = (context or "").strip() or topic.build_context()
+
+    prompt = _RECAP_PROMPT.format(title=topic.title)
+    instructions = (instructions or "").strip()
+    if instructions:
+        prompt += _RECAP_INSTRUCTIONS_PROMPT.format(instructions=instructions)
+    prompt = append_default_language_instruction(prompt)
+    return f"{prompt}\n\n{content_md}"
+
+
+@shared_task(name="topics.generate_recap")
+def generate_recap(
+    recap_id: int, instructions: Optional[str] = None, context: Optional[str] = None
+) -> dict:
+    """Fill an ``in_progress`` recap draft with an AI-generated recap."""
+
+    try:
+        # Only the topic is needed to build the prompt; the draft's own text is
+        # replaced below without being read.
+        recap = (
+            TopicRecap.objects.select_related("topic")
+            .defer("recap", "topic__embedding")
+            .get(id=recap_id)
+        )
+    except TopicRecap.DoesNotExist:
+        return {"success": False, "message": "Recap not found."}
+
+    prompt = _build_recap_prompt(recap.topic, instructions=instructions, context=context)
+
+    try:
+        with OpenAI() as client:
+            response = client.responses.parse(
+                model=settings.DEFAULT_AI_MODEL,
+                input=prompt,
+                text_format=_TopicRecapResponse,
+            )
+        result = {
+            "recap": response.output_parsed.recap,
+            "status": "finished",
+            "error_message": None,
+            "error_code": None,
+        }
+    except Exception as exc:
+        result = {
+            "status": "error",
+            "error_message": str(exc),
+            "error_code": getattr(exc, "code", None) or "openai_error",
+        }
+
+    # A single UPDATE, guarded so a manual save made while the model was
+    # running is not overwritten.
+    updated = TopicRecap.objects.filter(id=recap_id, status="in_progress").update(
+        **result
+    )
+    if not updated:
+        return {"success": False, "message": "Recap is no longer in progress."}
+    return {"success": result["status"] == "finished", "status": result["status"]}
+
+
+@shared_task(name="topics.extract_related_entities")
+def extract_related_entities(topic_id: int) -> dict:
+    """Replace a topic's agent-suggested entity relations with fresh ones."""
+
+    try:
+        topic = Topic.objects.defer("embedding").get(id=topic_id)
+    except Topic.DoesNotExist:
+        return {"success": False, "message": "Topic not found."}
+
+    entries = normalize_related_entities(suggest_related_entities(topic))
+    with transaction.atomic():
+        relations = save_related_entities(
+            topic=topic, entries=entries, source=Source.AGENT
+        )
+    return {"success": True, "count": len(relations)}
@@ -6,6 +6,7 @@ import shutil
 import json
 import re
 
+from django.core.cache import cache
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.urls import reverse
@@ -13,8 +14,9 @@ from django.utils import timezone
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
 
-from semanticnews.agenda.models import Event
+from semanticnews.agenda.models import Category, Event, Source as AgendaSource
 from semanticnews.prompting import get_default_language_instruction
+from semanticnews.testing import EmbeddingMockMixin
 
 from .models import (
     Topic,
@@ -26,14 +28,15 @@ from .models import (
     TopicRecap,
     TopicSection,
 )
-from semanticnews.entities.models import Entity
+from semanticnews.entities.models import Description, Entity
 from semanticnews.keywords.models import Keyword
 from semanticnews.widgets.images.models import TopicImage
 from semanticnews.widgets.models import Widget
 from semanticnews.widgets.mcps.models import MCPServer
 from semanticnews.widgets.data.models import TopicData, TopicDataInsight, TopicDataVisualization
 from .publishing import publish_topic
-from .api import RelatedEntityInput
+from .tasks import extract_related_entities, generate_recap
+from .entities import RelatedEntityInput, suggest_related_entities
 
 
 class TopicEmbeddingTests(TestCase):
@@ -402,6 +405,189 @@ class AddEventToTopicAPITests(TestCase):
         self.assertEqual(cloned.events.first(), event)
 
 
+class CreateTopicEventsAPITests(TestCase):
+    """Tests for relating a batch of timeline events to a topic."""
+
+    @patch("semanticnews.topics.models.Topic.get_embedding", return_value=[0.0] * 1536)
+    @patch("semanticnews.agenda.models.Event.get_embedding", return_value=[0.0] * 1536)
+    def test_links_new_and_restores_deleted_events(
+        self, mock_event_embedding, mock_topic_embedding
+    ):
+        User = get_user_model()
+        user = User.objects.create_user("user", "user@example.com", "password")
+        self.client.force_login(user)
+
+        topic = Topic.objects.create(title="My Topic", created_by=user)
+        first = Event.objects.create(title="First", date="2024-01-01")
+        second = Event.objects.create(title="Second", date="2024-01-02")
+        RelatedEvent.objects.create(topic=topic, event=second, is_deleted=True)
+
+        payload = {
+            "topic_uuid": str(topic.uuid),
+            "event_uuids": [str(second.uuid), str(first.uuid)],
+        }
+        response = self.client.post(
+            "/api/topics/timeline/create", payload, content_type="application/json"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [item["title"] for item in response.json()], ["Second", "First"]
+        )
+        links = RelatedEvent.objects.filter(topic=topic)
+        self.assertEqual(links.count(), 2)
+        self.assertFalse(links.filter(is_deleted=True).exists())
+        self.assertEqual(set(links.values_list("source", flat=True)), {"agent"})
+
+    @patch("semanticnews.topics.models.Topic.get_embedding", return_value=[0.0] * 1536)
+    def test_unknown_event_links_nothing(self, mock_topic_embedding):
+        User = get_user_model()
+        user = User.objects.create_user("user", "user@example.com", "password")
+        self.client.force_login(user)
+        topic = Topic.objects.create(title="My Topic", created_by=user)
+
+        payload = {
+            "topic_uuid": str(topic.uuid),
+            "event_uuids": ["00000000-0000-0000-0000-000000000000"],
+        }
+        response = self.client.post(
+            "/api/topics/timeline/create", payload, content_type="application/json"
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(RelatedEvent.objects.filter(topic=topic).exists())
+
+
+class SuggestTopicEventsAPITests(TestCase):
+    """Tests for AI-suggested timeline events."""
+
+    @patch("semanticnews.topics.api.OpenAI")
+    @patch("semanticnews.topics.models.Topic.get_embedding", return_value=[0.0] * 1536)
+    def test_creates_events_with_shared_sources_and_categories(
+        self, mock_topic_embedding, mock_openai
+    ):
+        mock_client = MagicMock()
+        mock_openai.return_value.__enter__.return_value = mock_client
+        mock_client.responses.parse.return_value.output_parsed.events = [
+            SimpleNamespace(
+                title="First",
+                date="2024-01-01",
+                categories=["Politics"],
+                sources=["https://example.com/a", "https://example.com/a"],
+            ),
+            SimpleNamespace(
+                title="Second",
+                date="2024-01-02",
+                categories=["Politics", "Economy"],
+                sources=["https://www.example.org/b"],
+            ),
+        ]
+        mock_client.embeddings.create.return_value = SimpleNamespace(
+            data=[
+                SimpleNamespace(embedding=[0.0] * 1536),
+                SimpleNamespace(embedding=[1.0] * 1536),
+            ]
+        )
+
+        User = get_user_model()
+        user = User.objects.create_user("user", "user@example.com", "password")
+        self.client.force_login(user)
+        topic = Topic.objects.create(title="My Topic", created_by=user)
+        existing = AgendaSource.objects.create(url="https://example.com/a")
+
+        response = self.client.post(
+            "/api/topics/timeline/suggest",
+            {"topic_uuid": str(topic.uuid)},
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        first = Event.objects.get(title="First")
+        second = Event.objects.get(title="Second")
+        self.assertEqual(list(first.sources.all()), [existing])
+        self.assertEqual(second.sources.get().domain, "example.org")
+        self.assertEqual(Category.objects.count(), 2)
+        self.assertEqual(
+            set(second.categories.values_list("name", flat=True)),
+            {"Politics", "Economy"},
+        )
+        mock_client.embeddings.create.assert_called_once()
+
+    @patch("semanticnews.topics.api.OpenAI")
+    @patch("semanticnews.agenda.models.Event.get_embedding", return_value=[0.0] * 1536)
+    @patch("semanticnews.topics.models.Topic.get_embedding", return_value=[0.0] * 1536)
+    def test_skips_suggestions_already_linked_to_the_topic(
+        self, mock_topic_embedding, mock_event_embedding, mock_openai
+    ):
+        mock_client = MagicMock()
+        mock_openai.return_value.__enter__.return_value = mock_client
+        mock_client.responses.parse.return_value.output_parsed.events = [
+            SimpleNamespace(title="KNOWN event", date="2024-01-01", categories=[], sources=[]),
+            SimpleNamespace(title="New event", date="2024-01-02", categories=[], sources=[]),
+        ]
+        mock_client.embeddings.create.return_value = SimpleNamespace(
+            data=[SimpleNamespace(embedding=[1.0] * 1536)]
+        )
+
+        User = get_user_model()
+        user = User.objects.create_user("user", "user@example.com", "password")
+        self.client.force_login(user)
+        topic = Topic.objects.create(title="My Topic", created_by=user)
+        known = Event.objects.create(title="Known Event", date="2024-01-01")
+        RelatedEvent.objects.create(topic=topic, event=known, source=Source.USER)
+
+        response = self.client.post(
+            "/api/topics/timeline/suggest",
+            {"topic_uuid": str(topic.uuid)},
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["title"] for item in response.json()], ["New event"])
+        self.assertEqual(
+            mock_client.embeddings.create.call_args.kwargs["input"],
+            ["New event - 2024-01-02\n"],
+        )
+
+
+class RelatedEventSuggestionsAPITests(TestCase):
+    """Tests for embedding-based related event suggestions."""
+
+    @patch("semanticnews.topics.models.Topic.get_embedding", return_value=None)
+    @patch("semanticnews.agenda.models.Event.get_embedding", return_value=None)
+    def test_skips_linked_events_before_applying_the_limit(self, *mocks):
+        User = get_user_model()
+        user = User.objects.create_user("user", "user@example.com", "password")
+        self.client.force_login(user)
+        close = [1.0] + [0.0] * 1535
+        topic = Topic.objects.create(title="My Topic", created_by=user)
+        Topic.objects.filter(pk=topic.pk).update(embedding=close)
+
+        events = {}
+        for title in ("Linked A", "Linked B", "Fresh", "Removed"):
+            events[title] = Event.objects.create(
+                title=title, date="2024-01-01", status="published"
+            )
+        Event.objects.filter(pk__in=[e.pk for e in events.values()]).update(embedding=close)
+        far = Event.objects.create(title="Far", date="2024-01-01", status="published")
+        Event.objects.filter(pk=far.pk).update(embedding=[0.0, 1.0] + [0.0] * 1534)
+        for title in ("Linked A", "Linked B"):
+            RelatedEvent.objects.create(topic=topic, event=events[title], source=Source.USER)
+        RelatedEvent.objects.create(
+            topic=topic, event=events["Removed"], source=Source.USER, is_deleted=True
+        )
+
+        response = self.client.get(
+            f"/api/topics/{topic.uuid}/timeline/related-events/suggest"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            {item["title"] for item in response.json()}, {"Fresh", "Removed"}
+        )
+        self.assertFalse(any(item["is_already_linked"] for item in response.json()))
+
+
 class RemoveEventFromTopicAPITests(TestCase):
     """Tests for the endpoint that removes events from topics."""
 
@@ -444,11 +630,10 @@ class RemoveEventFromTopicAPITests(TestCase):
         self.assertEqual(topic.events.count(), 0)
 
 
-class SetTopicStatusAPITests(TestCase):
+class SetTopicStatusAPITests(EmbeddingMockMixin, TestCase):
     """Tests for the endpoint that updates a topic's status."""
 
-    @patch("semanticnews.topics.models.Topic.get_embedding", return_value=[0.0] * 1536)
-    def test_requires_authentication(self, mock_topic_embedding):
+    def test_requires_authentication(self):
         """Unauthenticated requests should be rejected."""
 
         User = get_user_model()
@@ -461,8 +646,7 @@ class SetTopicStatusAPITests(TestCase):
         )
         self.assertEqual(response.status_code, 401)
 
-    @patch("semanticnews.topics.models.Topic.get_embedding", return_value=[0.0] * 1536)
-    def test_creator_can_publish_topic(self, mock_topic_embedding):
+    def test_creator_can_publish_topic(self):
         """Topic creators can update the status of their topics."""
 
         User = get_user_model()
@@ -481,8 +665,7 @@ class SetTopicStatusAPITests(TestCase):
         topic.refresh_from_db()
         self.assertEqual(topic.status, "published")
 
-    @patch("semanticnews.topics.models.Topic.get_embedding", return_value=[0.0] * 1536)
-    def test_cannot_publish_topic_without_title(self, mock_topic_embedding):
+    def test_cannot_publish_topic_without_title(self):
         """Publishing a topic without a title should be rejected."""
 
         User = get_user_model()
@@ -504,8 +687,7 @@ class SetTopicStatusAPITests(TestCase):
         topic.refresh_from_db()
         self.assertEqual(topic.status, "draft")
 
-    @patch("semanticnews.topics.models.Topic.get_embedding", return_value=[0.0] * 1536)
-    def test_cannot_publish_topic_without_recap(self, mock_topic_embedding):
+    def test_cannot_publish_topic_without_recap(self):
         """Publishing requires at least one completed recap."""
 
         User = get_user_model()
@@ -527,27 +709,7 @@ class SetTopicStatusAPITests(TestCase):
         topic.refresh_from_db()
         self.assertEqual(topic.status, "draft")
 
-    @patch("semanticnews.topics.models.Topic.get_embedding", return_value=[0.0] * 1536)
-    def test_cannot_publish_topic_without_recap(self, mock_topic_embedding):
-        """Publishing requires at least one completed recap."""
-
-        User = get_user_model()
-        user = User.objects.create_user("user", "user@example.com", "password")
-        self.client.force_login(user)
-
-        topic = Topic.objects.create(title="My Topic", created_by=user)
-
-        payload = {"topic_uuid": str(topic.uuid), "status": "published"}
-        response = self.client.post(
-            "/api/topics/set-status", payload, content_type="application/json",
-        )
-
-        self.assertEqual(response.status_code, 400)
-        topic.refresh_from_db()
-        self.assertEqual(topic.status, "draft")
-
-    @patch("semanticnews.topics.models.Topic.get_embedding", return_value=[0.0] * 1536)
-    def test_non_creator_cannot_publish_topic(self, mock_topic_embedding):
+    def test_non_creator_cannot_publish_topic(self):
         """Only the creator can change the topic status."""
 
         User = get_user_model()
@@ -571,39 +733,72 @@ class SetTopicStatusAPITests(TestCase):
 class CreateRecapAPITests(TestCase):
     """Tests for the recap creation API endpoint."""
 
-    @patch("semanticnews.topics.recaps.api.OpenAI")
+    @patch("semanticnews.topics.recaps.api.generate_recap.delay")
     @patch(
         "semanticnews.topics.models.Topic.get_embedding",
         return_value=[0.0] * 1536,
     )
-    def test_returns_ai_suggestion_and_updates_recap(
-        self, mock_topic_embedding, mock_openai
-    ):
-        mock_client = MagicMock()
-        mock_openai.return_value.__enter__.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.output_parsed = {"recap": "Recap"}
-        mock_client.responses.parse.return_value = mock_response
-
+    def test_queues_ai_recap_generation(self, mock_topic_embedding, mock_delay):
         User = get_user_model()
         user = User.objects.create_user("user", "user@example.com", "password")
         self.client.force_login(user)
 
         topic = Topic.objects.create(title="My Topic", created_by=user)
 
-        payload = {"topic_uuid": str(topic.uuid)}
-        response = self.client.post(
-            "/api/topics/recap/create", payload, content_type="application/json"
+        payload = {"topic_uuid": str(topic.uuid), "instructions": "Be brief"}
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/api/topics/recap/create", payload, content_type="application/json"
+            )
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()["status"], "in_progress")
+        recap = TopicRecap.objects.get()
+        self.assertEqual(recap.status, "in_progress")
+        mock_delay.assert_called_once_with(
+            recap.id, instructions="Be brief", context=None
         )
 
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.json(), {"recap": "Recap"})
-        self.assertEqual(TopicRecap.objects.count(), 1)
-        recap = TopicRecap.objects.first()
+    @patch("semanticnews.topics.tasks.OpenAI")
+    @patch(
+        "semanticnews.topics.models.Topic.get_embedding",
+        return_value=[0.0] * 1536,
+    )
+    def test_generate_recap_task_fills_draft(self, mock_topic_embedding, mock_openai):
+        mock_client = MagicMock()
+        mock_openai.return_value.__enter__.return_value = mock_client
+        mock_client.responses.parse.return_value.output_parsed.recap = "Recap"
+
+        User = get_user_model()
+        user = User.objects.create_user("user", "user@example.com", "password")
+        topic = Topic.objects.create(title="My Topic", created_by=user)
+        recap = TopicRecap.objects.create(topic=topic, recap="", status="in_progress")
+
+        result = generate_recap(recap.id, context="Some context")
+
+        self.assertTrue(result["success"])
+        recap.refresh_from_db()
         self.assertEqual(recap.recap, "Recap")
         self.assertEqual(recap.status, "finished")
         self.assertIsNone(recap.published_at)
 
+    @patch("semanticnews.topics.tasks.OpenAI")
+    def test_generate_recap_task_keeps_manual_edits(self, mock_openai):
+        mock_client = MagicMock()
+        mock_openai.return_value.__enter__.return_value = mock_client
+        mock_client.responses.parse.return_value.output_parsed.recap = "Generated"
+
+        User = get_user_model()
+        user = User.objects.create_user("user", "user@example.com", "password")
+        topic = Topic.objects.create(title="My Topic", created_by=user)
+        recap = TopicRecap.objects.create(topic=topic, recap="Manual", status="finished")
+
+        result = generate_recap(recap.id, context="Some context")
+
+        self.assertFalse(result["success"])
+        recap.refresh_from_db()
+        self.assertEqual(recap.recap, "Manual")
+
     def test_creates_recap_with_provided_text(self):
         User = get_user_model()
         user = User.objects.create_user("user", "user@example.com", "password")
@@ -645,6 +840,144 @@ class CreateRecapAPITests(TestCase):
         self.assertEqual(recap.recap, "Updated recap")
         self.assertIsNone(recap.published_at)
 
+    def test_manual_update_never_overwrites_published_recap(self):
+        User = get_user_model()
+        user = User.objects.create_user("user", "user@example.com", "password")
+        self.client.force_login(user)
+
+        topic = Topic.objects.create(title="My Topic", created_by=user)
+        published = TopicRecap.objects.create(
+            topic=topic, recap="Published", status="finished", published_at=timezone.now()
+        )
+
+        payload = {"topic_uuid": str(topic.uuid), "recap": "Edited"}
+        response = self.client.post(
+            "/api/topics/recap/create", payload, content_type="application/json"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        published.refresh_from_db()
+        self.assertEqual(published.recap, "Published")
+        draft = TopicRecap.objects.get(published_at__isnull=True)
+        self.assertEqual(draft.recap, "Edited")
+
+    def test_cannot_create_recap_for_another_users_topic(self):
+        User = get_user_model()
+        owner = User.objects.create_user("owner", "owner@example.com", "password")
+        other = User.objects.create_user("other", "other@example.com", "password")
+        self.client.force_login(other)
+
+        topic = Topic.objects.create(title="My Topic", created_by=owner)
+
+        payload = {"topic_uuid": str(topic.uuid), "recap": "Hijacked"}
+        response = self.client.post(
+            "/api/topics/recap/create", payload, content_type="application/json"
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(TopicRecap.objects.exists())
+
+
+class ListRecapsAPITests(TestCase):
+    """Tests for the recap listing API endpoint."""
+
+    def test_lists_finished_recaps_in_creation_order(self):
+        User = get_user_model()
+        user = User.objects.create_user("user", "user@example.com", "password")
+        self.client.force_login(user)
+
+        topic = Topic.objects.create(title="My Topic", created_by=user)
+        first = TopicRecap.objects.create(topic=topic, recap="First", status="finished")
+        second = TopicRecap.objects.create(topic=topic, recap="Second", status="finished")
+        TopicRecap.objects.create(topic=topic, recap="Pending", status="in_progress")
+
+        response = self.client.get(f"/api/topics/recap/{topic.uuid}/list")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["total"], 2)
+        self.assertEqual([item["id"] for item in data["items"]], [first.id, second.id])
+        self.assertEqual(data["items"][0]["recap"], "First")
+
+    def test_pages_back_from_the_newest_recaps(self):
+        User = get_user_model()
+        user = User.objects.create_user("user", "user@example.com", "password")
+        self.client.force_login(user)
+
+        topic = Topic.objects.create(title="My Topic", created_by=user)
+        recaps = [
+            TopicRecap.objects.create(topic=topic, recap=f"Recap {i}", status="finished")
+            for i in range(5)
+        ]
+        url = f"/api/topics/recap/{topic.uuid}/list"
+
+        latest = self.client.get(url, {"limit": 2}).json()
+        older = self.client.get(url, {"limit": 2, "offset": 2}).json()
+
+        self.assertEqual(latest["total"], 5)
+        self.assertEqual(
+            [item["id"] for item in latest["items"]], [recaps[3].id, recaps[4].id]
+        )
+        self.assertEqual(
+            [item["id"] for item in older["items"]], [recaps[1].id, recaps[2].id]
+        )
+
+    def test_lists_every_recap_without_a_limit(self):
+        User = get_user_model()
+        user = User.objects.create_user("user", "user@example.com", "password")
+        self.client.force_login(user)
+
+        topic = Topic.objects.create(title="My Topic", created_by=user)
+        recaps = [
+            TopicRecap.objects.create(topic=topic, recap=f"Recap {i}", status="finished")
+            for i in range(25)
+        ]
+
+        data = self.client.get(f"/api/topics/recap/{topic.uuid}/list").json()
+
+        self.assertEqual(data["total"], 25)
+        self.assertEqual(
+            [item["id"] for item in data["items"]], [recap.id for recap in recaps]
+        )
+
+
+class DeleteRecapAPITests(TestCase):
+    """Tests for the recap deletion API endpoint."""
+
+    def setUp(self):
+        User = get_user_model()
+        self.user = User.objects.create_user("user", "user@example.com", "password")
+        self.other = User.objects.create_user("other", "other@example.com", "password")
+        self.topic = Topic.objects.create(title="My Topic", created_by=self.user)
+        self.recap = TopicRecap.objects.create(
+            topic=self.topic, recap="Recap", status="finished"
+        )
+
+    def test_owner_soft_deletes_recap(self):
+        self.client.force_login(self.user)
+
+        response = self.client.delete(f"/api/topics/recap/{self.recap.id}")
+
+        self.assertEqual(response.status_code, 204)
+        self.recap.refresh_from_db()
+        self.assertTrue(self.recap.is_deleted)
+
+    def test_other_user_cannot_delete_recap(self):
+        self.client.force_login(self.other)
+
+        response = self.client.delete(f"/api/topics/recap/{self.recap.id}")
+
+        self.assertEqual(response.status_code, 403)
+        self.recap.refresh_from_db()
+        self.assertFalse(self.recap.is_deleted)
+
+    def test_unknown_recap_returns_404(self):
+        self.client.force_login(self.user)
+
+        response = self.client.delete(f"/api/topics/recap/{self.recap.id + 1000}")
+
+        self.assertEqual(response.status_code, 404)
+
 
 class AnalyzeDataAPITests(TestCase):
     """Tests for the data analysis API endpoint."""
@@ -1379,6 +1712,31 @@ class RelatedTopicModelTests(TestCase):
         self.assertEqual(link.source, RelatedTopic.Source.MANUAL)
         self.assertEqual(link.created_by, clone_user)
 
+    def test_clone_for_user_copies_events_recaps_and_entities(self):
+        topic = Topic.objects.create(title="Original", created_by=self.owner)
+        event = Event.objects.create(title="An Event", date="2024-01-01")
+        removed = Event.objects.create(title="Removed", date="2024-01-02")
+        RelatedEvent.objects.create(topic=topic, event=event, source=Source.AGENT)
+        RelatedEvent.objects.create(topic=topic, event=removed, is_deleted=True)
+        TopicRecap.objects.create(topic=topic, recap="Recap", status="finished")
+        entity = Entity.objects.create(name="Ada")
+        RelatedEntity.objects.create(topic=topic, entity=entity, role="subject")
+
+        clone = topic.clone_for_user(self.other)
+
+        self.assertEqual(
+            list(clone.related_event_links.values_list("event_id", "source")),
+            [(event.id, Source.AGENT)],
+        )
+        self.assertEqual(
+            list(clone.recaps.values_list("recap", "status")),
+            [("Recap", "finished")],
+        )
+        self.assertEqual(
+            list(clone.related_entities.values_list("entity_id", "role")),
+            [(entity.id, "subject")],
+        )
+
     def test_build_context_ignores_related_topics(self):
         topic = Topic.objects.create(title="Primary", created_by=self.owner)
         related = Topic.objects.create(title="Sensitive", created_by=self.other, status="published")
@@ -1391,6 +1749,28 @@ class RelatedTopicModelTests(TestCase):
         context = topic.build_context()
         self.assertNotIn("Sensitive", context)
 
+    def test_build_context_skips_empty_sections(self):
+        topic = Topic.objects.create(title="Primary", created_by=self.owner)
+        event = Event.objects.create(title="An Event", date="2024-01-01")
+        RelatedEvent.objects.create(topic=topic, event=event)
+
+        context = topic.build_context()
+
+        self.assertIn("## Events\n\n- An Event (2024-01-01)", context)
+        self.assertNotIn("## Entities", context)
+        self.assertNotIn("## Recaps", context)
+
+    def test_build_context_uses_latest_entity_description(self):
+        topic = Topic.objects.create(title="Primary", created_by=self.owner)
+        entity = Entity.objects.create(name="Ada", disambiguation="mathematician")
+        Description.objects.create(entity=entity, description="Old")
+        Description.objects.create(entity=entity, description="Current")
+        RelatedEntity.objects.create(topic=topic, entity=entity)
+
+        context = topic.build_context()
+
+        self.assertIn("- Ada (mathematician)\n  Description: Current", context)
+
 
 class TopicSectionModelTests(TestCase):
     def setUp(self):
@@ -1954,7 +2334,7 @@ class RelatedEntityAPITests(TestCase):
         Entity.objects.create(name="Existing", slug="existing")
         RelatedEntity.objects.create(topic=self.topic, entity=Entity.objects.first())
 
-        with patch("semanticnews.topics.api._suggest_related_entities") as mock_suggest:
+        with patch("semanticnews.topics.api.suggest_related_entities") as mock_suggest:
             mock_suggest.return_value = [
                 RelatedEntityInput(name="Suggested", role="Analyst"),
             ]
@@ -1972,6 +2352,36 @@ class RelatedEntityAPITests(TestCase):
         self.assertEqual(active_relations.count(), 1)
         self.assertEqual(active_relations.first().entity.name, "Suggested")
 
+    @patch("semanticnews.topics.entities.OpenAI")
+    def test_entity_suggestions_are_cached_per_prompt(self, mock_openai):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        mock_client = MagicMock()
+        mock_openai.return_value.__enter__.return_value = mock_client
+        mock_client.responses.parse.return_value = SimpleNamespace(
+            output_parsed=SimpleNamespace(
+                entities=[RelatedEntityInput(name="Alice", role="Speaker")]
+            )
+        )
+
+        first = suggest_related_entities(self.topic)
+        second = suggest_related_entities(self.topic)
+
+        self.assertEqual(first, second)
+        self.assertEqual(second[0].name, "Alice")
+        mock_client.responses.parse.assert_called_once()
+
+    def test_extract_task_saves_agent_suggestions(self):
+        with patch("semanticnews.topics.tasks.suggest_related_entities") as mock_suggest:
+            mock_suggest.return_value = [RelatedEntityInput(name="Alice", role="Speaker")]
+            result = extract_related_entities(self.topic.id)
+
+        self.assertEqual(result, {"success": True, "count": 1})
+        relation = RelatedEntity.objects.get(topic=self.topic, is_deleted=False)
+        self.assertEqual(relation.entity.name, "Alice")
+        self.assertEqual(relation.source, "agent")
+        self.assertFalse(extract_related_entities(0)["success"])
+
     def test_repeated_updates_reuse_existing_relations(self):
         self.client.force_login(self.user)
         payload = {
@@ -64,6 +64,28 @@ class TopicWidgetAPITests(TestCase):
         self.assertEqual(section.metadata, {"model": "gpt"})
         self.assertEqual(section.execution_state.get("status"), "queued")
 
+    def test_create_section_appends_after_active_sections(self):
+        TopicSection.objects.create(
+            topic=self.topic, widget_name=self.widget_name, draft_display_order=2
+        )
+        TopicSection.objects.create(
+            topic=self.topic,
+            widget_name=self.widget_name,
+            draft_display_order=7,
+            is_draft_deleted=True,
+        )
+
+        response = self.client.post(
+            "/api/topics/widgets/sections",
+            {"topic_uuid": str(self.topic.uuid), "widget_id": self.widget_name},
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["draft_display_order"], 3)
+        section = TopicSection.objects.get(id=response.json()["id"])
+        self.assertEqual((section.draft_display_order, section.display_order), (3, 3))
+
     def test_execute_reuses_existing_section(self):
         section = TopicSection.objects.create(topic=self.topic, widget_name=self.widget_name)
 
@@ -162,3 +184,33 @@ class TopicWidgetAPITests(TestCase):
         )
 
         self.assertEqual(response.status_code, 404)
+
+    def test_delete_section_marks_draft_deleted(self):
+        section = TopicSection.objects.create(
+            topic=self.topic,
+            widget_name=self.widget_name,
+        )
+
+        response = self.client.delete(f"/api/topics/widgets/sections/{section.id}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"success": True})
+        section.refresh_from_db()
+        self.assertTrue(section.is_draft_deleted)
+        self.assertFalse(section.is_deleted)
+
+    def test_delete_section_rejects_other_users_topic(self):
+        other_user = get_user_model().objects.create_user(
+            "other", "other@example.com", "password"
+        )
+        other_topic = Topic.objects.create(created_by=other_user)
+        section = TopicSection.objects.create(
+            topic=other_topic,
+            widget_name=self.widget_name,
+        )
+
+        response = self.client.delete(f"/api/topics/widgets/sections/{section.id}")
+
+        self.assertEqual(response.status_code, 403)
+        section.refresh_from_db()
+        self.assertFalse(section.is_draft_deleted)
@@ -46,11 +46,7 @@ DRAFT_SECTIONS_PREFETCH = Prefetch(
 
 TOPIC_REFERENCES_PREFETCH = Prefetch(
     "topic_reference_links",
-    queryset=(
-        TopicReference.objects.select_related("reference", "added_by")
-        .filter(is_deleted=False)
-        .order_by("-added_at")
-    ),
+    queryset=TopicReference.objects.for_listing(),
     to_attr="prefetched_topic_reference_links",
 )
 
@@ -160,7 +156,7 @@ def topics_list(request):
 
 
 def topics_detail(request, slug, username):
-    queryset = Topic.objects.prefetch_related(
+    queryset = Topic.objects.select_related("created_by").prefetch_related(
         "events",
         "recaps",
         PUBLISHED_SECTIONS_PREFETCH,
@@ -237,11 +233,9 @@ def _build_topic_module_context(topic, user=None, *, edit_mode=False, include_un
     else:
         suggested_events = Event.objects.none()
 
-    reference_links = getattr(topic, "prefetched_topic_reference_links", None) or (
-        TopicReference.objects.select_related("reference", "added_by")
-        .filter(topic=topic, is_deleted=False)
-        .order_by("-added_at")
-    )
+    reference_links = getattr(topic, "prefetched_topic_reference_links", None)
+    if reference_links is None:
+        reference_links = TopicReference.objects.for_listing().filter(topic=topic)
 
     return {
         "topic": topic,
@@ -445,8 +439,10 @@ def topics_detail_edit(request, topic_uuid, username):
 
     context = _build_topic_page_context(topic, request.user, edit_mode=True)
     if request.user.is_authenticated:
-        context["user_topics"] = Topic.objects.filter(created_by=request.user).exclude(
-            uuid=topic.uuid
+        context["user_topics"] = (
+            Topic.objects.filter(created_by=request.user)
+            .exclude(uuid=topic.uuid)
+            .defer("embedding")
         )
     context["localities"] = get_locality_options()
     context["default_locality_label"] = get_default_locality_label()
@@ -459,7 +455,7 @@ def topics_detail_edit(request, topic_uuid, username):
 
 @login_required
 def topics_detail_preview(request, topic_uuid, username):
-    queryset = Topic.objects.prefetch_related(
+    queryset = Topic.objects.select_related("created_by").prefetch_related(
         DRAFT_SECTIONS_PREFETCH,
         TOPIC_REFERENCES_PREFETCH,
     ).filter(
@@ -482,8 +478,10 @@ def topics_detail_preview(request, topic_uuid, username):
     context.update(_build_topic_metadata(request, topic, context))
 
     if request.user.is_authenticated:
-        context["user_topics"] = Topic.objects.filter(created_by=request.user).exclude(
-            uuid=topic.uuid
+        context["user_topics"] = (
+            Topic.objects.filter(created_by=request.user)
+            .exclude(uuid=topic.uuid)
+            .defer("embedding")
         )
 
     return render(
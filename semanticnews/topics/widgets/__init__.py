@@ -1,4 +1,3 @@
-import pkgutil
 import importlib
 import pkgutil
 from typing import Dict
@@ -8,10 +7,17 @@ from .base import Widget
 WIDGET_REGISTRY: Dict[str, Widget] = {}
 
 
-def load_widgets() -> Dict[str, Widget]:
-    """Auto-discover and register all Widget subclasses under this package."""
+def load_widgets(*, force: bool = False) -> Dict[str, Widget]:
+    """Auto-discover and register all Widget subclasses under this package.
+
+    Discovery runs once at import; later calls return the existing registry
+    unless ``force`` is set, so views can call this on every request.
+    """
     global WIDGET_REGISTRY
 
+    if WIDGET_REGISTRY and not force:
+        return WIDGET_REGISTRY
+
     for _, modname, _ in pkgutil.iter_modules(__path__):
         if modname in {"api", "services"}:
             continue
@@ -7,7 +7,8 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from django.db import transaction
-from django.db.models import Max
+from django.db.models import Max, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.timezone import make_naive
 from django.template.loader import render_to_string
@@ -16,6 +17,7 @@ from ninja.errors import HttpError
 from slugify import slugify
 
 from semanticnews.topics.models import Topic, TopicSection
+from semanticnews.topics.permissions import require_owned_topic
 from semanticnews.topics.widgets import WIDGET_REGISTRY, get_widget, load_widgets
 from semanticnews.topics.widgets.base import Widget, WidgetAction
 from semanticnews.topics.widgets.rendering import build_renderable_section
@@ -238,36 +240,47 @@ def _resolve_widget_identifier(
     return _resolve_widget(str(widget_identifier))
 
 
+def _append_section(topic: Topic, widget_name: str) -> TopicSection:
+    """Create a section placed after the topic's active sections.
+
+    The topic row is locked first, so concurrent appends to the same topic
+    run one after another and each one sees the previous section when the
+    INSERT computes the next position.
+    """
+
+    with transaction.atomic():
+        Topic.objects.filter(pk=topic.pk).select_for_update().values_list(
+            "pk", flat=True
+        ).first()
+        next_order = Coalesce(
+            Subquery(
+                TopicSection.objects.filter(
+                    topic=topic, is_deleted=False, is_draft_deleted=False
+                )
+                .values("topic")
+                .annotate(max_order=Max("draft_display_order"))
+                .values("max_order")
+            ),
+            Value(0),
+        ) + 1
+        section = TopicSection.objects.create(
+            topic=topic,
+            widget_name=widget_name,
+            draft_display_order=next_order,
+            display_order=next_order,
+        )
+    section.refresh_from_db(fields=["draft_display_order", "display_order"])
+    return section
+
+
 def _create_widget_section(
     request, payload: WidgetSectionCreateRequest, *, identifier: str | None = None
 ) -> WidgetSectionCreateResponse:
-    user = getattr(request, "user", None)
-    if not user or not user.is_authenticated:
-        raise HttpError(401, "Unauthorized")
-
-    try:
-        topic = Topic.objects.get(uuid=payload.topic_uuid)
-    except Topic.DoesNotExist:
-        raise HttpError(404, "Topic not found")
-
-    if topic.created_by_id != user.id:
-        raise HttpError(403, "Forbidden")
+    topic = require_owned_topic(request, payload.topic_uuid)
 
     widget = _resolve_widget_identifier(identifier, payload=payload)
 
-    max_order = (
-        TopicSection.objects.filter(topic=topic, is_deleted=False, is_draft_deleted=False)
-        .aggregate(max_order=Max("draft_display_order"))
-        .get("max_order")
-        or 0
-    )
-
-    section = TopicSection.objects.create(
-        topic=topic,
-        widget_name=widget.name,
-        draft_display_order=max_order + 1,
-        display_order=max_order + 1,
-    )
+    section = _append_section(topic, widget.name)
     section._get_or_create_draft_record()
 
     content = payload.content if payload.content is not None else {}
@@ -299,17 +312,7 @@ def create_widget_section_for_identifier(
 
 @router.post("/execute", response=WidgetExecutionResponse)
 def execute_widget_action(request, payload: WidgetExecutionRequest):
-    user = getattr(request, "user", None)
-    if not user or not user.is_authenticated:
-        raise HttpError(401, "Unauthorized")
-
-    try:
-        topic = Topic.objects.get(uuid=payload.topic_uuid)
-    except Topic.DoesNotExist:
-        raise HttpError(404, "Topic not found")
-
-    if topic.created_by_id != user.id:
-        raise HttpError(403, "Forbidden")
+    topic = require_owned_topic(request, payload.topic_uuid)
 
     widget = _resolve_widget(payload.widget_name)
     try:
@@ -327,20 +330,7 @@ def execute_widget_action(request, payload: WidgetExecutionRequest):
             raise HttpError(400, "Topic section is linked to a different widget")
 
     if section is None:
-        max_order = (
-            TopicSection.objects.filter(
-                topic=topic, is_deleted=False, is_draft_deleted=False
-            )
-            .aggregate(max_order=Max("draft_display_order"))
-            .get("max_order")
-            or 0
-        )
-        section = TopicSection.objects.create(
-            topic=topic,
-            widget_name=widget.name,
-            draft_display_order=max_order + 1,
-            display_order=max_order + 1,
-        )
+        section = _append_section(topic, widget.name)
 
     execute_widget_action_task.delay(
         topic_uuid=str(payload.topic_uuid),
@@ -366,13 +356,7 @@ def reorder_widget_sections(request, payload: WidgetSectionReorderRequest):
     if len(payload.section_ids) != len(set(payload.section_ids)):
         raise HttpError(400, "Section identifiers must be unique")
 
-    try:
-        topic = Topic.objects.get(uuid=payload.topic_uuid)
-    except Topic.DoesNotExist:
-        raise HttpError(404, "Topic not found")
-
-    if topic.created_by_id != user.id:
-        raise HttpError(403, "Forbidden")
+    topic = require_owned_topic(request, payload.topic_uuid)
 
     sections = list(
         TopicSection.objects.filter(
@@ -414,17 +398,7 @@ def reorder_widget_sections(request, payload: WidgetSectionReorderRequest):
 
 @router.get("/sections/{section_id}", response=WidgetExecutionResponse)
 def get_execution_status(request, section_id: int, topic_uuid: uuid.UUID):
-    user = getattr(request, "user", None)
-    if not user or not user.is_authenticated:
-        raise HttpError(401, "Unauthorized")
-
-    try:
-        topic = Topic.objects.get(uuid=topic_uuid)
-    except Topic.DoesNotExist:
-        raise HttpError(404, "Topic not found")
-
-    if topic.created_by_id != user.id:
-        raise HttpError(403, "Forbidden")
+    topic = require_owned_topic(request, topic_uuid)
 
     try:
         section = TopicSection.objects.get(id=section_id, topic=topic)
@@ -442,7 +416,11 @@ def delete_widget_section(request, section_id: int):
         raise HttpError(401, "Unauthorized")
 
     try:
-        section = TopicSection.objects.select_related("topic").get(id=section_id)
+        section = (
+            TopicSection.objects.select_related("topic")
+            .only("id", "is_draft_deleted", "topic__id", "topic__created_by_id")
+            .get(id=section_id)
+        )
     except TopicSection.DoesNotExist:
         raise HttpError(404, "Topic section not found")
 
@@ -474,7 +474,10 @@ def normalise_tools(tools: Sequence[str | Mapping[str, Any]]) -> list[Mapping[st
             normalised.append(dict(tool))
         elif isinstance(tool, str):
             identifier = tool.strip()
-            if identifier:
+            if identifier == "image_generation":
+                options = getattr(settings, "IMAGE_GENERATION_TOOL_OPTIONS", None) or {}
+                normalised.append({**options, "type": identifier})
+            elif identifier:
                 normalised.append({"type": identifier})
     return normalised
 
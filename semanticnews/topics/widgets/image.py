@@ -2,6 +2,7 @@ import base64
 import re
 import uuid
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from typing import Any, Dict, List
 
@@ -15,6 +16,9 @@ from .paragraph import _normalise_paragraphs
 
 THUMBNAIL_SIZE = (450, 300)
 
+_DATA_URL_HEADER_RE = re.compile(r"data:image/(?P<fmt>[A-Za-z0-9.+-]+);base64")
+_BASE64_RE = re.compile(r"[A-Za-z0-9+/=\n\r]+")
+
 
 class ImageSchema(BaseModel):
     prompt: str = ""
@@ -205,11 +209,14 @@ def _decode_image_bytes(value: str) -> tuple[bytes, str] | None:
         return None
 
     cleaned = value.strip()
-    data_match = re.match(r"data:image/(?P<fmt>[A-Za-z0-9.+-]+);base64,(?P<data>.+)", cleaned)
-
-    if data_match:
-        fmt = data_match.group("fmt") or "png"
-        encoded = data_match.group("data")
+    # Only the short header goes through the regex; the (often multi-megabyte)
+    # payload is split off without being scanned or captured.
+    header, separator, payload = cleaned.partition(",")
+    header_match = _DATA_URL_HEADER_RE.fullmatch(header) if separator else None
+
+    if header_match and payload:
+        fmt = header_match.group("fmt") or "png"
+        encoded = payload
     else:
         fmt = "png"
         encoded = cleaned
@@ -227,19 +234,22 @@ def _decode_image_bytes(value: str) -> tuple[bytes, str] | None:
 
 def _build_thumbnail(image_bytes: bytes, fmt: str) -> bytes | None:
     try:
-        with Image.open(BytesIO(image_bytes)) as img:
+        # BytesIO over an immutable ``bytes`` object shares its buffer, so the
+        # decoded payload is not copied; both buffers are released on exit.
+        with BytesIO(image_bytes) as source, Image.open(source) as img:
+            # Lets JPEG decode straight to a reduced scale (DCT scaling) instead
+            # of materialising the full-resolution bitmap; a no-op for other formats.
+            img.draft("RGB", (THUMBNAIL_SIZE[0] * 2, THUMBNAIL_SIZE[1] * 2))
             image = img.convert("RGB") if img.mode in {"RGBA", "P", "LA"} else img
             image.thumbnail(THUMBNAIL_SIZE)
-            buffer = BytesIO()
-            image.save(buffer, format=(fmt or "png").upper())
-            return buffer.getvalue()
+            with BytesIO() as buffer:
+                image.save(buffer, format=(fmt or "png").upper())
+                return buffer.getvalue()
     except (UnidentifiedImageError, OSError):
         return None
 
 
-def _build_storage_path(
-    *, filename: str, extension: str, context: Mapping[str, Any]
-) -> str:
+def _build_storage_dir(context: Mapping[str, Any]) -> str:
     topic, _ = _resolve_topic_and_section(context)
     user_id = getattr(topic, "created_by_id", None) or context.get("user_id") or "anonymous"
     topic_uuid = (
@@ -249,11 +259,20 @@ def _build_storage_path(
         or "unknown"
     )
 
-    safe_ext = extension.lstrip(".") or "png"
-    return f"topics/widgets/image/{user_id}/{topic_uuid}/{filename}.{safe_ext}"
+    return f"topics/widgets/image/{user_id}/{topic_uuid}"
+
+
+def _save_to_storage(path: str, data: bytes) -> str:
+    saved_path = default_storage.save(path, ContentFile(data))
+    return default_storage.url(saved_path)
 
 
-def _persist_image_value(image_value: str, *, context: Mapping[str, Any]) -> Dict[str, Any]:
+def _persist_image_value(
+    image_value: str,
+    *,
+    context: Mapping[str, Any],
+    decoded: tuple[bytes, str] | None = None,
+) -> Dict[str, Any]:
     persisted: Dict[str, Any] = {}
     if not image_value:
         return persisted
@@ -266,7 +285,8 @@ def _persist_image_value(image_value: str, *, context: Mapping[str, Any]) -> Dic
     if not image_value.lower().startswith("data:image/"):
         return persisted
 
-    decoded = _decode_image_bytes(image_value)
+    if decoded is None:
+        decoded = _decode_image_bytes(image_value)
     if decoded is None:
         return persisted
 
@@ -274,19 +294,26 @@ def _persist_image_value(image_value: str, *, context: Mapping[str, Any]) -> Dic
     filename_base = uuid.uuid4().hex
     extension = (fmt or "png").split("/")[-1].split("+")[0]
 
-    image_path = _build_storage_path(
-        filename=filename_base, extension=extension, context=context
-    )
-    saved_image_path = default_storage.save(image_path, ContentFile(raw_bytes))
-    persisted["image_url"] = default_storage.url(saved_image_path)
+    storage_dir = _build_storage_dir(context)
+    safe_ext = extension.lstrip(".") or "png"
+    uploads = {"image_url": (f"{storage_dir}/{filename_base}.{safe_ext}", raw_bytes)}
 
     thumb_bytes = _build_thumbnail(raw_bytes, fmt)
     if thumb_bytes:
-        thumb_path = _build_storage_path(
-            filename=f"{filename_base}_thumb", extension=extension, context=context
+        uploads["thumbnail_url"] = (
+            f"{storage_dir}/{filename_base}_thumb.{safe_ext}",
+            thumb_bytes,
         )
-        saved_thumb_path = default_storage.save(thumb_path, ContentFile(thumb_bytes))
-        persisted["thumbnail_url"] = default_storage.url(saved_thumb_path)
+
+    # Storage writes are network-bound on S3, so the image and its thumbnail
+    # are uploaded side by side rather than one after the other.
+    with ThreadPoolExecutor(max_workers=len(uploads)) as executor:
+        futures = {
+            key: executor.submit(_save_to_storage, path, data)
+            for key, (path, data) in uploads.items()
+        }
+    for key, future in futures.items():
+        persisted[key] = future.result()
 
     persisted["image_data"] = persisted.get("thumbnail_url") or persisted["image_url"]
     return persisted
@@ -304,10 +331,12 @@ def _build_image_content(
         content = {"result": response if response is not None else ""}
 
     image_source = _extract_image_source(raw_response) or _extract_image_source(response)
-    normalised_image = _normalise_image_value(image_source)
+    normalised_image, decoded_image = _normalise_image_value(image_source)
 
     persisted_image = (
-        _persist_image_value(normalised_image, context=context) if normalised_image else {}
+        _persist_image_value(normalised_image, context=context, decoded=decoded_image)
+        if normalised_image
+        else {}
     )
 
     for key, value in persisted_image.items():
@@ -366,32 +395,40 @@ def _extract_image_source(payload: Any) -> str | None:
     return None
 
 
-def _normalise_image_value(value: str | None) -> str | None:
+def _normalise_image_value(
+    value: str | None,
+) -> tuple[str | None, tuple[bytes, str] | None]:
+    """Return the usable image value and, for bare base64, its decoded bytes.
+
+    Bare base64 has to be decoded to be validated; the bytes are handed back so
+    that persisting the image does not decode the same payload a second time.
+    """
+
     if not value:
-        return None
+        return None, None
 
     cleaned_value = value.strip()
     if not cleaned_value:
-        return None
+        return None, None
 
     if cleaned_value.startswith(("http://", "https://")):
-        return cleaned_value
+        return cleaned_value, None
 
     if cleaned_value.lower().startswith("data:image/"):
-        return cleaned_value
+        return cleaned_value, None
 
     if " " in cleaned_value:
-        return None
+        return None, None
 
-    if not re.fullmatch(r"[A-Za-z0-9+/=\n\r]+", cleaned_value):
-        return None
+    if not _BASE64_RE.fullmatch(cleaned_value):
+        return None, None
 
     try:
         decoded = base64.b64decode(cleaned_value, validate=True)
     except Exception:
-        return None
+        return None, None
 
     if not decoded:
-        return None
+        return None, None
 
-    return f"data:image/png;base64,{cleaned_value}"
+    return f"data:image/png;base64,{cleaned_value}", (decoded, "png")
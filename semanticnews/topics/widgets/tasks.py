@@ -23,7 +23,7 @@ def execute_widget_action_task(
     from .helpers import execute_widget_action as run_widget_execution
 
     try:
-        topic = Topic.objects.get(uuid=topic_uuid)
+        topic = Topic.objects.defer("embedding").get(uuid=topic_uuid)
     except Topic.DoesNotExist:
         raise WidgetExecutionError("Topic not found")
 
@@ -12,4 +12,5 @@ class UserAdmin(BaseUserAdmin):
 @admin.register(UserBookmark)
 class UserBookmarkAdmin(admin.ModelAdmin):
     list_display = ('user', 'topic', 'created_at')
+    list_select_related = ('user', 'topic')
     search_fields = ('user__username', 'topic__title')
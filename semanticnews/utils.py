@@ -32,9 +32,7 @@ def is_json(text):
 
 
 def translate(to_translate_dict, from_to='tr_to_en', model='gpt-4o-mini'):
-    content = ''
-    for key in to_translate_dict.keys():
-        content += f'{key}: {to_translate_dict[key]}\n'
+    content = ''.join(f'{key}: {value}\n' for key, value in to_translate_dict.items())
 
     messages = [{
         'role': 'system',
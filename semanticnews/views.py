@@ -1,11 +1,35 @@
+import hashlib
+
+from django.core.cache import cache
 from django.shortcuts import render
-from django.db.models import Prefetch
 from pgvector.django import L2Distance
 
 from .agenda.models import Event
 from .topics.models import Topic
 from .openai import OpenAI
 
+# Embeddings are deterministic for a given query, so repeated searches reuse them.
+SEARCH_EMBEDDING_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _get_query_embedding(query):
+    key = f"search:embedding:{hashlib.sha1(query.encode('utf-8')).hexdigest()}"
+    embedding = cache.get(key)
+    if embedding is not None:
+        return embedding
+
+    with OpenAI() as client:
+        embedding = (
+            client.embeddings.create(
+                model="text-embedding-3-small",
+                input=query,
+            )
+            .data[0]
+            .embedding
+        )
+    cache.set(key, embedding, SEARCH_EMBEDDING_CACHE_TIMEOUT)
+    return embedding
+
 
 def home(request):
     recent_events = Event.objects.filter(status='published').order_by('-date')[:5]
@@ -17,7 +41,7 @@ def home(request):
         ),
     }
     if request.user.is_authenticated:
-        context['user_topics'] = Topic.objects.filter(created_by=request.user)
+        context['user_topics'] = Topic.objects.filter(created_by=request.user).defer('embedding')
     return render(request, 'home.html', context)
 
 
@@ -29,15 +53,7 @@ def search_results(request):
     events = Event.objects.none()
 
     if query:
-        with OpenAI() as client:
-            embedding = (
-                client.embeddings.create(
-                    model="text-embedding-3-small",
-                    input=query,
-                )
-                .data[0]
-                .embedding
-            )
+        embedding = _get_query_embedding(query)
 
         topics = (
             Topic.objects.filter(status="published")
@@ -60,6 +76,6 @@ def search_results(request):
         "events": events,
     }
     if request.user.is_authenticated:
-        context["user_topics"] = Topic.objects.filter(created_by=request.user)
+        context["user_topics"] = Topic.objects.filter(created_by=request.user).defer("embedding")
 
     return render(request, "search_results.html", context)